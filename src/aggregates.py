@@ -0,0 +1,692 @@
+# src/aggregates.py
+
+"""Small summaries of a filtered selection that KPI cards and charts consume."""
+
+from __future__ import annotations
+
+import math
+import os
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.filters import FILTER_SQL_WHERE, FilterSpec
+from src.kpis import compute_kpi_bundle
+
+HOURS_CATEGORIES = ["Meetings", "Collaboration", "Deep work", "Manual work"]
+
+# Most employees the productivity scatter draws as individual points; larger
+# selections are sampled within each AI usage band.
+SCATTER_POINT_BUDGET = int(os.getenv("BURNOUT_SCATTER_POINTS", "5000"))
+
+# Above this many employees the scatter becomes a binned density layer.
+SCATTER_DENSITY_ROWS = int(os.getenv("BURNOUT_SCATTER_DENSITY_ROWS", "100000"))
+
+# (x, y) columns binned on the server for the AI usage vs burnout heatmap
+# and for the productivity scatter's density layer.
+BINNED_GRIDS: dict[str, tuple[str, str]] = {
+    "ai_usage": ("ai_tool_usage_hours_per_week", "burnout_risk_score"),
+    "scatter": ("productivity_score", "burnout_risk_score"),
+}
+
+# Columns of each employee the productivity scatter draws.
+SCATTER_COLUMNS = ["job_role", "ai_band", "productivity_score", "burnout_risk_score"]
+
+# Columns summarize_row_level reads for the row-level charts (the AI usage
+# heatmap and the productivity scatter); everything else is aggregated.
+ROW_LEVEL_COLUMNS = [
+    "job_role",
+    "ai_band",
+    "ai_tool_usage_hours_per_week",
+    "productivity_score",
+    "burnout_risk_score",
+]
+
+# Columns summarize_dashboard reads to compute the KPI values and the
+# role/hours chart aggregates.
+SUMMARY_COLUMNS = [
+    "job_role",
+    "productivity_score",
+    "burnout_risk_score",
+    "work_life_balance_score",
+    "burnout_risk_level",
+    "meeting_hours_per_week",
+    "collaboration_hours_per_week",
+    "focus_hours_per_day",
+    "manual_work_hours_per_week",
+]
+
+
+def summarize_burnout_by_role(d: pd.DataFrame) -> pd.DataFrame:
+    """
+    Average burnout risk score per job role.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Filtered dashboard dataframe.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Columns ``job_role`` and ``avg_burnout``, sorted by ``avg_burnout``
+        descending. Roles with no rows are left out.
+    """
+    return (
+        d.groupby("job_role", as_index=False, observed=True)["burnout_risk_score"]
+        .mean()
+        .rename(columns={"burnout_risk_score": "avg_burnout"})
+        .sort_values("avg_burnout", ascending=False)
+    )
+
+
+def summarize_hours_breakdown(d: pd.DataFrame) -> pd.DataFrame:
+    """
+    Average weekly hours per activity category.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Filtered dashboard dataframe.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Columns ``category`` and ``hours`` with one row per entry of
+        ``HOURS_CATEGORIES``. Deep work is ``focus_hours_per_day`` over a
+        five-day week.
+    """
+    return pd.DataFrame(
+        {
+            "category": HOURS_CATEGORIES,
+            "hours": [
+                float(d["meeting_hours_per_week"].mean()),
+                float(d["collaboration_hours_per_week"].mean()),
+                float((d["focus_hours_per_day"] * 5.0).mean()),
+                float(d["manual_work_hours_per_week"].mean()),
+            ],
+        }
+    )
+
+
+def nice_bin_edges(lo: float, hi: float, maxbins: int = 30) -> np.ndarray:
+    """
+    Evenly spaced bin edges on round numbers, as Vega-Lite's ``bin`` picks them.
+
+    Parameters
+    ----------
+    lo, hi : float
+        Smallest and largest value to cover.
+    maxbins : int, default=30
+        Upper bound on the number of bins.
+
+    Returns
+    -------
+    numpy.ndarray
+        Edges from a multiple of the step at or below ``lo`` to one at or
+        above ``hi``. The step is a power of ten, or half or a fifth of
+        one, and is the smallest giving at most ``maxbins`` bins.
+    """
+    span = hi - lo
+    if span <= 0:
+        span = abs(lo) or 1.0
+    step = 10.0 ** (round(math.log10(span)) - math.ceil(math.log10(maxbins)))
+    while math.ceil(span / step) > maxbins:
+        step *= 10
+    for divisor in (5, 2):
+        if span / (step / divisor) <= maxbins:
+            step /= divisor
+
+    start = math.floor(lo / step) * step
+    stop = math.ceil(hi / step) * step
+    if stop <= start:
+        stop = start + step
+    edges = start + step * np.arange(round((stop - start) / step) + 1)
+    # Snap to the step's decimals so edges print as 6.1, not 6.1000000000000005.
+    return edges.round(max(0, 1 - math.floor(math.log10(step))))
+
+
+def summarize_binned_counts(
+    d: pd.DataFrame,
+    x: str,
+    y: str,
+    maxbins: int = 30,
+) -> pd.DataFrame:
+    """
+    Employee counts on a 2D grid of ``x`` and ``y`` bins.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Filtered dashboard dataframe.
+    x, y : str
+        Numeric columns to bin.
+    maxbins : int, default=30
+        Upper bound on the number of bins along each axis; see
+        :func:`nice_bin_edges`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per non-empty bin: its lower edges under the ``x`` and
+        ``y`` names, upper edges under ``{x}_end`` and ``{y}_end``, and
+        ``count``. Rows missing either value are left out. Bins are
+        half-open except the last along each axis, which includes its
+        upper edge.
+    """
+    xs = d[x].to_numpy(dtype=np.float64, na_value=np.nan)
+    ys = d[y].to_numpy(dtype=np.float64, na_value=np.nan)
+    keep = ~(np.isnan(xs) | np.isnan(ys))
+    xs, ys = xs[keep], ys[keep]
+    if len(xs) == 0:
+        return pd.DataFrame(columns=[x, f"{x}_end", y, f"{y}_end", "count"])
+
+    x_edges = nice_bin_edges(xs.min(), xs.max(), maxbins)
+    y_edges = nice_bin_edges(ys.min(), ys.max(), maxbins)
+    counts, _, _ = np.histogram2d(xs, ys, bins=[x_edges, y_edges])
+    ix, iy = np.nonzero(counts)
+    return _bin_frame(x, y, x_edges, y_edges, ix, iy, counts[ix, iy])
+
+
+def _bin_frame(
+    x: str,
+    y: str,
+    x_edges: np.ndarray,
+    y_edges: np.ndarray,
+    ix: np.ndarray,
+    iy: np.ndarray,
+    counts: np.ndarray,
+) -> pd.DataFrame:
+    """Edges and counts of the non-empty bins ``(ix, iy)``."""
+    return pd.DataFrame(
+        {
+            x: x_edges[ix],
+            f"{x}_end": x_edges[ix + 1],
+            y: y_edges[iy],
+            f"{y}_end": y_edges[iy + 1],
+            "count": np.asarray(counts).astype(np.int64),
+        }
+    )
+
+
+def stratified_sample(
+    d: pd.DataFrame,
+    by: str,
+    n: int,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Sample ``n`` rows while keeping the share of each ``by`` value.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Filtered dashboard dataframe.
+    by : str
+        Column defining the strata, e.g. ``"ai_band"``. Missing values
+        form a stratum of their own.
+    n : int
+        Number of rows to keep.
+    seed : int, default=0
+        Seed of the per-row random keys, so the same selection always
+        gives the same sample.
+
+    Returns
+    -------
+    pandas.DataFrame
+        ``d`` itself when it has at most ``n`` rows; otherwise ``n`` rows
+        in their original order. Each stratum gets its proportional share,
+        rounded by largest remainder.
+    """
+    if len(d) <= n:
+        return d
+
+    codes, _ = pd.factorize(d[by], use_na_sentinel=False)
+    sizes = np.bincount(codes)
+    exact = sizes * (n / len(d))
+    quotas = np.floor(exact).astype(np.int64)
+    short = n - int(quotas.sum())
+    quotas[np.argsort(quotas - exact, kind="stable")[:short]] += 1
+
+    # Order rows by stratum, randomly within each, and keep each stratum's
+    # first ``quota`` rows.
+    order = np.lexsort((np.random.default_rng(seed).random(len(d)), codes))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    sorted_codes = codes[order]
+    within = np.arange(len(d)) - starts[sorted_codes]
+    keep = order[within < quotas[sorted_codes]]
+    return d.iloc[np.sort(keep)]
+
+
+def summarize_scatter(
+    d: pd.DataFrame,
+    max_points: int = SCATTER_POINT_BUDGET,
+    density_above: int = SCATTER_DENSITY_ROWS,
+) -> dict[str, Any] | None:
+    """
+    What the productivity vs burnout scatter draws for a selection.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Filtered dashboard dataframe.
+    max_points : int, default=SCATTER_POINT_BUDGET
+        Most employees drawn as points. Larger selections are sampled
+        within each AI usage band, so band proportions are preserved.
+    density_above : int, default=SCATTER_DENSITY_ROWS
+        Above this many employees, density bins replace the points.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        ``row_count``; ``points``, the ``SCATTER_COLUMNS`` of the drawn
+        employees (None when binned); ``bins``, the
+        :func:`summarize_binned_counts` of the ``"scatter"`` grid (None when
+        drawn as points). None for an empty selection.
+    """
+    if d.empty:
+        return None
+
+    n = len(d)
+    if n > density_above:
+        bins = summarize_binned_counts(d, *BINNED_GRIDS["scatter"])
+        return {"row_count": n, "points": None, "bins": bins}
+    points = stratified_sample(d[SCATTER_COLUMNS], "ai_band", max_points)
+    return {"row_count": n, "points": points, "bins": None}
+
+
+def summarize_row_level(
+    d: pd.DataFrame,
+    max_points: int = SCATTER_POINT_BUDGET,
+    density_above: int = SCATTER_DENSITY_ROWS,
+) -> dict[str, Any]:
+    """
+    Inputs of the charts drawn from individual rows rather than KPI aggregates.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Filtered dashboard dataframe; only ``ROW_LEVEL_COLUMNS`` are read.
+    max_points, density_above : int
+        Scatter limits; see :func:`summarize_scatter`.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``ai_usage_bins``, the :func:`summarize_binned_counts` of the
+        ``"ai_usage"`` grid, and ``scatter`` as returned by
+        :func:`summarize_scatter`; both None when ``d`` is empty. Their
+        size is bounded by the bin grids and ``max_points``, not by the
+        selection.
+    """
+    if d.empty:
+        return {"ai_usage_bins": None, "scatter": None}
+    return {
+        "ai_usage_bins": summarize_binned_counts(d, *BINNED_GRIDS["ai_usage"]),
+        "scatter": summarize_scatter(d, max_points, density_above),
+    }
+
+
+def summarize_dashboard(d: pd.DataFrame) -> dict[str, Any]:
+    """
+    Compute every KPI value and chart aggregate the dashboard shows.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Filtered dashboard dataframe.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``row_count``; ``median_productivity``, ``median_burnout`` and
+        ``median_wlb`` (None when undefined); ``high_burnout_share`` (None
+        when ``d`` is empty); ``burnout_by_role`` and ``hours_breakdown``
+        as returned by :func:`summarize_burnout_by_role` and
+        :func:`summarize_hours_breakdown` (None when ``d`` is empty).
+    """
+    if d.empty:
+        return {
+            "row_count": 0,
+            "median_productivity": None,
+            "median_burnout": None,
+            "median_wlb": None,
+            "high_burnout_share": None,
+            "burnout_by_role": None,
+            "hours_breakdown": None,
+        }
+
+    kpis = compute_kpi_bundle(d)
+    return {
+        "row_count": kpis.row_count,
+        "median_productivity": kpis.median_productivity,
+        "median_burnout": kpis.median_burnout,
+        "median_wlb": kpis.median_wlb,
+        "high_burnout_share": kpis.high_burnout_share,
+        "burnout_by_role": summarize_burnout_by_role(d),
+        "hours_breakdown": summarize_hours_breakdown(d),
+    }
+
+
+def dashboard_summary_sql(table_name: str = "ai_productivity") -> str:
+    """
+    SQL computing every dashboard aggregate for one filter state.
+
+    Parameters
+    ----------
+    table_name : str, default="ai_productivity"
+        Registered table or view holding the dataset.
+
+    Returns
+    -------
+    str
+        Query returning a single row, bound with
+        :meth:`~src.filters.FilterSpec.sql_params`. Role means come back as
+        a list of structs, so the whole summary is one round trip.
+
+    Notes
+    -----
+    Metrics are cast to DOUBLE before aggregating so results match pandas
+    on the float64 values the compact float32 columns represent. The row
+    also holds the value range of each of ``BINNED_GRIDS``, from which
+    :func:`grid_edges` derives the bin edges of :func:`binned_counts_sql`.
+    """
+    ranges = ",\n    ".join(
+        f"{fn}(CAST({column} AS DOUBLE)) FILTER (WHERE {x} IS NOT NULL AND {y} IS NOT NULL)"
+        f" AS {grid}_{axis}_{fn}"
+        for grid, (x, y) in BINNED_GRIDS.items()
+        for axis, column in (("x", x), ("y", y))
+        for fn in ("min", "max")
+    )
+    return f"""
+WITH filtered AS (
+    SELECT * FROM {table_name} WHERE {FILTER_SQL_WHERE}
+),
+roles AS (
+    SELECT
+        CAST(job_role AS VARCHAR) AS job_role,
+        avg(CAST(burnout_risk_score AS DOUBLE)) AS avg_burnout
+    FROM filtered
+    WHERE job_role IS NOT NULL
+    GROUP BY 1
+)
+SELECT
+    count(*) AS row_count,
+    median(CAST(productivity_score AS DOUBLE)) AS median_productivity,
+    median(CAST(burnout_risk_score AS DOUBLE)) AS median_burnout,
+    median(CAST(work_life_balance_score AS DOUBLE)) AS median_wlb,
+    avg(CASE WHEN CAST(burnout_risk_level AS VARCHAR) = 'High' THEN 1.0 ELSE 0.0 END)
+        AS high_burnout_share,
+    avg(CAST(meeting_hours_per_week AS DOUBLE)) AS meetings,
+    avg(CAST(collaboration_hours_per_week AS DOUBLE)) AS collaboration,
+    avg(CAST(focus_hours_per_day AS DOUBLE) * 5.0) AS deep_work,
+    avg(CAST(manual_work_hours_per_week AS DOUBLE)) AS manual_work,
+    {ranges},
+    (
+        SELECT list({{'job_role': job_role, 'avg_burnout': avg_burnout}}
+                    ORDER BY avg_burnout DESC)
+        FROM roles
+    ) AS burnout_by_role
+FROM filtered
+"""
+
+
+def summarize_dashboard_sql(
+    con,
+    spec: FilterSpec,
+    table_name: str = "ai_productivity",
+) -> dict[str, Any]:
+    """
+    Compute the dashboard summary inside DuckDB in one query.
+
+    Parameters
+    ----------
+    con : duckdb.DuckDBPyConnection
+        Connection on which ``table_name`` is registered.
+    spec : FilterSpec
+        Filters to apply.
+    table_name : str, default="ai_productivity"
+        Table or view holding the dataset.
+
+    Returns
+    -------
+    dict[str, Any]
+        Same keys and shapes as :func:`summarize_dashboard`. Only one row
+        of aggregates is transferred, whatever the number of employees.
+    """
+    cursor = con.execute(dashboard_summary_sql(table_name), spec.sql_params())
+    names = [col[0] for col in cursor.description]
+    row = dict(zip(names, cursor.fetchone()))
+    return summary_from_row(row)
+
+
+def summary_from_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Reshape one row of :func:`dashboard_summary_sql` into the summary dict."""
+    if not row["row_count"]:
+        return summarize_dashboard(pd.DataFrame())
+
+    burnout_by_role = pd.DataFrame(
+        row["burnout_by_role"] or [], columns=["job_role", "avg_burnout"]
+    )
+    hours_breakdown = pd.DataFrame(
+        {
+            "category": HOURS_CATEGORIES,
+            "hours": [
+                row["meetings"],
+                row["collaboration"],
+                row["deep_work"],
+                row["manual_work"],
+            ],
+        }
+    )
+    return {
+        "row_count": int(row["row_count"]),
+        "median_productivity": row["median_productivity"],
+        "median_burnout": row["median_burnout"],
+        "median_wlb": row["median_wlb"],
+        "high_burnout_share": float(row["high_burnout_share"]),
+        "burnout_by_role": burnout_by_role,
+        "hours_breakdown": hours_breakdown,
+    }
+
+
+# Positional parameters FILTER_SQL_WHERE takes; statements with further
+# parameters number them from here on.
+FILTER_PARAM_COUNT = len(FilterSpec().sql_params())
+
+
+def grid_edges(
+    row: dict[str, Any],
+    grid: str,
+    maxbins: int = 30,
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Bin edges of one of ``BINNED_GRIDS`` from a :func:`dashboard_summary_sql` row.
+
+    Parameters
+    ----------
+    row : dict[str, Any]
+        Summary row holding the grid's value ranges.
+    grid : str
+        Key of ``BINNED_GRIDS``.
+    maxbins : int, default=30
+        Upper bound on the number of bins along each axis.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray] | None
+        x and y edges, the same :func:`summarize_binned_counts` picks for
+        the selection; None if no row has both values.
+    """
+    if row[f"{grid}_x_min"] is None or row[f"{grid}_y_min"] is None:
+        return None
+    return (
+        nice_bin_edges(row[f"{grid}_x_min"], row[f"{grid}_x_max"], maxbins),
+        nice_bin_edges(row[f"{grid}_y_min"], row[f"{grid}_y_max"], maxbins),
+    )
+
+
+def _bin_index_sql(column: str, edges: str) -> tuple[str, str]:
+    """Guessed and exact 0-based bin index of ``column`` over the ``edges`` list."""
+    last = f"len({edges}) - 2"
+    guess = (
+        f"least(greatest(CAST(floor((CAST({column} AS DOUBLE) - {edges}[1])"
+        f" / ({edges}[2] - {edges}[1])) AS BIGINT), 0), {last})"
+    )
+    # The uniform-step guess is off by at most one bin at an edge; compare
+    # against the edges themselves so values land where np.histogram2d puts
+    # them, the last bin including its upper edge.
+    exact = (
+        f"g_{column} - CAST({column} < {edges}[g_{column} + 1] AS BIGINT)"
+        f" + CAST(g_{column} < {last} AND {column} >= {edges}[g_{column} + 2] AS BIGINT)"
+    )
+    return guess, exact
+
+
+def binned_counts_sql(x: str, y: str, table_name: str = "ai_productivity") -> str:
+    """
+    SQL counting the filtered employees per 2D bin inside DuckDB.
+
+    Parameters
+    ----------
+    x, y : str
+        Numeric columns to bin.
+    table_name : str, default="ai_productivity"
+        Registered table or view holding the dataset.
+
+    Returns
+    -------
+    str
+        Query bound with :meth:`~src.filters.FilterSpec.sql_params`
+        followed by the x and y edges (lists of DOUBLE, e.g. from
+        :func:`grid_edges`). Returns the 0-based bin indexes ``ix``, ``iy``
+        and the ``count`` of each non-empty bin, which
+        :func:`bins_from_counts` turns into the
+        :func:`summarize_binned_counts` frame.
+    """
+    x_edges = f"CAST(${FILTER_PARAM_COUNT + 1} AS DOUBLE[])"
+    y_edges = f"CAST(${FILTER_PARAM_COUNT + 2} AS DOUBLE[])"
+    x_guess, x_index = _bin_index_sql(x, x_edges)
+    y_guess, y_index = _bin_index_sql(y, y_edges)
+    return f"""
+WITH guessed AS (
+    SELECT
+        CAST({x} AS DOUBLE) AS {x},
+        CAST({y} AS DOUBLE) AS {y},
+        {x_guess} AS g_{x},
+        {y_guess} AS g_{y}
+    FROM {table_name}
+    WHERE {FILTER_SQL_WHERE}
+      AND {x} IS NOT NULL AND {y} IS NOT NULL
+)
+SELECT
+    {x_index} AS ix,
+    {y_index} AS iy,
+    count(*) AS count
+FROM guessed
+GROUP BY ix, iy
+ORDER BY ix, iy
+"""
+
+
+def bins_from_counts(
+    cells: pd.DataFrame,
+    x: str,
+    y: str,
+    edges: tuple[np.ndarray, np.ndarray] | None,
+) -> pd.DataFrame:
+    """
+    Reshape the result of :func:`binned_counts_sql` into bin edges and counts.
+
+    Parameters
+    ----------
+    cells : pandas.DataFrame
+        ``ix``, ``iy`` and ``count`` per non-empty bin.
+    x, y : str
+        Binned columns.
+    edges : tuple[numpy.ndarray, numpy.ndarray] | None
+        The edges the query was bound with; None for no values.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Same columns as :func:`summarize_binned_counts`.
+    """
+    if edges is None or cells.empty:
+        return pd.DataFrame(columns=[x, f"{x}_end", y, f"{y}_end", "count"])
+    x_edges, y_edges = edges
+    return _bin_frame(
+        x,
+        y,
+        x_edges,
+        y_edges,
+        cells["ix"].to_numpy(np.int64),
+        cells["iy"].to_numpy(np.int64),
+        cells["count"].to_numpy(),
+    )
+
+
+def scatter_sample_sql(table_name: str = "ai_productivity") -> str:
+    """
+    SQL drawing the scatter's band-stratified sample inside DuckDB.
+
+    Parameters
+    ----------
+    table_name : str, default="ai_productivity"
+        Registered table or view holding the dataset.
+
+    Returns
+    -------
+    str
+        Query bound with :meth:`~src.filters.FilterSpec.sql_params`
+        followed by the sample size. Returns the ``SCATTER_COLUMNS`` of that
+        many filtered employees; like :func:`stratified_sample`, each AI
+        usage band gets its share rounded by largest remainder, drawn at
+        random.
+
+    Notes
+    -----
+    Only rows whose random key falls below about twice their band's share
+    are ranked, so the sort touches a few thousand rows rather than the
+    whole selection. A band ends up short of its quota only if it keeps
+    fewer than half the expected candidates, many standard deviations out.
+    """
+    size = f"CAST(${FILTER_PARAM_COUNT + 1} AS BIGINT)"
+    columns = ", ".join(SCATTER_COLUMNS)
+    return f"""
+WITH filtered AS (
+    SELECT {columns}, random() AS draw_key
+    FROM {table_name}
+    WHERE {FILTER_SQL_WHERE}
+),
+shares AS (
+    SELECT
+        ai_band,
+        count(*) AS band_size,
+        CAST(count(*) AS DOUBLE) * {size} / sum(count(*)) OVER () AS share
+    FROM filtered
+    GROUP BY ai_band
+),
+quotas AS (
+    SELECT
+        ai_band,
+        band_size,
+        floor(share) + CAST(
+            row_number() OVER (ORDER BY share - floor(share) DESC, ai_band)
+                <= {size} - sum(floor(share)) OVER ()
+            AS BIGINT
+        ) AS quota
+    FROM shares
+),
+ranked AS (
+    SELECT
+        filtered.*,
+        quota,
+        row_number() OVER (PARTITION BY filtered.ai_band ORDER BY draw_key) AS draw
+    FROM filtered
+    JOIN quotas ON filtered.ai_band IS NOT DISTINCT FROM quotas.ai_band
+    WHERE draw_key < (2 * quota + 20) / band_size
+)
+SELECT {columns} FROM ranked WHERE draw <= quota
+"""
@@ -3,79 +3,52 @@
 
 from shiny import App, ui, render, reactive
 from shiny.render import DataGrid
-from shinywidgets import output_widget, render_altair
-import ibis
-from ibis import _
-import re
 import pandas as pd
+from starlette.responses import JSONResponse
+from starlette.routing import Route
 
-from src.constants.paths import FEATURES_PATH, TARGETS_PATH
-from src.constants.paths import PARQUET_PATH 
-from src.constants.theme import (
-    COLORS,
-    deadline_scale,
-    ai_band_scale,
-)
+from src.constants.theme import COLORS
 from pathlib import Path
 from dotenv import load_dotenv
-from querychat import QueryChat
-from chatlas import ChatAnthropic
 import os
-from src.data import (
-    load_dashboard_data,
-    get_baselines,
-    get_filter_choices,
-    get_slider_ranges,
-)
-from src.filters import apply_dashboard_filters, normalize_querychat_result
+from src.data import with_readable_ids, with_source_precision
+from src.filters import FilteredView, FilterSpec
+from src.indexes import IncrementalFilter
+from src.result_cache import FilterResult
 from src.kpis import (
-    count_card,
-    high_burnout_pct_card,
-    kpi_card,
-    median_metric_card,
-)
-from src.charts import (
-    make_ai_vs_burnout_chart,
-    make_burnout_by_role_chart,
-    make_hours_breakdown_chart,
-    make_productivity_vs_burnout_chart,
+    compute_kpi_bundle,
+    high_burnout_share_card,
+    median_value_card,
+    row_count_card,
 )
+from src.resources import FILTER_ENGINE, MEDIAN_MODE, dashboard_resources
 from src.utils.debug import format_filter_debug
+from src.utils.lazy import Lazy
 
 
 load_dotenv()
 anthropic_key = os.getenv("ANTHROPIC_API_KEY")
 
-# Load and preprocess data
-con = ibis.duckdb.connect()
-table = con.read_parquet(PARQUET_PATH)
-
-df = load_dashboard_data()  # still load in full dataframe used for baselines and querychat
-default_ai_preview_df = df.head(100).copy()
-
-# Input variables' options for filters
-filter_choices = get_filter_choices(df)
-job_role_choices = filter_choices["job_role_choices"]
-ai_band_choices = filter_choices["ai_band_choices"]
-deadline_choices = filter_choices["deadline_choices"]
-
-# Slider ranges for numeric filters - experience, ai usage hours, manual hours, tasks automated
-slider_ranges = get_slider_ranges(df)
-exp_min, exp_max = slider_ranges["experience"]
-ai_min, ai_max = slider_ranges["ai_usage"]
-man_min, man_max = slider_ranges["manual_hours"]
-task_min, task_max = slider_ranges["tasks_automated"]
-
-# Company-wide baselines (computed once, used across outputs)
-baselines = get_baselines(df)
-BASELINE_MEDIAN_BURNOUT = baselines["median_burnout"]
-BASELINE_MEDIAN_PRODUCTIVITY = baselines["median_productivity"]
-BASELINE_MEDIAN_WLB = baselines["median_wlb"]
-BASELINE_HIGH_BURNOUT = baselines["high_burnout_rate"]
+# Data, baselines and filter choices are built on first use (first page
+# request or session) rather than at import, so the process starts serving
+# health checks immediately. Set BURNOUT_WARMUP=0 to skip building them in the
+# background right after startup. The QueryChat objects are built when the
+# AI Explorer tab is first shown; BURNOUT_WARMUP_AI=1 builds them during the
+# warm-up as well.
+#
+# For the same reason the plotting (altair, shinywidgets), SQL (ibis) and AI
+# Explorer (querychat, chatlas) stacks are imported inside the functions that
+# use them. Keep new heavy imports out of module level; tests/test_import_budget.py
+# fails if one of src.utils.import_budget.DEFERRED_PACKAGES is loaded eagerly.
+WARMUP_ENABLED = os.getenv("BURNOUT_WARMUP", "1") != "0"
+WARMUP_AI_ENABLED = os.getenv("BURNOUT_WARMUP_AI", "0") == "1"
 
 # -------------------------
 # QueryChat setup for AI Explorer
 # -------------------------
+# Table name the AI Explorer's generated SQL queries.
+QUERYCHAT_TABLE = "AIUsageBurnoutCheckup"
+
 ai_greeting = """
 👋 Hi! I'm your AI burnout explorer.
 
@@ -164,315 +137,397 @@ def block_broad_tool_request(req):
     if should_block:
         raise Exception(reason)
     
-llm_client = ChatAnthropic(model="claude-sonnet-4-0")
-llm_client.on_tool_request(block_broad_tool_request)
-
 # --------------------------------------
 # Make QueryChat for each response style
 # --------------------------------------
-def make_querychat(style_key: str, module_id: str):
+def make_querychat(data, client, style_key: str, module_id: str):
+    from querychat import QueryChat
+
+    # Pandas copy-on-write lets every QueryChat share ``data`` instead of
+    # holding its own copy; an ibis table stays in DuckDB.
     return QueryChat(
-        df.copy(),
-        "AIUsageBurnoutCheckup",
+        data,
+        QUERYCHAT_TABLE,
         id=module_id,
         greeting=ai_greeting,
         prompt_template=Path(__file__).parent / "prompts" / "system_prompt.md",
         extra_instructions=STYLE_INSTRUCTIONS[style_key],
-        client=llm_client,
+        client=client,
     )
 
-qc_executive = make_querychat("executive", "qc_executive")
-qc_analytical = make_querychat("analytical", "qc_analytical")
-qc_technical = make_querychat("technical", "qc_technical")
+
+def build_querychats() -> dict:
+    """Create the LLM client and one QueryChat per response style."""
+    from chatlas import ChatAnthropic
+
+    from src.duckdb_store import create_source_precision_view
+
+    llm_client = ChatAnthropic(model="claude-sonnet-4-0")
+    llm_client.on_tool_request(block_broad_tool_request)
+
+    # One float64 copy of the float columns, rounded to the source's
+    # decimals, shared by every QueryChat; the LLM would otherwise see
+    # float32 noise in the schema and in query results. Without an
+    # in-process frame, a DuckDB view rounds them instead.
+    res = dashboard_resources.get()
+    if res.df is not None:
+        data = with_source_precision(res.df)
+    else:
+        create_source_precision_view(res.con, QUERYCHAT_TABLE)
+        data = res.table.get_backend().table(QUERYCHAT_TABLE)
+    return {
+        style: make_querychat(data, llm_client, style, f"qc_{style}")
+        for style in STYLE_INSTRUCTIONS
+    }
+
+
+querychats: Lazy[dict] = Lazy(build_querychats, name="QueryChat")
+
+
+def import_chart_stack() -> None:
+    """Import the plotting libraries used by the dashboard charts."""
+    import shinywidgets  # noqa: F401
+
+    import src.charts  # noqa: F401
+
+
+chart_stack: Lazy[None] = Lazy(import_chart_stack, name="chart stack")
 
 # -------------------------
 # UI
 # -------------------------
-app_ui = ui.page_fluid(
-    # -------------------------
-    # Global CSS and font setup
-    # -------------------------
-    ui.include_css(Path(__file__).parent / "www" / "styles.css"),
-    ui.tags.style(
-        f"""
-        .bslib-sidebar-layout > .sidebar > .sidebar-content {{
-            gap: 0 !important;
-        }}
+def app_ui(request):
+    from shinywidgets import output_widget
+
+    res = dashboard_resources.get()
+
+    # Input variables' options for filters
+    job_role_choices = res.filter_choices["job_role_choices"]
+    ai_band_choices = res.filter_choices["ai_band_choices"]
+    deadline_choices = res.filter_choices["deadline_choices"]
+
+    # Slider ranges for numeric filters - experience, ai usage hours, manual hours, tasks automated
+    exp_min, exp_max = res.slider_ranges["experience"]
+    ai_min, ai_max = res.slider_ranges["ai_usage"]
+    man_min, man_max = res.slider_ranges["manual_hours"]
+    task_min, task_max = res.slider_ranges["tasks_automated"]
+
+    return ui.page_fluid(
+        # -------------------------
+        # Global CSS and font setup
+        # -------------------------
+        ui.include_css(Path(__file__).parent / "www" / "styles.css"),
+        ui.tags.style(
+            f"""
+            .bslib-sidebar-layout > .sidebar > .sidebar-content {{
+                gap: 0 !important;
+            }}
         
-        .kpi-grid {{
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 1rem;
-        }}
-
-        .kpi-card {{
-            background: {COLORS["card_bg"]};
-            border-radius: 12px;
-            padding: 16px 18px;
-            box-shadow: 0 2px 0 rgba(90,45,12,0.25);
-            min-height: 200px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        }}
-
-        .kpi-title {{
-            font-size: 18px;
-            font-weight: 700;
-            color: {COLORS["dark_brown"]};
-            margin-bottom: 6px;
-        }}
+            .kpi-grid {{
+                display: grid;
+                grid-template-columns: repeat(4, 1fr);
+                gap: 1rem;
+            }}
+
+            .kpi-card {{
+                background: {COLORS["card_bg"]};
+                border-radius: 12px;
+                padding: 16px 18px;
+                box-shadow: 0 2px 0 rgba(90,45,12,0.25);
+                min-height: 200px;
+                display: flex;
+                flex-direction: column;
+                justify-content: space-between;
+            }}
+
+            .kpi-title {{
+                font-size: 18px;
+                font-weight: 700;
+                color: {COLORS["dark_brown"]};
+                margin-bottom: 6px;
+            }}
         
-        .kpi-note {{
-            font-size: 12px;
-            color: {COLORS["medium_brown"]};
-            line-height: 1.3;
-            margin-bottom: 8px;
-        }}
+            .kpi-note {{
+                font-size: 12px;
+                color: {COLORS["medium_brown"]};
+                line-height: 1.3;
+                margin-bottom: 8px;
+            }}
         
-        .kpi-value {{
-            font-size: 56px;
-            line-height: 1;
-            font-weight: 800;
-            color: {COLORS["dark_brown"]};
-        }}
-
-        .kpi-sub {{
-            min-height: 20px;
-            margin-top: 6px;
-            font-size: 14px;
-            font-weight: 700;
-        }}
-
-        .kpi-sub.up {{
-            color: {COLORS["alert_red"]};
-        }}
-
-        .kpi-sub.down {{
-            color: {COLORS["medium_brown"]};
-        }}    
-    """
-    ),
-    ui.tags.head(
-        ui.tags.link(
-            rel="stylesheet",
-            href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap",
-        )
-    ),
-    # -------------------------
-    # Main app navigation tabs
-    # -------------------------
-    ui.navset_tab(
-        # ==================================================
-        # Dashboard tab
-        # ==================================================
-        ui.nav_panel(
-            "Dashboard",
-            ui.layout_sidebar(
-                # -------------------------
-                # Dashboard sidebar filters
-                # -------------------------
-                ui.sidebar(
-                    ui.h3("AI Usage &\nBurnout Checkup"),
-                    ui.hr(),
-                    ui.h6("Job Role:"),
-                    ui.input_selectize(
-                        "job_role",
-                        None,
-                        choices=job_role_choices,
-                        selected=["Manager"],
-                        multiple=True,
-                    ),
-                    ui.br(),
-                    ui.h6("AI Usage Band:"),
-                    ui.input_selectize(
-                        "ai_band",
-                        None,
-                        choices=ai_band_choices,
-                        selected=["All"],
-                        multiple=True,
-                    ),
-                    ui.br(),
-                    ui.h6("Experience (years):"),
-                    ui.input_slider(
-                        "experience",
-                        None,
-                        min=exp_min,
-                        max=exp_max,
-                        value=(exp_min, exp_max),
-                    ),
-                    ui.br(),
-                    ui.h6("Weekly AI Usage:"),
-                    ui.input_slider(
-                        "ai_usage", None, min=ai_min, max=ai_max, value=(ai_min, ai_max)
-                    ),
-                    ui.br(),
-                    ui.h6("Manual Work Hours:"),
-                    ui.input_slider(
-                        "manual_hours",
-                        None,
-                        min=man_min,
-                        max=man_max,
-                        value=(man_min, man_max),
-                    ),
-                    ui.br(),
-                    ui.h6("Tasks Automated:"),
-                    ui.input_slider(
-                        "tasks_automated",
-                        None,
-                        min=task_min,
-                        max=task_max,
-                        value=(task_min, task_max),
-                    ),
-                    ui.br(),
-                    ui.h6("Deadline Pressure:"),
-                    ui.input_checkbox_group(
-                        "deadline_pressure",
-                        None,
-                        choices=deadline_choices,
-                        selected=deadline_choices,
-                        inline=True,
-                    ),
-                    ui.hr(),
-                    ui.input_checkbox("show_debug", "Show debug panel", value=False),
-                    ui.br(),
-                    ui.input_action_button("reset_btn", "Reset Filters"),
-                    width=320,
-                ),
-                # -------------------------
-                # Dashboard main content
-                # -------------------------
-                ui.div(
-                    # -------------------------
-                    # KPI row
-                    # -------------------------
-                    ui.layout_columns(
-                        # Average burnout risk score for the filtered employees.
-                        # These boxes are ordered this way because the first two are key KPIs and are both lower the better,
-                        # while the last two are higher the better.
-                        ui.output_ui("burnout_box"),
-                        ui.output_ui("high_burnout_perc_box"),
-                        ui.output_ui("productivity_box"),
-                        ui.output_ui("wlb_box"),
-                        col_widths=(3, 3, 3, 3),
-                        class_="kpi-grid",
-                    ),
-                    ui.br(),
+            .kpi-value {{
+                font-size: 56px;
+                line-height: 1;
+                font-weight: 800;
+                color: {COLORS["dark_brown"]};
+            }}
+
+            .kpi-sub {{
+                min-height: 20px;
+                margin-top: 6px;
+                font-size: 14px;
+                font-weight: 700;
+            }}
+
+            .kpi-sub.up {{
+                color: {COLORS["alert_red"]};
+            }}
+
+            .kpi-sub.down {{
+                color: {COLORS["medium_brown"]};
+            }}    
+        """
+        ),
+        ui.tags.head(
+            ui.tags.link(
+                rel="stylesheet",
+                href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap",
+            )
+        ),
+        # -------------------------
+        # Main app navigation tabs
+        # -------------------------
+        ui.navset_tab(
+            # ==================================================
+            # Dashboard tab
+            # ==================================================
+            ui.nav_panel(
+                "Dashboard",
+                ui.layout_sidebar(
                     # -------------------------
-                    # Dashboard plots - row 1
+                    # Dashboard sidebar filters
                     # -------------------------
-                    ui.layout_columns(
-                        ui.card(
-                            ui.card_header("How AI Usage Relates to Burnout Risk Across Employees"),
-                            output_widget("plot_ai_vs_burnout"),
+                    ui.sidebar(
+                        ui.h3("AI Usage &\nBurnout Checkup"),
+                        ui.hr(),
+                        ui.h6("Job Role:"),
+                        ui.input_selectize(
+                            "job_role",
+                            None,
+                            choices=job_role_choices,
+                            selected=["Manager"],
+                            multiple=True,
                         ),
-                        ui.card(
-                            ui.card_header("Burnout Risk by Job Role"),
-                            output_widget("plot_burnout_by_role"),
+                        ui.br(),
+                        ui.h6("AI Usage Band:"),
+                        ui.input_selectize(
+                            "ai_band",
+                            None,
+                            choices=ai_band_choices,
+                            selected=["All"],
+                            multiple=True,
                         ),
-                        col_widths=(6, 6),
+                        ui.br(),
+                        ui.h6("Experience (years):"),
+                        ui.input_slider(
+                            "experience",
+                            None,
+                            min=exp_min,
+                            max=exp_max,
+                            value=(exp_min, exp_max),
+                        ),
+                        ui.br(),
+                        ui.h6("Weekly AI Usage:"),
+                        ui.input_slider(
+                            "ai_usage", None, min=ai_min, max=ai_max, value=(ai_min, ai_max)
+                        ),
+                        ui.br(),
+                        ui.h6("Manual Work Hours:"),
+                        ui.input_slider(
+                            "manual_hours",
+                            None,
+                            min=man_min,
+                            max=man_max,
+                            value=(man_min, man_max),
+                        ),
+                        ui.br(),
+                        ui.h6("Tasks Automated:"),
+                        ui.input_slider(
+                            "tasks_automated",
+                            None,
+                            min=task_min,
+                            max=task_max,
+                            value=(task_min, task_max),
+                        ),
+                        ui.br(),
+                        ui.h6("Deadline Pressure:"),
+                        ui.input_checkbox_group(
+                            "deadline_pressure",
+                            None,
+                            choices=deadline_choices,
+                            selected=deadline_choices,
+                            inline=True,
+                        ),
+                        ui.hr(),
+                        ui.input_checkbox("show_debug", "Show debug panel", value=False),
+                        ui.br(),
+                        ui.input_action_button("reset_btn", "Reset Filters"),
+                        width=320,
                     ),
-                    ui.br(),
                     # -------------------------
-                    # Dashboard plots - row 2
+                    # Dashboard main content
                     # -------------------------
-                    ui.layout_columns(
-                        ui.card(
-                            ui.card_header("Weekly Work Hours Breakdown"),
-                            output_widget("plot_hours_breakdown"),
+                    ui.div(
+                        # -------------------------
+                        # KPI row
+                        # -------------------------
+                        ui.layout_columns(
+                            # Average burnout risk score for the filtered employees.
+                            # These boxes are ordered this way because the first two are key KPIs and are both lower the better,
+                            # while the last two are higher the better.
+                            ui.output_ui("burnout_box"),
+                            ui.output_ui("high_burnout_perc_box"),
+                            ui.output_ui("productivity_box"),
+                            ui.output_ui("wlb_box"),
+                            col_widths=(3, 3, 3, 3),
+                            class_="kpi-grid",
                         ),
-                        ui.card(
-                            ui.card_header("Relationship Between Productivity, AI usage and Burnout Risk"),
-                            output_widget("plot_prod_vs_burnout"),
+                        ui.br(),
+                        # -------------------------
+                        # Dashboard plots - row 1
+                        # -------------------------
+                        ui.layout_columns(
+                            ui.card(
+                                ui.card_header("How AI Usage Relates to Burnout Risk Across Employees"),
+                                output_widget("plot_ai_vs_burnout"),
+                            ),
+                            ui.card(
+                                ui.card_header("Burnout Risk by Job Role"),
+                                output_widget("plot_burnout_by_role"),
+                            ),
+                            col_widths=(6, 6),
                         ),
-                        col_widths=(6, 6),
-                    ),
-                    ui.br(),
-                    # Debug panel
-                    ui.panel_conditional(
-                        "input.show_debug",
-                        ui.card(
-                            ui.card_header(
-                                "Debug (reactive inputs + filtered row count)"
+                        ui.br(),
+                        # -------------------------
+                        # Dashboard plots - row 2
+                        # -------------------------
+                        ui.layout_columns(
+                            ui.card(
+                                ui.card_header("Weekly Work Hours Breakdown"),
+                                output_widget("plot_hours_breakdown"),
+                            ),
+                            ui.card(
+                                ui.card_header("Relationship Between Productivity, AI usage and Burnout Risk"),
+                                output_widget("plot_prod_vs_burnout"),
+                            ),
+                            col_widths=(6, 6),
+                        ),
+                        ui.br(),
+                        # Debug panel
+                        ui.panel_conditional(
+                            "input.show_debug",
+                            ui.card(
+                                ui.card_header(
+                                    "Debug (reactive inputs + filtered row count)"
+                                ),
+                                ui.output_text_verbatim("debug_filters"),
                             ),
-                            ui.output_text_verbatim("debug_filters"),
                         ),
                     ),
                 ),
             ),
-        ),
-        # ==================================================
-        # AI Explorer tab
-        # ==================================================
-        ui.nav_panel(
-            "AI Explorer",
-            ui.layout_sidebar(
-                # -------------------------
-                # AI Explorer sidebar
-                # -------------------------
-                ui.sidebar(
-                    ui.h3("AI Explorer"),
-                    ui.h6("Response Style:"),
-                    ui.input_select(
-                        "response_style",
-                        None,
-                        choices={
-                            "executive": "Executive Summary",
-                            "analytical": "Analytical Explanation",
-                            "technical": "Technical Interpretation",
-                        },
-                        selected="analytical"
-                    ),
-                    ui.p("Choose how the AI explains results: concise, balanced, or more technical."),
-                    ui.br(),
-                    ui.panel_conditional("input.response_style === 'executive'", qc_executive.ui()),
-                    ui.panel_conditional("input.response_style === 'analytical'", qc_analytical.ui()),
-                    ui.panel_conditional("input.response_style === 'technical'", qc_technical.ui()),
-                    ui.hr(),
-                    ui.input_action_button("reset_ai_query", "Reset AI filters"),
-                    width=420,
-                ),
-                # -------------------------
-                # AI Explorer main content
-                # -------------------------
-                ui.div(
+            # ==================================================
+            # AI Explorer tab
+            # ==================================================
+            ui.nav_panel(
+                "AI Explorer",
+                ui.layout_sidebar(
                     # -------------------------
-                    # AI Explorer KPI row
+                    # AI Explorer sidebar
                     # -------------------------
-                    ui.layout_columns(
-                        ui.output_ui("ai_count_box"),
-                        ui.output_ui("ai_burnout_box"),
-                        ui.output_ui("ai_productivity_box"),
-                        ui.output_ui("ai_high_burnout_box"),
-                        col_widths=(3, 3, 3, 3),
-                        class_="kpi-grid",
+                    ui.sidebar(
+                        ui.h3("AI Explorer"),
+                        ui.h6("Response Style:"),
+                        ui.input_select(
+                            "response_style",
+                            None,
+                            choices={
+                                "executive": "Executive Summary",
+                                "analytical": "Analytical Explanation",
+                                "technical": "Technical Interpretation",
+                            },
+                            selected="analytical"
+                        ),
+                        ui.p("Choose how the AI explains results: concise, balanced, or more technical."),
+                        ui.br(),
+                        # Rendered when the tab is first shown, so the
+                        # QueryChat stack is only built for sessions using it.
+                        ui.output_ui("ai_chat_panels"),
+                        ui.hr(),
+                        ui.input_action_button("reset_ai_query", "Reset AI filters"),
+                        width=420,
                     ),
-                    ui.br(),
                     # -------------------------
-                    # AI Explorer table preview
+                    # AI Explorer main content
                     # -------------------------
-                    ui.card(
-                        ui.card_header(
-                            ui.output_text("ai_title"),
-                            ui.download_button(
-                                "download_ai_data",
-                                "Download AI-filtered data",
+                    ui.div(
+                        # -------------------------
+                        # AI Explorer KPI row
+                        # -------------------------
+                        ui.layout_columns(
+                            ui.output_ui("ai_count_box"),
+                            ui.output_ui("ai_burnout_box"),
+                            ui.output_ui("ai_productivity_box"),
+                            ui.output_ui("ai_high_burnout_box"),
+                            col_widths=(3, 3, 3, 3),
+                            class_="kpi-grid",
+                        ),
+                        ui.br(),
+                        # -------------------------
+                        # AI Explorer table preview
+                        # -------------------------
+                        ui.card(
+                            ui.card_header(
+                                ui.output_text("ai_title"),
+                                ui.download_button(
+                                    "download_ai_data",
+                                    "Download AI-filtered data",
+                                ),
+                                class_="d-flex justify-content-between align-items-center",
                             ),
-                            class_="d-flex justify-content-between align-items-center",
+                            ui.output_data_frame("ai_table"),
                         ),
-                        ui.output_data_frame("ai_table"),
                     ),
                 ),
             ),
         ),
-    ),
-)
+    )
 
 
 # -------------------------
 # Server
 # -------------------------
 def server(input, output, session):
+    from functools import partial
+
+    from shinywidgets import render_altair
+
+    from src.charts import (
+        ai_vs_burnout_frame,
+        ai_vs_burnout_spec,
+        burnout_by_role_frame,
+        burnout_by_role_spec,
+        hours_breakdown_frame,
+        hours_breakdown_spec,
+        productivity_vs_burnout_frame,
+        productivity_vs_burnout_spec,
+    )
+    from src.live_charts import LiveChart
+
+    res = dashboard_resources.get()
+    filter_results = res.results
+    default_ai_preview_df = res.default_ai_preview_df
+    deadline_choices = res.filter_choices["deadline_choices"]
+
+    exp_min, exp_max = res.slider_ranges["experience"]
+    ai_min, ai_max = res.slider_ranges["ai_usage"]
+    man_min, man_max = res.slider_ranges["manual_hours"]
+    task_min, task_max = res.slider_ranges["tasks_automated"]
+
+    # Company-wide baselines (computed once per process, used across outputs)
+    BASELINE_MEDIAN_BURNOUT = res.baselines["median_burnout"]
+    BASELINE_MEDIAN_PRODUCTIVITY = res.baselines["median_productivity"]
+    BASELINE_MEDIAN_WLB = res.baselines["median_wlb"]
+    BASELINE_HIGH_BURNOUT = res.baselines["high_burnout_rate"]
 
     # Reset filters button - resets all filters to default values
     @reactive.effect
@@ -498,68 +553,110 @@ def server(input, output, session):
     # -------------------------
     # Dashboard filters
     # -------------------------
-    # Reactive expression for the filtered dataframe based on sidebar inputs
+    # Sidebar inputs normalised into one engine-independent filter spec
     @reactive.calc
-    def filtered_df():
-
-        expr = table
-
-        if input.job_role() and "All" not in input.job_role():
-            expr = expr.filter(_.job_role.isin(input.job_role()))
-
-        if input.ai_band() and "All" not in input.ai_band():
-            expr = expr.filter(_.ai_band.isin(input.ai_band()))
-
-        lo, hi = input.experience()
-        expr = expr.filter(_.experience_years.between(lo, hi))
-
-        lo, hi = input.ai_usage()
-        expr = expr.filter(_.ai_tool_usage_hours_per_week.between(lo, hi))
-
-        lo, hi = input.manual_hours()
-        expr = expr.filter(_.manual_work_hours_per_week.between(lo, hi))
+    def filter_spec():
+        return FilterSpec.from_inputs(
+            job_role=input.job_role(),
+            ai_band=input.ai_band(),
+            experience=input.experience(),
+            ai_usage=input.ai_usage(),
+            manual_hours=input.manual_hours(),
+            tasks_automated=input.tasks_automated(),
+            deadline_pressure=input.deadline_pressure(),
+        )
 
-        lo, hi = input.tasks_automated()
-        expr = expr.filter(_.tasks_automated_percent.between(lo, hi))
+    # Reactive expression for the filtered result based on sidebar inputs.
+    # The "memory" engine filters the in-process frame with the prebuilt
+    # indexes; the session's IncrementalFilter only revisits rows affected by
+    # the input that changed, e.g. the slider being dragged. The "duckdb"
+    # engine runs the prepared queries instead and may hold no frame at all.
+    incremental_filter = None if FILTER_ENGINE == "duckdb" else IncrementalFilter(res.index)
 
-        if input.deadline_pressure():
-            expr = expr.filter(_.deadline_pressure_level.isin(input.deadline_pressure()))
+    # Results are cached process-wide by the normalised spec, so popular
+    # views (e.g. the defaults) are computed once for all sessions. They hold
+    # the KPI values and chart inputs only, never the matching rows.
+    @reactive.calc
+    def filtered_result():
+        spec = filter_spec()
+
+        def compute():
+            if FILTER_ENGINE == "duckdb":
+                return FilterResult.from_statements(res.statements, spec)
+            view = FilteredView(res.df, rows=incremental_filter.update(spec))
+            # None unless the cube is enabled and can answer: sliders on bin
+            # edges, or any position when approximate medians are allowed.
+            aggregates = None
+            if res.cube is not None:
+                aggregates = res.cube.summarize(
+                    spec, approximate=MEDIAN_MODE == "approximate"
+                )
+            return FilterResult.from_view(view, aggregates)
+
+        return filter_results.get_or_compute(spec, compute)
 
-        return expr.execute()
+    @reactive.calc
+    def filtered_aggregates():
+        return filtered_result().aggregates
 
     # -------------------------
     # QueryChat server values for AI Explorer
     # -------------------------
-    qc_executive_vals = qc_executive.server()
-    qc_analytical_vals = qc_analytical.server()
-    qc_technical_vals = qc_technical.server()
+    # Started by ai_chat_panels, which only renders once the AI Explorer
+    # tab is visible; None until then.
+    qc_servers = reactive.value(None)
+
+    @render.ui
+    def ai_chat_panels():
+        qcs = querychats.get()
+        with reactive.isolate():
+            if qc_servers() is None:
+                qc_servers.set({style: qc.server() for style, qc in qcs.items()})
+        return ui.TagList(
+            *(
+                ui.panel_conditional(f"input.response_style === '{style}'", qc.ui())
+                for style, qc in qcs.items()
+            )
+        )
 
     # -------------------------
     # QueryChat response style reactive
     # -------------------------
     @reactive.calc
     def current_qc_vals():
+        servers = qc_servers()
+        if servers is None:
+            return None
+
         style = input.response_style()
 
         if style == "executive":
-            return qc_executive_vals
+            return servers["executive"]
         elif style == "technical":
-            return qc_technical_vals
+            return servers["technical"]
         else:
-            return qc_analytical_vals
+            return servers["analytical"]
+
+    def current_ai_sql():
+        qc_vals = current_qc_vals()
+        return qc_vals.sql() if qc_vals is not None else None
     
     
     # ai filtered df returned by QueryChat
     @reactive.calc
     def ai_filtered_df():
         qc_vals = current_qc_vals()
-        current_sql = qc_vals.sql()
-        result = qc_vals.df()
+        current_sql = current_ai_sql()
 
         # No AI query has been run yet -> show preview only
         if not current_sql:
             return default_ai_preview_df
 
+        result = qc_vals.df()
+        # An ibis-backed QueryChat returns the query lazily
+        if hasattr(result, "to_pandas"):
+            result = result.to_pandas()
+
         # Valid AI query returned a dataframe -> show all matched rows
         if isinstance(result, pd.DataFrame):
             return result
@@ -571,13 +668,15 @@ def server(input, output, session):
     @render.text
     def ai_title():
         qc_vals = current_qc_vals()
-        return qc_vals.title() if qc_vals.sql() else "Preview of first 100 rows"
+        return qc_vals.title() if current_ai_sql() else "Preview of first 100 rows"
 
     # reset button for AI filters
     @reactive.effect
     @reactive.event(input.reset_ai_query)
     def _reset_ai_query():
         qc_vals = current_qc_vals()
+        if qc_vals is None:
+            return
         qc_vals.sql("")
         qc_vals.title(None)
 
@@ -588,9 +687,8 @@ def server(input, output, session):
     # Returns a KPI card for the median productivity of the filtered employees.
     @render.ui
     def productivity_box():
-        return median_metric_card(
-            filtered_df(),
-            column="productivity_score",
+        return median_value_card(
+            filtered_aggregates()["median_productivity"],
             title="Median Productivity",
             baseline=BASELINE_MEDIAN_PRODUCTIVITY,
             higher_is_better=True,
@@ -601,8 +699,8 @@ def server(input, output, session):
     # compared to company-wide baseline percentage.
     @render.ui
     def high_burnout_perc_box():
-        return high_burnout_pct_card(
-            filtered_df(),
+        return high_burnout_share_card(
+            filtered_aggregates()["high_burnout_share"],
             baseline_high_burnout=BASELINE_HIGH_BURNOUT,
             title="High Burnout %",
             subtitle="Compared to company-wide high-burnout rate across all employees.",
@@ -612,9 +710,8 @@ def server(input, output, session):
     # compared to the company-wide baseline median.
     @render.ui
     def burnout_box():
-        return median_metric_card(
-            filtered_df(),
-            column="burnout_risk_score",
+        return median_value_card(
+            filtered_aggregates()["median_burnout"],
             title="Median Burnout Risk Score",
             baseline=BASELINE_MEDIAN_BURNOUT,
             higher_is_better=False,
@@ -625,9 +722,8 @@ def server(input, output, session):
     # compared to the company-wide baseline median.        
     @render.ui
     def wlb_box():
-        return median_metric_card(
-            filtered_df(),
-            column="work_life_balance_score",
+        return median_value_card(
+            filtered_aggregates()["median_wlb"],
             title="Median Work-Life Balance Score",
             baseline=BASELINE_MEDIAN_WLB,
             higher_is_better=True,
@@ -638,18 +734,22 @@ def server(input, output, session):
     # AI Explorer KPIs
     # -------------------------
 
+    # All AI Explorer KPI values, computed in one pass per query result.
+    @reactive.calc
+    def ai_kpis():
+        return compute_kpi_bundle(ai_filtered_df())
+
     # Number of employees returned by the AI-filtered subset
     # (i.e. the number of rows in the dataframe)
     @render.ui
     def ai_count_box():
-        qc_vals = current_qc_vals()
         subtitle = (
             "Rows returned by AI query"
-            if qc_vals.sql()
+            if current_ai_sql()
             else "Rows shown in default preview"
         )
-        return count_card(
-            ai_filtered_df(),
+        return row_count_card(
+            ai_kpis().row_count,
             title="Employees Found",
             subtitle=subtitle,
             )
@@ -658,9 +758,8 @@ def server(input, output, session):
     # compared to the company-wide baseline median.
     @render.ui
     def ai_burnout_box():
-        return median_metric_card(
-            ai_filtered_df(),
-            column="burnout_risk_score",
+        return median_value_card(
+            ai_kpis().median_burnout,
             title="Median Burnout Risk Score",
             baseline=BASELINE_MEDIAN_BURNOUT,
             higher_is_better=False,
@@ -671,9 +770,8 @@ def server(input, output, session):
     # compared to the company-wide baseline median
     @render.ui
     def ai_productivity_box():
-        return median_metric_card(
-            ai_filtered_df(),
-            column="productivity_score",
+        return median_value_card(
+            ai_kpis().median_productivity,
             title="Median Productivity",
             baseline=BASELINE_MEDIAN_PRODUCTIVITY,
             higher_is_better=True,
@@ -684,8 +782,8 @@ def server(input, output, session):
     # compared to the company-wide baseline percentage
     @render.ui
     def ai_high_burnout_box():
-        return high_burnout_pct_card(
-            ai_filtered_df(),
+        return high_burnout_share_card(
+            ai_kpis().high_burnout_share,
             baseline_high_burnout=BASELINE_HIGH_BURNOUT,
             title="High Burnout %",
             subtitle="Compared to company-wide high-burnout rate across all employees.",
@@ -695,52 +793,101 @@ def server(input, output, session):
     # Plots (Altair)
     # -------------------------
 
+    # Each chart's spec is built once per layout and embedded as a widget;
+    # filter changes with the same layout only push the new rows (and title
+    # params) into the existing Vega view.
+    def live_chart(frame_calc, build):
+        live = LiveChart(build)
+        # Bumped whenever a frame cannot be pushed, to re-render the output.
+        renders = reactive.value(0)
+
+        @reactive.effect
+        def _push():
+            frame = frame_calc()
+            if not live.push(frame):
+                with reactive.isolate():
+                    renders.set(renders() + 1)
+
+        def render():
+            renders()
+            with reactive.isolate():
+                frame = frame_calc()
+            # Built in the output's own context: shinywidgets closes widgets
+            # when the context that created them is invalidated.
+            return live.render(frame)
+
+        return render
+
+    @reactive.calc
+    def ai_vs_burnout_data():
+        return ai_vs_burnout_frame(filtered_aggregates()["ai_usage_bins"])
+
+    @reactive.calc
+    def burnout_by_role_data():
+        return burnout_by_role_frame(filtered_aggregates()["burnout_by_role"])
+
+    @reactive.calc
+    def hours_breakdown_data():
+        return hours_breakdown_frame(filtered_aggregates()["hours_breakdown"])
+
+    @reactive.calc
+    def prod_vs_burnout_data():
+        return productivity_vs_burnout_frame(filtered_aggregates()["scatter"])
+
+    render_ai_vs_burnout = live_chart(
+        ai_vs_burnout_data,
+        partial(ai_vs_burnout_spec, baseline_median_burnout=BASELINE_MEDIAN_BURNOUT),
+    )
+    render_burnout_by_role = live_chart(burnout_by_role_data, burnout_by_role_spec)
+    render_hours_breakdown = live_chart(hours_breakdown_data, hours_breakdown_spec)
+    render_prod_vs_burnout = live_chart(
+        prod_vs_burnout_data,
+        partial(
+            productivity_vs_burnout_spec,
+            baseline_median_productivity=BASELINE_MEDIAN_PRODUCTIVITY,
+            baseline_median_burnout=BASELINE_MEDIAN_BURNOUT,
+        ),
+    )
+
     # Render AI usage vs burnout chart
-    # (scatter plot with a reference median burnout line)
+    # (binned heatmap with a reference median burnout line)
     @output
     @render_altair
     def plot_ai_vs_burnout():
-        return make_ai_vs_burnout_chart(
-            filtered_df(),
-            baseline_median_burnout=BASELINE_MEDIAN_BURNOUT,
-        )
+        return render_ai_vs_burnout()
 
     # Render burnout by role chart
     # (bar chart of average burnout risk score by job role)
     @output
     @render_altair
-    def plot_burnout_by_role():       
-        return make_burnout_by_role_chart(filtered_df())
+    def plot_burnout_by_role():
+        return render_burnout_by_role()
 
     # Render hours breakdown chart
     # (stacked bar chart of average hours spent on manual work, meetings, and collaboration)
     @output
     @render_altair
     def plot_hours_breakdown():
-        return make_hours_breakdown_chart(filtered_df())
+        return render_hours_breakdown()
 
     # Render productivity vs burnout chart
     # (scatter plot with productivity on x-axis and burnout risk score on y-axis, with reference median lines for both)
     @output
     @render_altair
     def plot_prod_vs_burnout():
-        return make_productivity_vs_burnout_chart(
-            filtered_df(),
-            baseline_median_productivity=BASELINE_MEDIAN_PRODUCTIVITY,
-            baseline_median_burnout=BASELINE_MEDIAN_BURNOUT,
-        )
+        return render_prod_vs_burnout()
 
     # Render df in AI tab
     # (data grid)
     @output
     @render.data_frame
     def ai_table():
-        return DataGrid(ai_filtered_df())
+        return DataGrid(with_readable_ids(ai_filtered_df()))
 
     # Download data button in ai tab
     @render.download(filename="ai_filtered_data.csv")
     def download_ai_data():
-        yield ai_filtered_df().to_csv(index=False)
+        yield with_readable_ids(ai_filtered_df()).to_csv(index=False)
 
     # Debug panel output showing current filter values and number of rows in the filtered dataframe
     @output
@@ -754,8 +901,31 @@ def server(input, output, session):
             manual_hours=input.manual_hours(),
             tasks_automated=input.tasks_automated(),
             deadline_pressure=input.deadline_pressure(),
-            filtered_df=filtered_df(),
+            filtered_rows=filtered_aggregates()["row_count"],
         )
 
 
+async def healthz(request):
+    """Liveness probe that answers without waiting for data preparation."""
+    return JSONResponse(
+        {
+            "status": "ok",
+            "data_ready": dashboard_resources.ready,
+            "ai_ready": querychats.ready,
+            "result_cache": (
+                dashboard_resources.get().results.stats()
+                if dashboard_resources.ready
+                else None
+            ),
+        }
+    )
+
+
 app = App(app_ui, server)
+app.starlette_app.router.routes.insert(0, Route("/healthz", healthz, methods=["GET"]))
+
+if WARMUP_ENABLED:
+    dashboard_resources.warm_up()
+    chart_stack.warm_up()
+    if WARMUP_AI_ENABLED:
+        querychats.warm_up()
@@ -0,0 +1,107 @@
+# src/bands.py
+
+"""Persisted tercile cut points for ``workload_band`` and ``ai_band``."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.constants.paths import BANDS_PATH
+from src.data import BANDED_COLUMNS, TERCILES
+
+BandEdges = dict[str, list[float]]
+
+
+def compute_band_edges(df: pd.DataFrame) -> BandEdges:
+    """
+    Compute tercile cut points for every banded column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dashboard dataset containing the columns in ``BANDED_COLUMNS``.
+
+    Returns
+    -------
+    dict[str, list[float]]
+        Four edges per column (min, first tercile, second tercile, max),
+        identical to the bins ``pd.qcut(..., q=3)`` uses.
+    """
+    return {
+        col: [float(v) for v in df[col].astype("float64").quantile(TERCILES)]
+        for col in BANDED_COLUMNS
+    }
+
+
+def assign_bands(df: pd.DataFrame, edges: BandEdges) -> pd.DataFrame:
+    """
+    Label ``workload_band`` and ``ai_band`` using stored cut points.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Rows with ``workload_score`` and ``ai_tool_usage_hours_per_week``.
+    edges : dict[str, list[float]]
+        Cut points as returned by :func:`compute_band_edges`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        ``df`` with the band columns set in place.
+
+    Notes
+    -----
+    The outer edges are widened to infinity, so new employees below the
+    stored minimum land in the lowest band and those above the stored maximum
+    in the highest one. For values inside the stored range the labels equal
+    those of ``pd.qcut`` on the data the edges were computed from.
+    """
+    for col, (band_col, labels) in BANDED_COLUMNS.items():
+        bins = [-np.inf, *edges[col][1:-1], np.inf]
+        df[band_col] = pd.cut(df[col], bins=bins, labels=labels)
+    return df
+
+
+def save_band_edges(edges: BandEdges, path: Path = BANDS_PATH) -> None:
+    """
+    Write band cut points to the JSON bands artifact.
+
+    Parameters
+    ----------
+    edges : dict[str, list[float]]
+        Cut points as returned by :func:`compute_band_edges`.
+    path : pathlib.Path, default=BANDS_PATH
+        Destination of the artifact.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(edges, indent=2) + "\n")
+    os.replace(tmp, path)
+
+
+def load_band_edges(path: Path = BANDS_PATH) -> BandEdges:
+    """
+    Read band cut points from the JSON bands artifact.
+
+    Parameters
+    ----------
+    path : pathlib.Path, default=BANDS_PATH
+        Location of the artifact.
+
+    Returns
+    -------
+    dict[str, list[float]]
+        Stored cut points.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the artifact has not been built yet.
+    """
+    return json.loads(Path(path).read_text())
@@ -0,0 +1,140 @@
+# src/cache.py
+
+"""On-disk cache of the preprocessed dashboard frame keyed by source content."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Sequence
+
+import pandas as pd
+
+from src.constants.paths import DATA_CACHE_DIR, RAW_SOURCE_PATHS
+from src.data import load_dashboard_data
+from src.utils.fingerprint import fingerprint_file
+
+# Bump whenever ``load_dashboard_data`` changes its output so that existing
+# cache entries stop matching.
+CACHE_VERSION = 2
+
+FINGERPRINT_INDEX = "fingerprints.json"
+CACHE_PREFIX = "dashboard-"
+
+
+def _read_index(cache_dir: Path) -> dict[str, Any]:
+    try:
+        return json.loads((cache_dir / FINGERPRINT_INDEX).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def cache_key(
+    sources: Sequence[Path] = RAW_SOURCE_PATHS,
+    cache_dir: Path = DATA_CACHE_DIR,
+) -> str:
+    """
+    Compute the cache key for the current state of the raw source files.
+
+    Parameters
+    ----------
+    sources : Sequence[pathlib.Path], default=RAW_SOURCE_PATHS
+        Raw input files the cached frame is derived from.
+    cache_dir : pathlib.Path, default=DATA_CACHE_DIR
+        Cache directory holding the fingerprint index.
+
+    Returns
+    -------
+    str
+        Hex digest identifying the source contents and ``CACHE_VERSION``.
+
+    Notes
+    -----
+    The key is derived from each file's size and SHA-256 digest. Digests are
+    memoised in a small index alongside their size and modification time, so
+    a file is only re-hashed when its size or mtime changes. Touching a file
+    without editing it therefore re-hashes once but keeps the same key.
+    """
+    cache_dir = Path(cache_dir)
+    index = _read_index(cache_dir)
+    changed = False
+    parts = [f"v{CACHE_VERSION}"]
+
+    for path in sources:
+        path = Path(path)
+        stat = os.stat(path)
+        entry = index.get(str(path))
+        if (
+            entry is None
+            or entry.get("size") != stat.st_size
+            or entry.get("mtime_ns") != stat.st_mtime_ns
+        ):
+            entry = fingerprint_file(path)
+            index[str(path)] = entry
+            changed = True
+        parts.append(f"{entry['name']}:{entry['size']}:{entry['sha256']}")
+
+    if changed:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(
+            cache_dir / FINGERPRINT_INDEX,
+            lambda tmp: tmp.write_text(json.dumps(index, indent=2) + "\n"),
+        )
+
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+
+
+def load_cached_dashboard_data(
+    cache_dir: Path = DATA_CACHE_DIR,
+    sources: Sequence[Path] = RAW_SOURCE_PATHS,
+) -> pd.DataFrame:
+    """
+    Load the preprocessed dashboard frame, reusing a cached copy when valid.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path, default=DATA_CACHE_DIR
+        Directory holding cached frames.
+    sources : Sequence[pathlib.Path], default=RAW_SOURCE_PATHS
+        Raw features and targets CSVs, in that order, the frame is built
+        from and keyed by.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Same frame as :func:`src.data.load_dashboard_data` of ``sources``.
+
+    Notes
+    -----
+    On a miss the frame is rebuilt with ``load_dashboard_data`` and written
+    atomically, and entries for older keys are removed. Unreadable entries
+    are treated as misses.
+    """
+    cache_dir = Path(cache_dir)
+    key = cache_key(sources, cache_dir)
+    path = cache_dir / f"{CACHE_PREFIX}{key}.parquet"
+
+    if path.exists():
+        try:
+            return pd.read_parquet(path)
+        except (OSError, ValueError):
+            pass
+
+    df = load_dashboard_data(*sources)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, lambda tmp: df.to_parquet(tmp, index=False))
+
+    for stale in cache_dir.glob(f"{CACHE_PREFIX}*.parquet"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+    return df
@@ -2,10 +2,134 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field, replace
+from typing import Any
+
 import altair as alt
 import pandas as pd
 
-from src.constants.theme import COLORS, deadline_scale, ai_band_scale
+from src.aggregates import (
+    BINNED_GRIDS,
+    HOURS_CATEGORIES,
+    SCATTER_COLUMNS,
+    SCATTER_DENSITY_ROWS,
+    SCATTER_POINT_BUDGET,
+    summarize_binned_counts,
+    summarize_burnout_by_role,
+    summarize_hours_breakdown,
+    summarize_scatter,
+)
+from src.constants.theme import COLORS, ai_band_scale
+
+# Columns each chart reads from the filtered rows, directly or through its
+# summary; nothing else is serialised into its spec.
+CHART_COLUMNS: dict[str, list[str]] = {
+    "ai_vs_burnout": list(BINNED_GRIDS["ai_usage"]),
+    "burnout_by_role": ["job_role", "burnout_risk_score"],
+    "hours_breakdown": [
+        "meeting_hours_per_week",
+        "collaboration_hours_per_week",
+        "focus_hours_per_day",
+        "manual_work_hours_per_week",
+    ],
+    "productivity_vs_burnout": SCATTER_COLUMNS,
+}
+
+# Top-level param holding the scatter's "N of M employees shown" title.
+SHOWN_LABEL_PARAM = "shown_label"
+
+NO_DATA_MESSAGE = "No data for current filters."
+
+# Decimals kept for float values sent to the browser; the source data has
+# two, so nothing visible is lost.
+PAYLOAD_DECIMALS = 2
+
+
+def chart_payload(
+    d: pd.DataFrame,
+    columns: list[str],
+    decimals: int = PAYLOAD_DECIMALS,
+) -> pd.DataFrame:
+    """
+    Reduce a frame to what a chart spec needs to embed.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Rows or summary handed to a chart builder.
+    columns : list[str]
+        Fields the chart encodes.
+    decimals : int, default=PAYLOAD_DECIMALS
+        Decimals kept for float columns.
+
+    Returns
+    -------
+    pandas.DataFrame
+        New frame with only ``columns``. Floats are rounded in float64, so
+        a float32 ``64.8`` is written as ``64.8`` rather than
+        ``64.80000305175781``.
+    """
+    out = d[columns]
+    floats = out.select_dtypes("floating").columns
+    if len(floats):
+        out = out.astype({col: "float64" for col in floats}).round(
+            {col: decimals for col in floats}
+        )
+    return out
+
+
+@dataclass(frozen=True, eq=False)
+class ChartFrame:
+    """
+    What one render of a chart shows, split by how it reaches the browser.
+
+    Parameters
+    ----------
+    layout : tuple
+        Everything besides the data that shapes the spec, e.g. a
+        placeholder message, the drawing mode or bin steps. Renders with
+        equal layouts share one spec.
+    data : pandas.DataFrame | None, default=None
+        Rows of the chart's data-driven layer, exactly as embedded. None
+        for placeholders.
+    params : dict[str, Any], default={}
+        Values of the spec's top-level params.
+    """
+
+    layout: tuple
+    data: pd.DataFrame | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def placeholder_frame(message: str = NO_DATA_MESSAGE) -> ChartFrame:
+    """Frame of an :func:`empty_chart` showing ``message``."""
+    return ChartFrame(("empty", message))
+
+
+def binned_frame(bins: pd.DataFrame, x: str, y: str) -> ChartFrame:
+    """
+    Frame of a :func:`binned_count_layer` over precomputed bins.
+
+    Parameters
+    ----------
+    bins : pandas.DataFrame
+        Output of :func:`src.aggregates.summarize_binned_counts`.
+    x, y : str
+        Binned fields.
+
+    Returns
+    -------
+    ChartFrame
+        Lower edges and counts as data; the bin steps are part of the
+        layout, since the spec declares them. A placeholder when ``bins``
+        is empty.
+    """
+    if bins.empty:
+        return placeholder_frame()
+    first = bins.iloc[0]
+    x_step = round(float(first[f"{x}_end"] - first[x]), 10)
+    y_step = round(float(first[f"{y}_end"] - first[y]), 10)
+    return ChartFrame(("binned", x_step, y_step), bins[[x, y, "count"]])
 
 
 def empty_chart(message: str, height: int = 260) -> alt.Chart:
@@ -32,60 +156,133 @@ def empty_chart(message: str, height: int = 260) -> alt.Chart:
     )
 
 
-def make_ai_vs_burnout_chart(
-    d: pd.DataFrame,
-    baseline_median_burnout: float,
+def binned_count_layer(
+    frame: ChartFrame,
+    x: alt.X,
+    y: alt.Y,
     height: int = 260,
 ) -> alt.Chart:
-    
     """
-    Build the AI usage vs burnout scatter plot.
+    Rect layer of precomputed 2D bin counts.
 
     Parameters
     ----------
-    d : pandas.DataFrame
-        Filtered dashboard dataframe.
-    baseline_median_burnout : float
-        Company-wide median burnout score used as the reference line.
+    frame : ChartFrame
+        Non-placeholder output of :func:`binned_frame`.
+    x, y : altair.X, altair.Y
+        Encodings of the binned fields, with their titles.
     height : int, default=260
         Chart height in pixels.
 
     Returns
     -------
     alt.Chart
-        Scatter plot with a reference median burnout line.
+        Heatmap coloured by ``count``. Only the lower bin edges and the
+        counts are embedded; the bin width is declared once as the step.
     """
-    
-    if d.empty:
-        return empty_chart("No data for current filters.", height=height)
-
-    # 2D binned heatmap
-    chart = (
-        alt.Chart(d)
+    _, x_step, y_step = frame.layout
+    return (
+        alt.Chart(frame.data)
         .mark_rect()
         .encode(
-            x=alt.X(
-                "ai_tool_usage_hours_per_week:Q",
-                bin=alt.Bin(maxbins=30),
-                title="AI tool usage (hrs/week)",
-            ),
-            y=alt.Y(
-                "burnout_risk_score:Q",
-                bin=alt.Bin(maxbins=30),
-                title="Burnout risk score",
-            ),
+            x=x.bin(binned=True, step=x_step),
+            y=y.bin(binned=True, step=y_step),
             color=alt.Color(
-                "count():Q",
+                "count:Q",
                 title="Employee count",
                 scale=alt.Scale(scheme="oranges"),
             ),
             tooltip=[
-                alt.Tooltip("count():Q", title="Employees"),
+                alt.Tooltip("count:Q", title="Employees"),
             ],
         )
         .properties(height=height)
     )
 
+
+def make_ai_vs_burnout_chart(
+    d: pd.DataFrame,
+    baseline_median_burnout: float,
+    height: int = 260,
+) -> alt.Chart:
+    """
+    Build the AI usage vs burnout heatmap.
+
+    Parameters
+    ----------
+    d : pandas.DataFrame
+        Filtered dashboard dataframe.
+    baseline_median_burnout : float
+        Company-wide median burnout score used as the reference line.
+    height : int, default=260
+        Chart height in pixels.
+
+    Returns
+    -------
+    alt.Chart
+        Binned heatmap with a reference median burnout line.
+    """
+    bins = None if d.empty else summarize_binned_counts(d, *CHART_COLUMNS["ai_vs_burnout"])
+    return ai_vs_burnout_spec(
+        ai_vs_burnout_frame(bins), baseline_median_burnout, height=height
+    )
+
+
+def ai_vs_burnout_frame(bins: pd.DataFrame | None) -> ChartFrame:
+    """
+    Frame of the AI usage vs burnout heatmap.
+
+    Parameters
+    ----------
+    bins : pandas.DataFrame | None
+        The ``ai_usage_bins`` of :func:`src.aggregates.summarize_row_level`,
+        or None for an empty selection.
+
+    Returns
+    -------
+    ChartFrame
+        Non-empty bin counts, or a placeholder for an empty selection.
+    """
+    if bins is None:
+        return placeholder_frame()
+    return binned_frame(bins, *CHART_COLUMNS["ai_vs_burnout"])
+
+
+def ai_vs_burnout_spec(
+    frame: ChartFrame,
+    baseline_median_burnout: float,
+    height: int = 260,
+) -> alt.Chart:
+    """
+    Build the AI usage vs burnout heatmap from its frame.
+
+    Parameters
+    ----------
+    frame : ChartFrame
+        Output of :func:`ai_vs_burnout_frame`.
+    baseline_median_burnout : float
+        Company-wide median burnout score used as the reference line.
+    height : int, default=260
+        Chart height in pixels.
+
+    Returns
+    -------
+    alt.Chart
+        Binned heatmap with a reference median burnout line. Only the
+        non-empty bins are sent to the browser, so the spec size depends
+        on the grid, not on the number of employees.
+    """
+    if frame.data is None:
+        return empty_chart(frame.layout[1], height=height)
+
+    # 2D binned heatmap; bins are computed server-side
+    chart = binned_count_layer(
+        frame,
+        alt.X("ai_tool_usage_hours_per_week:Q", title="AI tool usage (hrs/week)"),
+        alt.Y("burnout_risk_score:Q", title="Burnout risk score"),
+        height=height,
+    )
+
     # median line
     median_line = (
         alt.Chart(
@@ -120,17 +317,50 @@ def make_burnout_by_role_chart(
         Bar chart of average burnout risk score by job role.
     """
     if d.empty:
-        return empty_chart("No data for current filters.", height=height)
+        return empty_chart(NO_DATA_MESSAGE, height=height)
 
-    summary = (
-        d.groupby("job_role", as_index=False)["burnout_risk_score"]
-        .mean()
-        .rename(columns={"burnout_risk_score": "avg_burnout"})
-        .sort_values("avg_burnout", ascending=False)
+    return burnout_by_role_chart(
+        summarize_burnout_by_role(d[CHART_COLUMNS["burnout_by_role"]]), height=height
     )
 
+
+def burnout_by_role_chart(
+    summary: pd.DataFrame | None,
+    height: int = 260,
+) -> alt.Chart:
+    """
+    Build the mean burnout-by-role bar chart from precomputed means.
+
+    Parameters
+    ----------
+    summary : pandas.DataFrame | None
+        Output of :func:`src.aggregates.summarize_burnout_by_role`, or None
+        for an empty selection.
+    height : int, default=260
+        Chart height in pixels.
+
+    Returns
+    -------
+    alt.Chart
+        Bar chart of average burnout risk score by job role.
+    """
+    return burnout_by_role_spec(burnout_by_role_frame(summary), height=height)
+
+
+def burnout_by_role_frame(summary: pd.DataFrame | None) -> ChartFrame:
+    """Frame of the burnout-by-role bars; a placeholder for no selection."""
+    if summary is None or summary.empty:
+        return placeholder_frame()
+    return ChartFrame(("bars",), chart_payload(summary, ["job_role", "avg_burnout"]))
+
+
+def burnout_by_role_spec(frame: ChartFrame, height: int = 260) -> alt.Chart:
+    """Build the burnout-by-role bar chart from its frame."""
+    if frame.data is None:
+        return empty_chart(frame.layout[1], height=height)
+
     return (
-        alt.Chart(summary)
+        alt.Chart(frame.data)
         .mark_bar(color=COLORS["medium_brown"])
         .encode(        
             x=alt.X(
@@ -166,33 +396,57 @@ def make_hours_breakdown_chart(
         Donut chart showing average weekly hours composition.
     """
     if d.empty:
-        return empty_chart("No data for current filters.", height=height)
-
-    weekly_focus = d["focus_hours_per_day"] * 5.0
-
-    breakdown = pd.DataFrame(
-        {
-            "category": ["Meetings", "Collaboration", "Deep work", "Manual work"],
-            "hours": [
-                float(d["meeting_hours_per_week"].mean()),
-                float(d["collaboration_hours_per_week"].mean()),
-                float(weekly_focus.mean()),
-                float(d["manual_work_hours_per_week"].mean()),
-            ],
-        }
+        return empty_chart(NO_DATA_MESSAGE, height=height)
+
+    return hours_breakdown_chart(
+        summarize_hours_breakdown(d[CHART_COLUMNS["hours_breakdown"]]), height=height
     )
 
+
+def hours_breakdown_chart(
+    breakdown: pd.DataFrame | None,
+    height: int = 260,
+) -> alt.Chart:
+    """
+    Build the weekly work hours breakdown donut chart from precomputed means.
+
+    Parameters
+    ----------
+    breakdown : pandas.DataFrame | None
+        Output of :func:`src.aggregates.summarize_hours_breakdown`, or None
+        for an empty selection.
+    height : int, default=260
+        Chart height in pixels.
+
+    Returns
+    -------
+    alt.Chart
+        Donut chart showing average weekly hours composition.
+    """
+    return hours_breakdown_spec(hours_breakdown_frame(breakdown), height=height)
+
+
+def hours_breakdown_frame(breakdown: pd.DataFrame | None) -> ChartFrame:
+    """Frame of the hours donut; a placeholder for no selection or no hours."""
+    if breakdown is None or breakdown.empty:
+        return placeholder_frame()
+
+    breakdown = chart_payload(breakdown, ["category", "hours"])
     total = breakdown["hours"].sum()
     if total <= 0:
-        return empty_chart("No hours available for current filters.", height=height)
+        return placeholder_frame("No hours available for current filters.")
 
-    breakdown["pct"] = breakdown["hours"] / total
-    breakdown["pct_label"] = (
-        (breakdown["pct"] * 100).round(0).astype(int).astype(str) + "%"
-    )
+    # Shares of the rounded hours, left unrounded so the slices still sum to 1.
+    return ChartFrame(("donut",), breakdown.assign(pct=breakdown["hours"] / total))
+
+
+def hours_breakdown_spec(frame: ChartFrame, height: int = 260) -> alt.Chart:
+    """Build the hours breakdown donut chart from its frame."""
+    if frame.data is None:
+        return empty_chart(frame.layout[1], height=height)
 
     return (
-        alt.Chart(breakdown)
+        alt.Chart(frame.data)
         .mark_arc(innerRadius=70)
         .encode(
             theta=alt.Theta("hours:Q", title=None),
@@ -200,7 +454,7 @@ def make_hours_breakdown_chart(
                 "category:N",
                 title=None,
                 scale=alt.Scale(
-                    domain=["Meetings", "Collaboration", "Deep work", "Manual work"],
+                    domain=HOURS_CATEGORIES,
                     range=[
                         COLORS["medium_brown"],
                         COLORS["light_orange"],
@@ -224,6 +478,9 @@ def make_productivity_vs_burnout_chart(
     baseline_median_productivity: float,
     baseline_median_burnout: float,
     height: int = 260,
+    *,
+    max_points: int = SCATTER_POINT_BUDGET,
+    density_above: int = SCATTER_DENSITY_ROWS,
 ) -> alt.Chart:
     """
     Build the productivity vs burnout scatter plot.
@@ -238,41 +495,124 @@ def make_productivity_vs_burnout_chart(
         Company-wide median burnout score used as horizontal reference.
     height : int, default=260
         Chart height in pixels.
+    max_points : int, default=SCATTER_POINT_BUDGET
+        Most employees drawn as points. Larger selections are sampled
+        within each AI usage band, so band proportions are preserved.
+    density_above : int, default=SCATTER_DENSITY_ROWS
+        Above this many employees, a binned density layer replaces the
+        points.
 
     Returns
     -------
     alt.Chart
-        Scatter plot with productivity and burnout median reference lines.
+        Scatter plot, or density heatmap, with productivity and burnout
+        median reference lines. The title says how many employees are
+        drawn.
     """
-    if d.empty:
-        return empty_chart("No data for current filters.", height=height)
-
-    chart = (
-        alt.Chart(d)
-        .transform_calculate(
-            # jitter: small random noise
-            jitter_x="datum.productivity_score + (random() - 0.5) * 2",
-            jitter_y="datum.burnout_risk_score + (random() - 0.5) * 0.5",
+    return productivity_vs_burnout_spec(
+        productivity_vs_burnout_frame(summarize_scatter(d, max_points, density_above)),
+        baseline_median_productivity,
+        baseline_median_burnout,
+        height=height,
+    )
+
+
+def productivity_vs_burnout_frame(scatter: dict[str, Any] | None) -> ChartFrame:
+    """
+    Points or density bins for the productivity vs burnout scatter.
+
+    Parameters
+    ----------
+    scatter : dict[str, Any] | None
+        Output of :func:`src.aggregates.summarize_scatter`, e.g. the
+        ``scatter`` of :func:`src.aggregates.summarize_row_level`; None for
+        an empty selection.
+
+    Returns
+    -------
+    ChartFrame
+        ``("points",)`` layout with the drawn employees, a binned layout
+        with the density bins, or a placeholder. The title text is the
+        ``SHOWN_LABEL_PARAM`` param.
+    """
+    if scatter is None:
+        return placeholder_frame()
+
+    n = scatter["row_count"]
+    if scatter["bins"] is not None:
+        frame = binned_frame(scatter["bins"], *BINNED_GRIDS["scatter"])
+        return replace(frame, params={SHOWN_LABEL_PARAM: f"Density of {n:,} employees"})
+
+    shown = chart_payload(scatter["points"], CHART_COLUMNS["productivity_vs_burnout"])
+    if len(shown) < n:
+        label = f"{len(shown):,} of {n:,} employees shown, sampled by AI usage band"
+    else:
+        label = f"All {n:,} employees shown"
+    return ChartFrame(("points",), shown, {SHOWN_LABEL_PARAM: label})
+
+
+def productivity_vs_burnout_spec(
+    frame: ChartFrame,
+    baseline_median_productivity: float,
+    baseline_median_burnout: float,
+    height: int = 260,
+) -> alt.Chart:
+    """
+    Build the productivity vs burnout scatter plot from its frame.
+
+    Parameters
+    ----------
+    frame : ChartFrame
+        Output of :func:`productivity_vs_burnout_frame`.
+    baseline_median_productivity : float
+        Company-wide median productivity score used as vertical reference.
+    baseline_median_burnout : float
+        Company-wide median burnout score used as horizontal reference.
+    height : int, default=260
+        Chart height in pixels.
+
+    Returns
+    -------
+    alt.Chart
+        Scatter plot, or density heatmap, with productivity and burnout
+        median reference lines, titled by the ``SHOWN_LABEL_PARAM`` param.
+    """
+    if frame.data is None:
+        return empty_chart(frame.layout[1], height=height)
+
+    if frame.layout[0] == "binned":
+        chart = binned_count_layer(
+            frame,
+            alt.X("productivity_score:Q", title="Productivity score"),
+            alt.Y("burnout_risk_score:Q", title="Burnout risk score"),
+            height=height,
         )
-        .mark_circle(opacity=0.25, size=40)
-        .encode(
-            x=alt.X("productivity_score:Q", title="Productivity score"),
-            y=alt.Y("burnout_risk_score:Q", title="Burnout risk score"),
-            color=alt.Color(
-                "ai_band:N",
-                title="AI usage band",
-                scale=ai_band_scale(),
-            ),
-            tooltip=[
-                "job_role:N",
-                "ai_band:N",
-                "productivity_score:Q",
-                "burnout_risk_score:Q",
-            ],
+    else:
+        chart = (
+            alt.Chart(frame.data)
+            .transform_calculate(
+                # jitter: small random noise
+                jitter_x="datum.productivity_score + (random() - 0.5) * 2",
+                jitter_y="datum.burnout_risk_score + (random() - 0.5) * 0.5",
+            )
+            .mark_circle(opacity=0.25, size=40)
+            .encode(
+                x=alt.X("productivity_score:Q", title="Productivity score"),
+                y=alt.Y("burnout_risk_score:Q", title="Burnout risk score"),
+                color=alt.Color(
+                    "ai_band:N",
+                    title="AI usage band",
+                    scale=ai_band_scale(),
+                ),
+                tooltip=[
+                    "job_role:N",
+                    "ai_band:N",
+                    "productivity_score:Q",
+                    "burnout_risk_score:Q",
+                ],
+            )
+            .properties(height=height)
         )
-        .properties(height=height)
-    )
-    
 
     vline = (
         alt.Chart(
@@ -311,4 +651,20 @@ def make_productivity_vs_burnout_chart(
         )
     )
 
-    return (chart + vline + hline).resolve_scale(color="independent")
\ No newline at end of file
+    shown_label = alt.param(
+        name=SHOWN_LABEL_PARAM, value=frame.params[SHOWN_LABEL_PARAM]
+    )
+    return (
+        (chart + vline + hline)
+        .add_params(shown_label)
+        .resolve_scale(color="independent")
+        .properties(
+            title=alt.TitleParams(
+                alt.ExprRef(SHOWN_LABEL_PARAM),
+                anchor="start",
+                fontSize=11,
+                fontWeight="normal",
+                color=COLORS["dark_brown"],
+            )
+        )
+    )
\ No newline at end of file
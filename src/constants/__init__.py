@@ -4,17 +4,25 @@
 from .paths import (
     PROJECT_ROOT,
     DATA_RAW_DIR,
+    DATA_PROCESSED_DIR,
+    DATA_CACHE_DIR,
     IMG_DIR,
     REPORTS_DIR,
     FEATURES_PATH,
     TARGETS_PATH,
+    PARQUET_PATH,
+    SNAPSHOT_META_PATH,
 )
 
 __all__ = [
     "PROJECT_ROOT",
     "DATA_RAW_DIR",
+    "DATA_PROCESSED_DIR",
+    "DATA_CACHE_DIR",
     "IMG_DIR",
     "REPORTS_DIR",
     "FEATURES_PATH",
     "TARGETS_PATH",
+    "PARQUET_PATH",
+    "SNAPSHOT_META_PATH",
 ]
@@ -5,9 +5,19 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]  # repo root
 DATA_RAW_DIR = PROJECT_ROOT / "data" / "raw"
+DATA_PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+DATA_CACHE_DIR = PROJECT_ROOT / "data" / "cache"
 IMG_DIR = PROJECT_ROOT / "img"
 REPORTS_DIR = PROJECT_ROOT / "reports"
 
 FEATURES_PATH = DATA_RAW_DIR / "ai_productivity_features.csv"
 TARGETS_PATH = DATA_RAW_DIR / "ai_productivity_targets.csv"
-PARQUET_PATH = Path("data/processed/ai_productivity.parquet")
\ No newline at end of file
+RAW_SOURCE_PATHS = (FEATURES_PATH, TARGETS_PATH)
+PARQUET_PATH = DATA_PROCESSED_DIR / "ai_productivity.parquet"
+SNAPSHOT_META_PATH = DATA_PROCESSED_DIR / "ai_productivity.meta.json"
+ARROW_PATH = DATA_PROCESSED_DIR / "ai_productivity.arrow"
+PARTITIONED_DIR = DATA_PROCESSED_DIR / "ai_productivity_parts"
+APPENDS_DIR = DATA_PROCESSED_DIR / "appends"
+BANDS_PATH = DATA_PROCESSED_DIR / "bands.json"
+DUCKDB_PATH = DATA_PROCESSED_DIR / "ai_productivity.duckdb"
+CUBE_PATH = DATA_PROCESSED_DIR / "ai_productivity.cube.npz"
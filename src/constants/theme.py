@@ -1,5 +1,7 @@
 # src/constants/theme.py
-import altair as alt
+
+# altair is imported inside the scale helpers so that importing the palette
+# does not load the plotting stack.
 
 COLORS = {
     "bg_sidebar": "#E6C9AD",
@@ -13,18 +15,24 @@ COLORS = {
 }
 
 def deadline_scale():
+    import altair as alt
+
     return alt.Scale(
         domain=["Low", "Medium", "High"],
         range=[COLORS["light_orange"], COLORS["medium_brown"], COLORS["dark_brown"]],
     )
 
 def ai_band_scale():
+    import altair as alt
+
     return alt.Scale(
         domain=["Low", "Medium", "High"],
         range=[COLORS["light_orange"], COLORS["medium_brown"], COLORS["dark_brown"]],
     )
 
 def hours_breakdown_scale():
+    import altair as alt
+
     return alt.Scale(
         domain=["Meetings", "Collaboration", "Deep work", "Manual work"],
         range=[
@@ -0,0 +1,645 @@
+# src/cube.py
+
+"""Pre-aggregated data cube answering dashboard KPIs without touching rows."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+import pandas as pd
+
+from src.aggregates import HOURS_CATEGORIES, summarize_dashboard
+from src.constants.paths import CUBE_PATH
+from src.filters import CATEGORY_FILTER_COLUMNS, RANGE_FILTER_COLUMNS, FilterSpec
+from src.sketch import DEFAULT_K, KLLSketch
+
+# Width of the numeric bins per slider filter. Slider bounds that fall on a
+# bin edge are answered from the cube; any other bound falls back to rows.
+DEFAULT_BIN_STEPS: dict[str, float] = {
+    "experience": 1,
+    "ai_usage": 5,
+    "manual_hours": 5,
+    "tasks_automated": 10,
+}
+
+# Columns summed per cell; means are sum / non-missing count.
+SUM_COLUMNS = [
+    "burnout_risk_score",
+    "meeting_hours_per_week",
+    "collaboration_hours_per_week",
+    "focus_hours_per_day",
+    "manual_work_hours_per_week",
+]
+
+# In approximate mode, selections up to this many employees still get
+# exact medians from their rows.
+EXACT_MEDIAN_ROWS = 10_000
+
+# Summary key -> column kept as a quantile sketch per cell.
+SKETCH_COLUMNS: dict[str, str] = {
+    "median_productivity": "productivity_score",
+    "median_burnout": "burnout_risk_score",
+    "median_wlb": "work_life_balance_score",
+}
+
+
+def bin_edges(lo: float, hi: float, step: float) -> np.ndarray:
+    """
+    Bin edges from ``lo`` to ``hi`` every ``step``, always including ``hi``.
+
+    Parameters
+    ----------
+    lo, hi : float
+        Slider minimum and maximum.
+    step : float
+        Bin width.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted float64 edges.
+    """
+    return np.unique(np.append(np.arange(lo, hi, step, dtype=np.float64), hi))
+
+
+def bin_codes(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Assign values to the bins around ``edges``.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Column values.
+    edges : numpy.ndarray
+        Output of :func:`bin_edges`.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``int16`` codes: ``2 * i + 1`` for a value equal to ``edges[i]``,
+        ``2 * i`` for one strictly between ``edges[i - 1]`` and
+        ``edges[i]`` (``0`` below the first edge, ``2 * len(edges)`` above
+        the last) and ``-1`` for missing values. Because edges get bins of
+        their own, an inclusive range between two edges is exactly a run
+        of consecutive codes.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    pos = np.searchsorted(edges, values, side="left")
+    on_edge = edges[np.minimum(pos, len(edges) - 1)] == values
+    codes = (2 * pos + on_edge).astype(np.int16)
+    codes[np.isnan(values)] = -1
+    return codes
+
+
+def _encode_rows(
+    df: pd.DataFrame,
+    categories: Mapping[str, list[str]],
+    edges: Mapping[str, np.ndarray],
+) -> dict[str, np.ndarray]:
+    """Cube coordinates of every row: category codes and slider bin codes."""
+    codes = {}
+    for field, col in CATEGORY_FILTER_COLUMNS.items():
+        labels = df[col].astype("string")
+        codes[field] = pd.Categorical(labels, categories=categories[field]).codes.astype(np.int16)
+    for field, col in RANGE_FILTER_COLUMNS.items():
+        codes[field] = bin_codes(df[col].to_numpy(), edges[field])
+    return codes
+
+
+def _cell_keys(
+    codes: Mapping[str, np.ndarray],
+    categories: Mapping[str, list[str]],
+    edges: Mapping[str, np.ndarray],
+) -> np.ndarray:
+    """Mixed-radix key over all dimensions; +1 makes room for missing (-1)."""
+    key = np.zeros(len(next(iter(codes.values()))), dtype=np.int64)
+    for field, field_codes in codes.items():
+        if field in categories:
+            size = len(categories[field])
+        else:
+            size = 2 * len(edges[field]) + 1
+        key = key * (size + 1) + (field_codes.astype(np.int64) + 1)
+    return key
+
+
+# Returned by DataCube._median when an exact answer needs unattached rows.
+_NEEDS_ROWS = object()
+
+
+class DataCube:
+    """
+    Sparse cube of the employee table over the sidebar filter dimensions.
+
+    One cell per non-empty combination of job role, AI band, deadline
+    pressure and the binned slider columns. Each cell holds its row count,
+    the number of high-burnout employees, sums and non-missing counts of
+    ``SUM_COLUMNS`` and a KLL sketch of each ``SKETCH_COLUMNS`` metric.
+
+    Parameters
+    ----------
+    categories : Mapping[str, list[str]]
+        Labels per categorical filter field, indexed by cell code.
+    edges : Mapping[str, numpy.ndarray]
+        Bin edges per slider filter field.
+    cells : Mapping[str, numpy.ndarray]
+        Columnar cell table: one code array per filter field plus
+        ``count``, ``high_burnout``, ``sum__<col>`` and ``n__<col>``.
+    sketches : Mapping[str, tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]
+        Per sketched column, the flattened items, their levels and the
+        offsets of each cell's items.
+    k : int, default=DEFAULT_K
+        Sketch size used when cells are merged.
+
+    Notes
+    -----
+    Counts, shares and means are exact. Medians are exact while every
+    selected cell still holds all of its values, which is the case for
+    cells with at most ``k`` employees; otherwise they come from the merged
+    sketches, within :func:`src.sketch.rank_error_bound`. Answering a
+    query costs one pass over the cells, independent of the number of
+    employees.
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, list[str]],
+        edges: Mapping[str, np.ndarray],
+        cells: Mapping[str, np.ndarray],
+        sketches: Mapping[str, tuple[np.ndarray, np.ndarray, np.ndarray]],
+        k: int = DEFAULT_K,
+    ) -> None:
+        self.categories = dict(categories)
+        self.edges = dict(edges)
+        self.cells = dict(cells)
+        self.sketches = dict(sketches)
+        self.k = k
+        self._item_cells = {
+            col: np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+            for col, (_, _, offsets) in self.sketches.items()
+        }
+        # Row-level columns, filled in by attach().
+        self._rows: dict[str, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.cells["count"])
+
+    @classmethod
+    def build(
+        cls,
+        df: pd.DataFrame,
+        slider_ranges: Mapping[str, tuple[float, float]],
+        bin_steps: Mapping[str, float] = DEFAULT_BIN_STEPS,
+        k: int = DEFAULT_K,
+    ) -> DataCube:
+        """
+        Aggregate ``df`` into a cube.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Preprocessed dashboard dataset.
+        slider_ranges : Mapping[str, tuple[float, float]]
+            Slider minimum and maximum per field, as returned by
+            :func:`src.data.get_slider_ranges`; bin edges start at the
+            minimum and include the maximum so the default view aligns.
+        bin_steps : Mapping[str, float], default=DEFAULT_BIN_STEPS
+            Bin width per slider field.
+        k : int, default=DEFAULT_K
+            Sketch size per cell.
+
+        Returns
+        -------
+        DataCube
+            Cube with one cell per non-empty combination.
+        """
+        categories = {
+            field: df[col].astype("category").cat.categories.astype(str).tolist()
+            for field, col in CATEGORY_FILTER_COLUMNS.items()
+        }
+        edges = {
+            field: bin_edges(*slider_ranges[field], bin_steps[field])
+            for field in RANGE_FILTER_COLUMNS
+        }
+        row_codes = _encode_rows(df, categories, edges)
+        keys, first, cell_of_row = np.unique(
+            _cell_keys(row_codes, categories, edges), return_index=True, return_inverse=True
+        )
+        n_cells = len(keys)
+
+        cells = {field: codes[first] for field, codes in row_codes.items()}
+        cells["key"] = keys
+        cells["count"] = np.bincount(cell_of_row, minlength=n_cells)
+        high = (df["burnout_risk_level"].astype(str) == "High").to_numpy()
+        cells["high_burnout"] = np.bincount(cell_of_row[high], minlength=n_cells)
+        for col in SUM_COLUMNS:
+            values = df[col].to_numpy(dtype=np.float64)
+            present = ~np.isnan(values)
+            cells[f"sum__{col}"] = np.bincount(
+                cell_of_row[present], weights=values[present], minlength=n_cells
+            )
+            cells[f"n__{col}"] = np.bincount(cell_of_row[present], minlength=n_cells)
+
+        sketches = {
+            col: _cell_sketches(df[col].to_numpy(dtype=np.float64), cell_of_row, n_cells, k)
+            for col in dict.fromkeys(SKETCH_COLUMNS.values())
+        }
+        cube = cls(categories, edges, cells, sketches, k)
+        cube._attach_rows(df, cell_of_row, row_codes["job_role"])
+        return cube
+
+    @property
+    def attached(self) -> bool:
+        """True when the cube can read the rows it was built from."""
+        return self._rows is not None
+
+    def attach(self, df: pd.DataFrame) -> None:
+        """
+        Give a loaded cube access to the rows it was built from.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The dataset the cube was built from, e.g. the snapshot of the
+            same revision.
+
+        Raises
+        ------
+        ValueError
+            If a row falls in a cell the cube does not have.
+
+        Notes
+        -----
+        Needed for exact medians of cells that were compacted into
+        sketches and for approximate answers to unaligned slider bounds.
+        :meth:`build` attaches the frame it aggregates.
+        """
+        row_codes = _encode_rows(df, self.categories, self.edges)
+        keys = _cell_keys(row_codes, self.categories, self.edges)
+        cell_of_row = np.searchsorted(self.cells["key"], keys)
+        found = cell_of_row < len(self)
+        found[found] = self.cells["key"][cell_of_row[found]] == keys[found]
+        if not found.all():
+            raise ValueError("The frame does not match the rows this cube was built from.")
+        self._attach_rows(df, cell_of_row, row_codes["job_role"])
+
+    def _attach_rows(
+        self,
+        df: pd.DataFrame,
+        cell_of_row: np.ndarray,
+        role_codes: np.ndarray,
+    ) -> None:
+        columns = dict.fromkeys(
+            [*RANGE_FILTER_COLUMNS.values(), *SUM_COLUMNS, *SKETCH_COLUMNS.values()]
+        )
+        self._rows = {col: df[col].to_numpy() for col in columns}
+        self._rows["job_role"] = role_codes
+        self._rows["high_burnout"] = (df["burnout_risk_level"].astype(str) == "High").to_numpy()
+        self._row_order = np.argsort(cell_of_row, kind="stable")
+        self._row_offsets = np.searchsorted(cell_of_row[self._row_order], np.arange(len(self) + 1))
+
+    def _rows_of(self, mask: np.ndarray) -> np.ndarray:
+        """Row ids of the cells in ``mask``."""
+        starts = self._row_offsets[:-1][mask]
+        sizes = self._row_offsets[1:][mask] - starts
+        total = int(sizes.sum())
+        # Position within the selected rows, shifted to each cell's start.
+        shift = np.repeat(starts - (np.cumsum(sizes) - sizes), sizes)
+        return self._row_order[np.arange(total) + shift]
+
+    def classify_cells(self, spec: FilterSpec) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Split the cells by how ``spec`` covers them.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Sidebar filters.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            Boolean masks over cells: ``full`` cells lie entirely inside
+            every filter; ``partial`` cells sit in a slider bin that a bound
+            cuts through, so only some of their rows match.
+        """
+        selected = np.ones(len(self), dtype=bool)
+        for field in CATEGORY_FILTER_COLUMNS:
+            labels = getattr(spec, field)
+            if labels is None:
+                continue
+            keep = np.isin(self.categories[field], list(labels))
+            selected &= np.append(keep, False)[self.cells[field]]
+
+        full = selected.copy()
+        candidate = selected.copy()
+        for field in RANGE_FILTER_COLUMNS:
+            bounds = getattr(spec, field)
+            if bounds is None:
+                continue
+            lo_code, hi_code = bin_codes(np.asarray(bounds, dtype=np.float64), self.edges[field])
+            # Odd codes are edges; a bound inside an open (even) bin cuts it.
+            first = lo_code if lo_code % 2 else lo_code + 1
+            last = hi_code if hi_code % 2 else hi_code - 1
+            codes = self.cells[field]
+            inside = (codes >= first) & (codes <= last)
+            cut = [c for c in {lo_code, hi_code} if c % 2 == 0 and lo_code <= c <= hi_code]
+            full &= inside
+            candidate &= inside | np.isin(codes, cut)
+        return full, candidate & ~full
+
+    def cell_mask(self, spec: FilterSpec) -> np.ndarray | None:
+        """
+        Cells selected by ``spec``.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Sidebar filters.
+
+        Returns
+        -------
+        numpy.ndarray | None
+            Boolean mask over cells, or None when a slider bound cuts
+            through a non-empty bin and the cells alone cannot answer.
+        """
+        full, partial = self.classify_cells(spec)
+        return None if partial.any() else full
+
+    def summarize(
+        self,
+        spec: FilterSpec,
+        *,
+        approximate: bool = False,
+        exact_below: int = EXACT_MEDIAN_ROWS,
+    ) -> dict[str, Any] | None:
+        """
+        Answer the dashboard summary for ``spec`` from the cube.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Sidebar filters.
+        approximate : bool, default=False
+            Allow medians from merged sketches and answer unaligned slider
+            bounds by scanning only the rows of the cells they cut.
+        exact_below : int, default=EXACT_MEDIAN_ROWS
+            In approximate mode, selections of at most this many employees
+            still get exact medians.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            Same keys and shapes as :func:`src.aggregates.summarize_dashboard`,
+            or None when the cube cannot answer as asked: unaligned bounds
+            in exact mode, or exact medians of compacted cells without
+            :meth:`attach`.
+
+        Notes
+        -----
+        Counts, shares and means are always exact. In approximate mode a
+        median's rank is within :func:`src.sketch.rank_error_bound` of the
+        true median's, and the work no longer grows with the number of
+        selected employees, only with the cells and the rows of cut cells.
+        """
+        full, partial = self.classify_cells(spec)
+        if partial.any() and not (approximate and self.attached):
+            return None
+
+        agg_keys = ["job_role", "count", "high_burnout"]
+        agg_keys += [f"{kind}__{col}" for col in SUM_COLUMNS for kind in ("sum", "n")]
+        cells = {name: self.cells[name][full] for name in agg_keys}
+        rows = np.empty(0, dtype=np.int64)
+        if partial.any():
+            rows = self._rows_of(partial)
+            rows = rows[self._range_mask(spec, rows)]
+            row_cells = self._row_cells(rows)
+            cells = {name: np.concatenate([cells[name], row_cells[name]]) for name in agg_keys}
+
+        row_count = int(cells["count"].sum())
+        if row_count == 0:
+            return summarize_dashboard(pd.DataFrame())
+
+        def mean(col: str) -> float:
+            n = cells[f"n__{col}"].sum()
+            return float(cells[f"sum__{col}"].sum() / n) if n else float("nan")
+
+        summary = {"row_count": row_count}
+        use_sketches = approximate and row_count > exact_below
+        for key, col in SKETCH_COLUMNS.items():
+            median = self._median(col, full, rows, use_sketches)
+            if median is _NEEDS_ROWS:
+                return None
+            summary[key] = median
+        summary["high_burnout_share"] = float(cells["high_burnout"].sum() / row_count)
+        summary["burnout_by_role"] = self._burnout_by_role(cells)
+        summary["hours_breakdown"] = pd.DataFrame(
+            {
+                "category": HOURS_CATEGORIES,
+                "hours": [
+                    mean("meeting_hours_per_week"),
+                    mean("collaboration_hours_per_week"),
+                    5.0 * mean("focus_hours_per_day"),
+                    mean("manual_work_hours_per_week"),
+                ],
+            }
+        )
+        return summary
+
+    def _range_mask(self, spec: FilterSpec, rows: np.ndarray) -> np.ndarray:
+        """Slider filters on ``rows``; their cells already match the categories."""
+        mask = np.ones(len(rows), dtype=bool)
+        for field, col in RANGE_FILTER_COLUMNS.items():
+            bounds = getattr(spec, field)
+            if bounds is None:
+                continue
+            # float64 bounds promote float32 columns, as in FilterSpec.to_mask.
+            values = self._rows[col][rows]
+            mask &= (values >= np.float64(bounds[0])) & (values <= np.float64(bounds[1]))
+        return mask
+
+    def _row_cells(self, rows: np.ndarray) -> dict[str, np.ndarray]:
+        """Single rows shaped like cells, so they aggregate with them."""
+        out = {
+            "job_role": self._rows["job_role"][rows],
+            "count": np.ones(len(rows), dtype=np.int64),
+            "high_burnout": self._rows["high_burnout"][rows].astype(np.int64),
+        }
+        for col in SUM_COLUMNS:
+            values = self._rows[col][rows].astype(np.float64)
+            present = ~np.isnan(values)
+            out[f"sum__{col}"] = np.where(present, values, 0.0)
+            out[f"n__{col}"] = present.astype(np.int64)
+        return out
+
+    def _median(
+        self,
+        col: str,
+        full: np.ndarray,
+        rows: np.ndarray,
+        use_sketches: bool,
+    ) -> float | None | object:
+        values, levels, _ = self.sketches[col]
+        keep = full[self._item_cells[col]]
+        values, levels = values[keep], levels[keep]
+        if len(rows):
+            extra = self._rows[col][rows].astype(np.float64)
+            extra = extra[~np.isnan(extra)]
+            values = np.concatenate([values, extra])
+            levels = np.concatenate([levels, np.zeros(len(extra), dtype=np.uint8)])
+        if len(values) == 0:
+            return None
+        if not levels.any():
+            # Every selected cell kept all of its values.
+            return float(np.median(values))
+        if use_sketches:
+            return KLLSketch.from_items(values, levels, self.k, seed=0).median()
+        if not self.attached:
+            return _NEEDS_ROWS
+        exact = self._rows[col][np.concatenate([self._rows_of(full), rows])].astype(np.float64)
+        exact = exact[~np.isnan(exact)]
+        return float(np.median(exact)) if len(exact) else None
+
+    def _burnout_by_role(self, cells: Mapping[str, np.ndarray]) -> pd.DataFrame:
+        roles = cells["job_role"]
+        known = roles >= 0
+        n_roles = len(self.categories["job_role"])
+        sums = np.bincount(
+            roles[known],
+            weights=cells["sum__burnout_risk_score"][known],
+            minlength=n_roles,
+        )
+        counts = np.bincount(
+            roles[known],
+            weights=cells["n__burnout_risk_score"][known],
+            minlength=n_roles,
+        )
+        present = counts > 0
+        return (
+            pd.DataFrame(
+                {
+                    "job_role": np.asarray(self.categories["job_role"])[present],
+                    "avg_burnout": sums[present] / counts[present],
+                }
+            )
+            .sort_values("avg_burnout", ascending=False)
+            .reset_index(drop=True)
+        )
+
+    def save(self, revision: str, path: Path = CUBE_PATH) -> None:
+        """
+        Write the cube to a compressed ``.npz`` file.
+
+        Parameters
+        ----------
+        revision : str
+            Snapshot revision the cube was built from.
+        path : pathlib.Path, default=CUBE_PATH
+            Destination file.
+        """
+        meta = {
+            "revision": revision,
+            "k": self.k,
+            "categories": self.categories,
+            "sketch_columns": list(self.sketches),
+        }
+        arrays = {f"edges__{field}": edges for field, edges in self.edges.items()}
+        arrays.update({f"cell__{name}": values for name, values in self.cells.items()})
+        for col, (values, levels, offsets) in self.sketches.items():
+            arrays[f"sketch_values__{col}"] = values
+            arrays[f"sketch_levels__{col}"] = levels
+            arrays[f"sketch_offsets__{col}"] = offsets
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp, meta=np.array(json.dumps(meta)), **arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, revision: str | None = None, path: Path = CUBE_PATH) -> DataCube | None:
+        """
+        Read a cube written by :meth:`save`.
+
+        Parameters
+        ----------
+        revision : str | None, default=None
+            Expected snapshot revision. If given and the cube was built for
+            a different revision, None is returned.
+        path : pathlib.Path, default=CUBE_PATH
+            Location of the cube file.
+
+        Returns
+        -------
+        DataCube | None
+            The cube, or None if the file is missing, unreadable or outdated.
+        """
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None
+
+        meta = json.loads(str(arrays.pop("meta")))
+        if revision is not None and meta["revision"] != revision:
+            return None
+
+        def strip(prefix: str) -> dict[str, np.ndarray]:
+            return {
+                name[len(prefix):]: values
+                for name, values in arrays.items()
+                if name.startswith(prefix)
+            }
+
+        values, levels, offsets = (
+            strip("sketch_values__"),
+            strip("sketch_levels__"),
+            strip("sketch_offsets__"),
+        )
+        sketches = {
+            col: (values[col], levels[col], offsets[col]) for col in meta["sketch_columns"]
+        }
+        return cls(meta["categories"], strip("edges__"), strip("cell__"), sketches, meta["k"])
+
+
+def _cell_sketches(
+    values: np.ndarray,
+    cell_of_row: np.ndarray,
+    n_cells: int,
+    k: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flattened per-cell sketches of one column.
+
+    Cells with at most ``k`` values keep them all; larger cells are
+    compacted into a :class:`~src.sketch.KLLSketch`.
+    """
+    present = ~np.isnan(values)
+    cell_of_row, values = cell_of_row[present], values[present]
+    order = np.argsort(cell_of_row, kind="stable")
+    sorted_cells, sorted_values = cell_of_row[order], values[order]
+    bounds = np.searchsorted(sorted_cells, np.arange(n_cells + 1))
+
+    sizes = np.diff(bounds)
+
+    # Small cells are kept verbatim as runs of the sorted values; only the
+    # large ones go through a sketch.
+    pieces, levels, start = [], [], 0
+    for cell in np.flatnonzero(sizes > k):
+        pieces.append(sorted_values[bounds[start]:bounds[cell]])
+        levels.append(np.zeros(bounds[cell] - bounds[start], dtype=np.uint8))
+        sketch = KLLSketch(k, seed=int(cell))
+        sketch.update(sorted_values[bounds[cell]:bounds[cell + 1]])
+        items, item_levels = sketch.items()
+        pieces.append(items)
+        levels.append(item_levels)
+        sizes[cell] = len(items)
+        start = cell + 1
+    pieces.append(sorted_values[bounds[start]:])
+    levels.append(np.zeros(len(sorted_values) - bounds[start], dtype=np.uint8))
+
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    return np.concatenate(pieces), np.concatenate(levels), offsets
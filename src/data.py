@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any
+import uuid
+from pathlib import Path
+from typing import Any, Iterable
 
 import pandas as pd
-
-import duckdb
+import pyarrow as pa
 
 from src.constants.paths import FEATURES_PATH, TARGETS_PATH
 
-from src.constants.paths import PARQUET_PATH 
-
 
 DEADLINE_PRESSURE_MAP: dict[str, int] = {
     "Low": 1,
@@ -19,14 +18,65 @@ DEADLINE_PRESSURE_MAP: dict[str, int] = {
     "High": 3,
 }
 
+LEVELS = ["Low", "Medium", "High"]
+
+WORKLOAD_BAND_LABELS = ["Low", "Medium", "High"]
+AI_BAND_LABELS = ["Low", "Moderate", "High"]
+
+TERCILES = (0.0, 1 / 3, 2 / 3, 1.0)
+
+# Columns cut into terciles, mapped to (band column, labels).
+BANDED_COLUMNS: dict[str, tuple[str, list[str]]] = {
+    "workload_score": ("workload_band", WORKLOAD_BAND_LABELS),
+    "ai_tool_usage_hours_per_week": ("ai_band", AI_BAND_LABELS),
+}
+
+# Compact per-column dtypes applied at load. Scores and hours carry at most
+# two decimals over ranges below 100, which float32 represents exactly enough
+# for medians, means, and integer slider bounds.
+COMPACT_SCHEMA: dict[str, Any] = {
+    "job_role": "category",
+    "deadline_pressure_level": pd.CategoricalDtype(LEVELS, ordered=True),
+    "burnout_risk_level": pd.CategoricalDtype(LEVELS, ordered=True),
+    "experience_years": "int8",
+    "task_complexity_score": "int8",
+    "ai_tool_usage_hours_per_week": "float32",
+    "tasks_automated_percent": "float32",
+    "manual_work_hours_per_week": "float32",
+    "learning_time_hours_per_week": "float32",
+    "meeting_hours_per_week": "float32",
+    "collaboration_hours_per_week": "float32",
+    "error_rate_percent": "float32",
+    "focus_hours_per_day": "float32",
+    "work_life_balance_score": "float32",
+    "burnout_risk_score": "float32",
+    "productivity_score": "float32",
+    "workload_score": "float32",
+}
+
+EMPLOYEE_ID_DTYPE = pd.ArrowDtype(pa.binary())
+
+# Decimals of the float columns in the source CSVs.
+SOURCE_DECIMALS = 2
+
 
-def load_dashboard_data() -> pd.DataFrame:
+def load_dashboard_data(
+    features_path: Path | None = None,
+    targets_path: Path | None = None,
+) -> pd.DataFrame:
     """
     Load, merge, and preprocess the dashboard dataset.
 
     The function reads the feature and target CSV files, merges them on
     ``Employee_ID``, and creates derived columns used throughout the app.
 
+    Parameters
+    ----------
+    features_path : pathlib.Path | None, default=None
+        Raw features CSV; ``FEATURES_PATH`` when None.
+    targets_path : pathlib.Path | None, default=None
+        Raw targets CSV; ``TARGETS_PATH`` when None.
+
     Returns
     -------
     pandas.DataFrame
@@ -40,32 +90,205 @@ def load_dashboard_data() -> pd.DataFrame:
     - ``workload_band``
     - ``ai_band``
     """
-    features = pd.read_csv(FEATURES_PATH)
-    targets = pd.read_csv(TARGETS_PATH)
+    features = pd.read_csv(FEATURES_PATH if features_path is None else features_path)
+    targets = pd.read_csv(TARGETS_PATH if targets_path is None else targets_path)
 
     df = features.merge(targets, on="Employee_ID")
 
-    df["workload_score"] = (
-        df["manual_work_hours_per_week"]
-        + df["meeting_hours_per_week"]
-        + df["deadline_pressure_level"].map(DEADLINE_PRESSURE_MAP)
-    )
+    df = add_workload_score(df)
 
     df["workload_band"] = pd.qcut(
         df["workload_score"],
         q=3,
-        labels=["Low", "Medium", "High"],
+        labels=WORKLOAD_BAND_LABELS,
     )
 
     df["ai_band"] = pd.qcut(
         df["ai_tool_usage_hours_per_week"],
         q=3,
-        labels=["Low", "Moderate", "High"],
+        labels=AI_BAND_LABELS,
     )
 
+    return apply_compact_schema(df)
+
+
+def add_workload_score(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the ``workload_score`` column to a frame of employee features.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame with manual work hours, meeting hours and deadline pressure.
+
+    Returns
+    -------
+    pandas.DataFrame
+        ``df`` with ``workload_score`` added in place.
+    """
+    df["workload_score"] = (
+        df["manual_work_hours_per_week"]
+        + df["meeting_hours_per_week"]
+        + df["deadline_pressure_level"].map(DEADLINE_PRESSURE_MAP)
+    )
     return df
 
 
+def encode_employee_ids(ids: pd.Series) -> pd.Series:
+    """
+    Encode UUID employee IDs as 16-byte binary values.
+
+    Parameters
+    ----------
+    ids : pandas.Series
+        Employee IDs in canonical 36-character UUID form.
+
+    Returns
+    -------
+    pandas.Series
+        Binary-encoded IDs, or ``ids`` unchanged if any value is not a UUID.
+    """
+    if ids.empty or ids.dtype == EMPLOYEE_ID_DTYPE or ids.isna().any():
+        return ids
+
+    hexes = ids.astype(str).str.replace("-", "", regex=False)
+    if not hexes.str.fullmatch(r"[0-9a-fA-F]{32}").all():
+        return ids
+
+    raw = bytes.fromhex("".join(hexes.tolist()))
+    array = pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(16), len(ids), [None, pa.py_buffer(raw)]
+    ).cast(pa.binary())
+    return pd.Series(array, index=ids.index, name=ids.name, dtype=EMPLOYEE_ID_DTYPE)
+
+
+def decode_employee_ids(ids: pd.Series) -> pd.Series:
+    """
+    Convert binary employee IDs back to canonical UUID strings.
+
+    Parameters
+    ----------
+    ids : pandas.Series
+        Employee IDs as produced by :func:`encode_employee_ids`, or as bytes
+        returned from a SQL query over the encoded column.
+
+    Returns
+    -------
+    pandas.Series
+        IDs formatted as UUID strings. Non-binary values are left unchanged.
+    """
+    return ids.map(
+        lambda v: str(uuid.UUID(bytes=bytes(v)))
+        if isinstance(v, (bytes, bytearray)) and len(v) == 16
+        else v
+    )
+
+
+def with_readable_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return ``df`` with ``Employee_ID`` decoded for display or download.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dashboard rows, possibly with binary-encoded employee IDs.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame whose ``Employee_ID`` column holds UUID strings.
+    """
+    if "Employee_ID" not in df.columns or df.empty:
+        return df
+    return df.assign(Employee_ID=decode_employee_ids(df["Employee_ID"]))
+
+
+def with_source_precision(df: pd.DataFrame, decimals: int = SOURCE_DECIMALS) -> pd.DataFrame:
+    """
+    Return ``df`` with its float32 columns as the source's decimal values.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dashboard rows in the compact schema.
+    decimals : int, default=SOURCE_DECIMALS
+        Decimals to round to.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame whose float32 columns are float64 rounded to ``decimals``, so
+        a value stored as 0.10000000149011612 reads 0.1 again. Other columns
+        are shared with ``df``.
+
+    Notes
+    -----
+    Use it for frames shown as text, e.g. to QueryChat, whose schema
+    description and query results would otherwise carry float32 noise.
+    """
+    floats = df.select_dtypes("float32").columns
+    if floats.empty:
+        return df
+    return df.assign(**{col: df[col].astype("float64").round(decimals) for col in floats})
+
+
+def apply_compact_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast the dashboard dataset to its compact in-memory schema.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Merged dashboard dataset with derived columns.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame using ``COMPACT_SCHEMA`` dtypes and binary-encoded employee IDs.
+        Columns missing from ``df`` are skipped.
+    """
+    dtypes = {col: dtype for col, dtype in COMPACT_SCHEMA.items() if col in df.columns}
+    df = df.astype(dtypes)
+
+    if "Employee_ID" in df.columns:
+        df["Employee_ID"] = encode_employee_ids(df["Employee_ID"])
+
+    return df
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize the in-memory footprint of each column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset to inspect.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per column with ``dtype``, ``bytes`` and ``bytes_per_row``,
+        sorted from largest to smallest, followed by a ``TOTAL`` row.
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    rows = max(len(df), 1)
+
+    report = pd.DataFrame(
+        {
+            "column": usage.index,
+            "dtype": [str(df[col].dtype) for col in usage.index],
+            "bytes": usage.to_numpy(),
+        }
+    ).sort_values("bytes", ascending=False, ignore_index=True)
+
+    total = pd.DataFrame({"column": ["TOTAL"], "dtype": [""], "bytes": [usage.sum()]})
+    report = pd.concat([report, total], ignore_index=True)
+    report["bytes_per_row"] = report["bytes"] / rows
+
+    return report
+
+
 def get_filter_choices(df: pd.DataFrame) -> dict[str, list[Any]]:
     """
     Build sidebar filter choices from the preprocessed dataset.
@@ -144,4 +367,162 @@ def get_baselines(df: pd.DataFrame) -> dict[str, float]:
         "median_productivity": float(df["productivity_score"].median()),
         "median_wlb": float(df["work_life_balance_score"].median()),
         "high_burnout_rate": float((df["burnout_risk_level"] == "High").mean()),
-    }
\ No newline at end of file
+    }
+
+
+# Slider input name -> column, in the order of get_slider_ranges.
+SLIDER_COLUMNS: dict[str, str] = {
+    "experience": "experience_years",
+    "ai_usage": "ai_tool_usage_hours_per_week",
+    "manual_hours": "manual_work_hours_per_week",
+    "tasks_automated": "tasks_automated_percent",
+}
+
+# Baseline name -> column whose median it is.
+BASELINE_MEDIAN_COLUMNS: dict[str, str] = {
+    "median_burnout": "burnout_risk_score",
+    "median_productivity": "productivity_score",
+    "median_wlb": "work_life_balance_score",
+}
+
+# Filter choice key -> label column, and whether "All" is offered.
+CHOICE_COLUMNS: dict[str, tuple[str, bool]] = {
+    "job_role_choices": ("job_role", True),
+    "ai_band_choices": ("ai_band", True),
+    "deadline_choices": ("deadline_pressure_level", False),
+}
+
+
+def dataset_summary_sql(table_name: str, columns: Iterable[str]) -> str:
+    """
+    One aggregate query returning every slider bound, baseline and choice list.
+
+    Parameters
+    ----------
+    table_name : str
+        Table or registered view holding the dashboard dataset.
+    columns : Iterable[str]
+        Columns of the table; statistics of absent columns are left out.
+
+    Returns
+    -------
+    str
+        SQL producing a single row; see :func:`summarize_dataset`.
+    """
+    columns = set(columns)
+    selects = []
+    for name, column in SLIDER_COLUMNS.items():
+        if column in columns:
+            selects.append(f"min({column}) AS {name}_min")
+            selects.append(f"max({column}) AS {name}_max")
+    for name, column in BASELINE_MEDIAN_COLUMNS.items():
+        if column in columns:
+            selects.append(f"median({column}) AS {name}")
+    if "burnout_risk_level" in columns:
+        selects.append(
+            "avg(CASE WHEN burnout_risk_level::VARCHAR = 'High' THEN 1.0 ELSE 0.0 END)"
+            " AS high_burnout_rate"
+        )
+    for name, (column, _) in CHOICE_COLUMNS.items():
+        if column in columns:
+            selects.append(f"list_sort(list(DISTINCT {column}::VARCHAR)) AS {name}")
+    return f"SELECT count(*) AS row_count, {', '.join(selects)} FROM {table_name}"
+
+
+def summarize_dataset(df: pd.DataFrame) -> dict[str, Any]:
+    """
+    Compute sidebar choices, slider ranges and baselines in one scan.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Preprocessed dashboard dataset.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``"filter_choices"``, ``"slider_ranges"`` and ``"baselines"``, equal
+        to :func:`get_filter_choices`, :func:`get_slider_ranges` and
+        :func:`get_baselines` of ``df``. The values are JSON-serialisable
+        apart from the range tuples, so the summary can be stored in the
+        snapshot sidecar; see :func:`summary_from_json`. Entries whose
+        column is absent from ``df`` are left out.
+
+    Notes
+    -----
+    DuckDB evaluates the min/max pairs, medians, rate and distinct-value
+    lists as one aggregate over the frame's column buffers, instead of a
+    separate pass per statistic.
+    """
+    import duckdb
+
+    con = duckdb.connect()
+    try:
+        con.register("dataset", df)
+        return summarize_table(con, "dataset")
+    finally:
+        con.close()
+
+
+def summarize_table(con, table_name: str) -> dict[str, Any]:
+    """
+    Compute sidebar choices, slider ranges and baselines of a DuckDB table.
+
+    Parameters
+    ----------
+    con : duckdb.DuckDBPyConnection
+        Connection on which ``table_name`` is visible.
+    table_name : str
+        Table or registered view holding the dashboard dataset.
+
+    Returns
+    -------
+    dict[str, Any]
+        Same entries as :func:`summarize_dataset`, computed by one query
+        without reading the rows into the process.
+    """
+    cursor = con.execute(f"SELECT * FROM {table_name} LIMIT 0")
+    columns = [col[0] for col in cursor.description]
+    cursor = con.execute(dataset_summary_sql(table_name, columns))
+    names = [col[0] for col in cursor.description]
+    row = dict(zip(names, cursor.fetchone()))
+
+    return {
+        "filter_choices": {
+            name: (["All"] if with_all else []) + list(row[name])
+            for name, (_, with_all) in CHOICE_COLUMNS.items()
+            if name in row
+        },
+        "slider_ranges": {
+            name: (int(row[f"{name}_min"]), int(row[f"{name}_max"]))
+            for name in SLIDER_COLUMNS
+            if f"{name}_min" in row
+        },
+        "baselines": {
+            name: float(row[name])
+            for name in [*BASELINE_MEDIAN_COLUMNS, "high_burnout_rate"]
+            if name in row
+        },
+    }
+
+
+def summary_from_json(summary: dict[str, Any]) -> dict[str, Any]:
+    """
+    Restore a :func:`summarize_dataset` result read back from JSON.
+
+    Parameters
+    ----------
+    summary : dict[str, Any]
+        Stored summary, whose slider ranges JSON turned into lists.
+
+    Returns
+    -------
+    dict[str, Any]
+        The summary with ``(min, max)`` tuples again.
+    """
+    return {
+        **summary,
+        "slider_ranges": {
+            name: (int(lo), int(hi)) for name, (lo, hi) in summary["slider_ranges"].items()
+        },
+    }
@@ -0,0 +1,329 @@
+# src/duckdb_store.py
+
+"""Persistent DuckDB copy of the dataset and a pool of prepared filter queries."""
+
+from __future__ import annotations
+
+import os
+import queue
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+import duckdb
+import pandas as pd
+
+from src.aggregates import (
+    BINNED_GRIDS,
+    SCATTER_COLUMNS,
+    binned_counts_sql,
+    dashboard_summary_sql,
+    scatter_sample_sql,
+)
+from src.constants.paths import DUCKDB_PATH
+from src.data import SOURCE_DECIMALS
+from src.filters import FilterSpec
+
+DEFAULT_TABLE = "ai_productivity"
+INFO_TABLE = "snapshot_info"
+
+
+def filter_statements(table_name: str = DEFAULT_TABLE) -> dict[str, str]:
+    """
+    SQL of the queries the dashboard runs for every filter state.
+
+    Parameters
+    ----------
+    table_name : str, default="ai_productivity"
+        Table holding the dataset.
+
+    Returns
+    -------
+    dict[str, str]
+        ``"summary"`` (one row of KPI values, chart aggregates and grid
+        ranges), ``"points"`` (the ``SCATTER_COLUMNS`` of matching
+        employees, run only when they fit the scatter's point budget),
+        ``"sample"`` (:func:`~src.aggregates.scatter_sample_sql`) and one
+        ``"<grid>_bins"`` query (:func:`~src.aggregates.binned_counts_sql`)
+        per entry of ``BINNED_GRIDS``. All take
+        :meth:`~src.filters.FilterSpec.sql_params` first; the text does
+        not depend on the filter values.
+    """
+    points_sql, _ = FilterSpec().to_sql(table_name, select=", ".join(SCATTER_COLUMNS))
+    statements = {
+        "summary": dashboard_summary_sql(table_name),
+        "points": points_sql,
+        "sample": scatter_sample_sql(table_name),
+    }
+    for grid, (x, y) in BINNED_GRIDS.items():
+        statements[f"{grid}_bins"] = binned_counts_sql(x, y, table_name)
+    return statements
+
+
+def build_duckdb_database(
+    df: pd.DataFrame,
+    revision: str,
+    db_path: Path = DUCKDB_PATH,
+    table_name: str = DEFAULT_TABLE,
+) -> None:
+    """
+    Write the dataset to a DuckDB database file.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Preprocessed dashboard dataset in its compact schema.
+    revision : str
+        Snapshot revision from the metadata sidecar, stored in the file so
+        readers can detect an outdated copy.
+    db_path : pathlib.Path, default=DUCKDB_PATH
+        Destination file.
+    table_name : str, default="ai_productivity"
+        Name of the employee table.
+
+    Notes
+    -----
+    The compact integer and float widths are kept; categorical columns are
+    stored as ``VARCHAR``, which DuckDB dictionary-compresses on disk.
+    Every column gets min/max zone maps, and ``ANALYZE`` refreshes the column
+    statistics the planner uses. The file is written under a temporary
+    name and moved into place, like the other snapshot artefacts.
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = db_path.with_name(f"{db_path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+
+    con = duckdb.connect(str(tmp))
+    try:
+        con.register("_snapshot", df)
+        con.execute(f"CREATE TABLE {table_name} AS SELECT * FROM _snapshot")
+        con.unregister("_snapshot")
+        con.execute(f"CREATE TABLE {INFO_TABLE} (revision VARCHAR)")
+        con.execute(f"INSERT INTO {INFO_TABLE} VALUES (?)", [revision])
+        con.execute("ANALYZE")
+        con.execute("CHECKPOINT")
+    finally:
+        con.close()
+    os.replace(tmp, db_path)
+
+
+def open_duckdb_database(
+    revision: str | None = None,
+    db_path: Path = DUCKDB_PATH,
+) -> duckdb.DuckDBPyConnection | None:
+    """
+    Open the persistent database read-only.
+
+    Parameters
+    ----------
+    revision : str | None, default=None
+        Expected snapshot revision. If given and the file was built for a
+        different revision, None is returned.
+    db_path : pathlib.Path, default=DUCKDB_PATH
+        Location of the database file.
+
+    Returns
+    -------
+    duckdb.DuckDBPyConnection | None
+        Read-only connection, or None if the file is missing, unreadable,
+        or outdated.
+    """
+    if not Path(db_path).exists():
+        return None
+    try:
+        con = duckdb.connect(str(db_path), read_only=True)
+        stored = con.execute(f"SELECT revision FROM {INFO_TABLE}").fetchone()
+    except duckdb.Error:
+        return None
+
+    if revision is not None and (stored is None or stored[0] != revision):
+        con.close()
+        return None
+    return con
+
+
+def create_source_precision_view(
+    con: duckdb.DuckDBPyConnection,
+    name: str,
+    table_name: str = DEFAULT_TABLE,
+    decimals: int = SOURCE_DECIMALS,
+) -> None:
+    """
+    Create a temporary view of a table with its floats as the source's values.
+
+    Parameters
+    ----------
+    con : duckdb.DuckDBPyConnection
+        Connection to the database holding ``table_name``; may be read-only.
+    name : str
+        Name of the view.
+    table_name : str, default="ai_productivity"
+        Table holding the dataset.
+    decimals : int, default=SOURCE_DECIMALS
+        Decimals to round to.
+
+    Notes
+    -----
+    The database counterpart of :func:`src.data.with_source_precision`:
+    ``FLOAT`` columns read as ``DOUBLE`` rounded to ``decimals``, so
+    QueryChat sees the source's values without the rows being copied into
+    the process.
+    """
+    floats = [
+        row[0]
+        for row in con.execute(
+            "SELECT column_name FROM duckdb_columns() "
+            "WHERE table_name = ? AND data_type = 'FLOAT'",
+            [table_name],
+        ).fetchall()
+    ]
+    select = "*"
+    if floats:
+        rounded = ", ".join(f"round({col}::DOUBLE, {decimals}) AS {col}" for col in floats)
+        select = f"* REPLACE ({rounded})"
+    con.execute(f'CREATE OR REPLACE TEMP VIEW "{name}" AS SELECT {select} FROM {table_name}')
+
+
+class ConnectionStatements:
+    """
+    Named statements run directly on one connection.
+
+    Parameters
+    ----------
+    con : duckdb.DuckDBPyConnection
+        Connection on which the dataset is registered.
+    statements : Mapping[str, str]
+        Named SQL statements with ``$n`` parameters.
+
+    Notes
+    -----
+    Same interface as :class:`StatementPool`, for ad-hoc connections whose
+    registered views a pooled cursor would not see. The SQL is parsed on
+    every call and calls are not synchronised.
+    """
+
+    def __init__(self, con: duckdb.DuckDBPyConnection, statements: Mapping[str, str]) -> None:
+        self._con = con
+        self._statements = dict(statements)
+
+    def fetchone(self, name: str, params: list[Any]) -> dict[str, Any]:
+        """Run statement ``name`` and return its first row as a dict."""
+        cursor = self._con.execute(self._statements[name], params)
+        names = [col[0] for col in cursor.description]
+        return dict(zip(names, cursor.fetchone()))
+
+    def fetch_df(self, name: str, params: list[Any]) -> pd.DataFrame:
+        """Run statement ``name`` and return every row."""
+        return self._con.execute(self._statements[name], params).df()
+
+
+class StatementPool:
+    """
+    Fixed set of DuckDB cursors with the filter queries parsed up front.
+
+    Parameters
+    ----------
+    con : duckdb.DuckDBPyConnection
+        Connection to the database holding the dataset.
+    statements : Mapping[str, str]
+        Named SQL statements with ``$n`` parameters, e.g. from
+        :func:`filter_statements`.
+    size : int, default=4
+        Number of cursors, i.e. how many queries can run at once.
+    tables : Mapping[str, Any] | None, default=None
+        Data to register on every cursor, for an in-memory connection whose
+        registered views are not visible to other cursors.
+
+    Notes
+    -----
+    Each statement is parsed once per cursor and executed with bound
+    parameters, so a filter change neither builds an expression tree nor
+    renders SQL. DuckDB prepares, binds and runs the parsed statement in
+    one call; its SQL ``EXECUTE`` does not accept bound parameters, so the
+    statement objects are the closest equivalent reachable from Python.
+    A cursor is used by one thread at a time; callers block until one is
+    free.
+
+    Examples
+    --------
+    >>> pool = StatementPool(con, filter_statements(), size=2)  # doctest: +SKIP
+    >>> pool.fetchone("summary", FilterSpec().sql_params())["row_count"]  # doctest: +SKIP
+    4500
+    """
+
+    def __init__(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        statements: Mapping[str, str],
+        size: int = 4,
+        tables: Mapping[str, Any] | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        self.size = size
+        self._con = con
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        for _ in range(size):
+            cursor = con.cursor()
+            for name, data in (tables or {}).items():
+                cursor.register(name, data)
+            parsed = {
+                name: cursor.extract_statements(sql)[0]
+                for name, sql in statements.items()
+            }
+            self._idle.put((cursor, parsed))
+
+    @contextmanager
+    def _checkout(self) -> Iterator[tuple[duckdb.DuckDBPyConnection, dict[str, Any]]]:
+        entry = self._idle.get()
+        try:
+            yield entry
+        finally:
+            self._idle.put(entry)
+
+    def fetchone(self, name: str, params: list[Any]) -> dict[str, Any]:
+        """
+        Run statement ``name`` and return its first row.
+
+        Parameters
+        ----------
+        name : str
+            Statement name.
+        params : list[Any]
+            Values for the statement's parameters.
+
+        Returns
+        -------
+        dict[str, Any]
+            Column name to value.
+        """
+        with self._checkout() as (cursor, parsed):
+            cursor.execute(parsed[name], params)
+            names = [col[0] for col in cursor.description]
+            return dict(zip(names, cursor.fetchone()))
+
+    def fetch_df(self, name: str, params: list[Any]) -> pd.DataFrame:
+        """
+        Run statement ``name`` and return every row.
+
+        Parameters
+        ----------
+        name : str
+            Statement name.
+        params : list[Any]
+            Values for the statement's parameters.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Query result.
+        """
+        with self._checkout() as (cursor, parsed):
+            return cursor.execute(parsed[name], params).df()
+
+    def close(self) -> None:
+        """Close every cursor; the pool cannot be used afterwards."""
+        while not self._idle.empty():
+            cursor, _ = self._idle.get_nowait()
+            cursor.close()
@@ -2,10 +2,422 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from dataclasses import dataclass, fields
+from typing import Any, Sequence
 
+import numpy as np
 import pandas as pd
 
+# Multi-select filters: FilterSpec field -> column, matched by membership.
+CATEGORY_FILTER_COLUMNS: dict[str, str] = {
+    "job_role": "job_role",
+    "ai_band": "ai_band",
+    "deadline_pressure": "deadline_pressure_level",
+}
+
+# Numeric slider filters: FilterSpec field -> column, all inclusive ranges.
+RANGE_FILTER_COLUMNS: dict[str, str] = {
+    "experience": "experience_years",
+    "ai_usage": "ai_tool_usage_hours_per_week",
+    "manual_hours": "manual_work_hours_per_week",
+    "tasks_automated": "tasks_automated_percent",
+}
+
+ALL_SENTINEL = "All"
+
+
+def _normalize_selection(selected: Sequence[str] | None) -> tuple[str, ...] | None:
+    """Map a multi-select value to a sorted tuple, or None for "no filter"."""
+    if not selected or ALL_SENTINEL in selected:
+        return None
+    return tuple(sorted({str(v) for v in selected}))
+
+
+def _normalize_range(bounds: Sequence[float] | None) -> tuple[float, float] | None:
+    """Map slider bounds to a float pair, or None for "no filter"."""
+    if bounds is None:
+        return None
+    lo, hi = bounds
+    return (float(lo), float(hi))
+
+
+def _isin_mask(values: pd.Series, selected: Sequence[str]) -> np.ndarray:
+    """
+    Vectorised membership test that avoids converting categories to strings.
+
+    For categoricals, membership is decided once per category and then looked
+    up by integer code, so the cost is one gather over one-byte codes.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        keep = values.cat.categories.astype(str).isin(list(selected))
+        # Code -1 (missing) indexes the trailing False.
+        return np.append(keep, False)[values.cat.codes.to_numpy()]
+    return values.isin(list(selected)).to_numpy(dtype=bool)
+
+
+def range_mask(values: pd.Series, bounds: tuple[float, float], out: np.ndarray) -> None:
+    """AND an inclusive ``bounds`` check on ``values`` into ``out`` in place."""
+    arr = values.to_numpy()
+    # float64 bounds promote float32 columns, matching SQL's DOUBLE comparison.
+    out &= arr >= np.float64(bounds[0])
+    out &= arr <= np.float64(bounds[1])
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """
+    Engine-independent description of the dashboard sidebar filters.
+
+    A field set to None does not filter. Multi-select fields hold the
+    selected labels as a sorted tuple; range fields hold inclusive
+    ``(low, high)`` bounds. Instances are hashable, so equal selections
+    compare and hash equal however they were entered.
+
+    Parameters
+    ----------
+    job_role, ai_band, deadline_pressure : tuple[str, ...] | None
+        Selected labels for ``job_role``, ``ai_band`` and
+        ``deadline_pressure_level``.
+    experience, ai_usage, manual_hours, tasks_automated : tuple[float, float] | None
+        Inclusive bounds for the columns in ``RANGE_FILTER_COLUMNS``.
+
+    Notes
+    -----
+    The same spec compiles to a pandas mask (:meth:`to_mask`), an ibis
+    expression (:meth:`to_ibis`) and a parameterised DuckDB query
+    (:meth:`to_sql`), which all select the same rows. Missing values never
+    match a filter that is set.
+    """
+
+    job_role: tuple[str, ...] | None = None
+    ai_band: tuple[str, ...] | None = None
+    deadline_pressure: tuple[str, ...] | None = None
+    experience: tuple[float, float] | None = None
+    ai_usage: tuple[float, float] | None = None
+    manual_hours: tuple[float, float] | None = None
+    tasks_automated: tuple[float, float] | None = None
+
+    @classmethod
+    def from_inputs(
+        cls,
+        job_role: Sequence[str] | None = None,
+        ai_band: Sequence[str] | None = None,
+        experience: Sequence[float] | None = None,
+        ai_usage: Sequence[float] | None = None,
+        manual_hours: Sequence[float] | None = None,
+        tasks_automated: Sequence[float] | None = None,
+        deadline_pressure: Sequence[str] | None = None,
+    ) -> FilterSpec:
+        """
+        Build a spec from raw sidebar input values.
+
+        Parameters
+        ----------
+        job_role, ai_band, deadline_pressure : Sequence[str] | None
+            Multi-select values. An empty selection, or one containing
+            ``"All"``, means "do not filter", as in the deployed dashboard.
+        experience, ai_usage, manual_hours, tasks_automated : Sequence[float] | None
+            Slider values as ``(low, high)``.
+
+        Returns
+        -------
+        FilterSpec
+            Normalised specification.
+        """
+        return cls(
+            job_role=_normalize_selection(job_role),
+            ai_band=_normalize_selection(ai_band),
+            deadline_pressure=_normalize_selection(deadline_pressure),
+            experience=_normalize_range(experience),
+            ai_usage=_normalize_range(ai_usage),
+            manual_hours=_normalize_range(manual_hours),
+            tasks_automated=_normalize_range(tasks_automated),
+        )
+
+    def active(self) -> dict[str, Any]:
+        """Return the filters that are set, keyed by field name."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+        }
+
+    def to_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate the spec into one boolean row mask.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Employee-level dataframe.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array of length ``len(df)``.
+
+        Notes
+        -----
+        Each predicate reads its column's underlying NumPy array once and is
+        ANDed into a single mask in place, so no intermediate dataframe is
+        built.
+        """
+        mask = np.ones(len(df), dtype=bool)
+        for name, column in CATEGORY_FILTER_COLUMNS.items():
+            selected = getattr(self, name)
+            if selected is not None:
+                mask &= _isin_mask(df[column], selected)
+        for name, column in RANGE_FILTER_COLUMNS.items():
+            bounds = getattr(self, name)
+            if bounds is not None:
+                range_mask(df[column], bounds, mask)
+        return mask
+
+    def to_ibis(self, table):
+        """
+        Compile the spec into a filtered ibis table expression.
+
+        Parameters
+        ----------
+        table : ibis.Table
+            Table with the dashboard columns.
+
+        Returns
+        -------
+        ibis.Table
+            ``table`` filtered by every active predicate.
+        """
+        predicates = []
+        for name, column in CATEGORY_FILTER_COLUMNS.items():
+            selected = getattr(self, name)
+            if selected is not None:
+                predicates.append(table[column].cast("string").isin(list(selected)))
+        for name, column in RANGE_FILTER_COLUMNS.items():
+            bounds = getattr(self, name)
+            if bounds is not None:
+                predicates.append(
+                    table[column].cast("float64").between(bounds[0], bounds[1])
+                )
+        return table.filter(*predicates) if predicates else table
+
+    def sql_params(self) -> list[Any]:
+        """
+        Positional parameters for :data:`FILTER_SQL_WHERE`.
+
+        Returns
+        -------
+        list
+            One list-or-None per multi-select filter, then a low/high pair
+            (both None when unset) per range filter.
+        """
+        params: list[Any] = []
+        for name in CATEGORY_FILTER_COLUMNS:
+            selected = getattr(self, name)
+            params.append(None if selected is None else list(selected))
+        for name in RANGE_FILTER_COLUMNS:
+            bounds = getattr(self, name)
+            params.extend((None, None) if bounds is None else bounds)
+        return params
+
+    def to_sql(
+        self,
+        table_name: str = "ai_productivity",
+        select: str = "*",
+    ) -> tuple[str, list[Any]]:
+        """
+        Compile the spec into a parameterised DuckDB query.
+
+        Parameters
+        ----------
+        table_name : str, default="ai_productivity"
+            Registered table or view to query.
+        select : str, default="*"
+            Select list.
+
+        Returns
+        -------
+        tuple[str, list]
+            SQL text and its positional parameters. The text depends only on
+            ``table_name`` and ``select``, never on the filter values, so a
+            single prepared statement serves every spec.
+        """
+        sql = f"SELECT {select} FROM {table_name} WHERE {FILTER_SQL_WHERE}"
+        return sql, self.sql_params()
+
+    def apply(self, df: pd.DataFrame, index=None) -> pd.DataFrame:
+        """
+        Return the rows of ``df`` matching the spec.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Employee-level dataframe.
+        index : src.indexes.DashboardIndex | None, default=None
+            Prebuilt index over ``df``. When given, matching rows are looked
+            up in the index instead of scanning the columns.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Matching rows.
+        """
+        if index is None:
+            return FilteredView.from_mask(df, self.to_mask(df)).to_frame()
+        return FilteredView(df, index.select(self)).to_frame()
+
+
+def _build_filter_sql_where() -> str:
+    """Build the fixed WHERE clause bound by :meth:`FilterSpec.sql_params`."""
+    clauses = []
+    n = 1
+    for column in CATEGORY_FILTER_COLUMNS.values():
+        clauses.append(
+            f"(CAST(${n} AS VARCHAR[]) IS NULL"
+            f" OR list_contains(CAST(${n} AS VARCHAR[]), CAST({column} AS VARCHAR)))"
+        )
+        n += 1
+    for column in RANGE_FILTER_COLUMNS.values():
+        clauses.append(
+            f"(CAST(${n} AS DOUBLE) IS NULL"
+            f" OR CAST({column} AS DOUBLE) BETWEEN CAST(${n} AS DOUBLE) AND CAST(${n + 1} AS DOUBLE))"
+        )
+        n += 2
+    return "\n  AND ".join(clauses)
+
+
+FILTER_SQL_WHERE = _build_filter_sql_where()
+
+
+def dashboard_filter_mask(
+    df: pd.DataFrame,
+    job_role: Sequence[str],
+    ai_band: Sequence[str],
+    experience: tuple[int, int],
+    ai_usage: tuple[int, int],
+    manual_hours: tuple[int, int],
+    tasks_automated: tuple[int, int],
+    deadline_pressure: Sequence[str],
+) -> np.ndarray:
+    """
+    Evaluate every sidebar filter into one boolean row mask.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Employee-level dataframe to filter.
+    job_role, ai_band, experience, ai_usage, manual_hours, tasks_automated, deadline_pressure
+        Sidebar selections, as in :func:`apply_dashboard_filters`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array of length ``len(df)``, True for rows that pass every
+        filter.
+    """
+    spec = FilterSpec.from_inputs(
+        job_role=job_role,
+        ai_band=ai_band,
+        experience=experience,
+        ai_usage=ai_usage,
+        manual_hours=manual_hours,
+        tasks_automated=tasks_automated,
+        deadline_pressure=deadline_pressure,
+    )
+    return spec.to_mask(df)
+
+
+class FilteredView:
+    """
+    Row selection over a dataframe that materialises columns on demand.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Source dataframe. It is referenced, not copied.
+    rows : numpy.ndarray
+        Positional indices of the selected rows, in ascending order.
+
+    Examples
+    --------
+    >>> view = FilteredView.from_mask(data, data["experience_years"].to_numpy() > 5)
+    >>> view.column("burnout_risk_score").median()  # doctest: +SKIP
+    """
+
+    def __init__(self, df: pd.DataFrame, rows: np.ndarray) -> None:
+        self.df = df
+        self.rows = rows
+
+    @classmethod
+    def from_mask(cls, df: pd.DataFrame, mask: np.ndarray) -> FilteredView:
+        """Build a view from a boolean row mask."""
+        return cls(df, np.flatnonzero(mask))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def columns(self) -> pd.Index:
+        """Column labels of the source dataframe."""
+        return self.df.columns
+
+    @property
+    def empty(self) -> bool:
+        """Whether no rows are selected."""
+        return len(self.rows) == 0
+
+    def column(self, name: str) -> pd.Series:
+        """
+        Materialise one column for the selected rows.
+
+        Parameters
+        ----------
+        name : str
+            Column label.
+
+        Returns
+        -------
+        pandas.Series
+            Selected values with the source index labels.
+        """
+        return self.df[name].take(self.rows)
+
+    def to_frame(self, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        """
+        Materialise the selected rows.
+
+        Parameters
+        ----------
+        columns : Sequence[str] | None, default=None
+            Columns to include. All columns when None.
+
+        Returns
+        -------
+        pandas.DataFrame
+            New dataframe holding only the requested columns and rows.
+        """
+        source = self.df if columns is None else self.df[list(columns)]
+        return source.take(self.rows)
+
+
+def select_dashboard_rows(df: pd.DataFrame, **filters) -> FilteredView:
+    """
+    Select rows matching the sidebar filters without copying any columns.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Employee-level dataframe to filter.
+    **filters
+        Keyword arguments accepted by :func:`dashboard_filter_mask`.
+
+    Returns
+    -------
+    FilteredView
+        Lazy selection; call :meth:`FilteredView.to_frame` or
+        :meth:`FilteredView.column` to materialise data.
+    """
+    return FilteredView.from_mask(df, dashboard_filter_mask(df, **filters))
+
 
 def apply_dashboard_filters(
     df: pd.DataFrame,
@@ -45,7 +457,8 @@ def apply_dashboard_filters(
     tasks_automated : tuple[int, int]
         Inclusive lower and upper bounds for ``tasks_automated_percent``.
     deadline_pressure : Sequence[str]
-        Selected deadline pressure levels to retain.
+        Selected deadline pressure levels to retain. An empty selection
+        does not filter.
 
     Returns
     -------
@@ -54,9 +467,14 @@ def apply_dashboard_filters(
 
     Notes
     -----
-    The current app logic treats ``"All"`` in ``job_role`` as the
-    default sentinel value meaning "do not filter by role". This behavior is
-    preserved here so the refactor does not change app behavior.
+    The inputs are normalised into a :class:`FilterSpec`, so this function
+    shares the deployed dashboard's semantics: ``"All"`` in ``job_role``
+    or ``ai_band``, or an empty selection in any multi-select filter,
+    means "do not filter by that column".
+
+    All predicates are combined into one mask and the matching rows are
+    gathered in a single ``take``; use :func:`select_dashboard_rows` to
+    defer even that.
 
     Examples
     --------
@@ -73,37 +491,16 @@ def apply_dashboard_filters(
     >>> isinstance(filtered, pd.DataFrame)
     True
     """
-    d = df.copy()
-
-    if "All" not in job_role:
-        d = d[d["job_role"].isin(job_role)]
-
-    if "All" not in ai_band:
-        d = d[d["ai_band"].astype(str).isin(ai_band)]
-
-    d = d[
-        (d["experience_years"] >= experience[0])
-        & (d["experience_years"] <= experience[1])
-    ]
-
-    d = d[
-        (d["ai_tool_usage_hours_per_week"] >= ai_usage[0])
-        & (d["ai_tool_usage_hours_per_week"] <= ai_usage[1])
-    ]
-
-    d = d[
-        (d["manual_work_hours_per_week"] >= manual_hours[0])
-        & (d["manual_work_hours_per_week"] <= manual_hours[1])
-    ]
-
-    d = d[
-        (d["tasks_automated_percent"] >= tasks_automated[0])
-        & (d["tasks_automated_percent"] <= tasks_automated[1])
-    ]
-
-    d = d[d["deadline_pressure_level"].isin(deadline_pressure)]
-
-    return d
+    spec = FilterSpec.from_inputs(
+        job_role=job_role,
+        ai_band=ai_band,
+        experience=experience,
+        ai_usage=ai_usage,
+        manual_hours=manual_hours,
+        tasks_automated=tasks_automated,
+        deadline_pressure=deadline_pressure,
+    )
+    return spec.apply(df)
 
 
 def normalize_querychat_result(result: object, fallback_df: pd.DataFrame) -> pd.DataFrame:
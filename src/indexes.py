@@ -0,0 +1,738 @@
+# src/indexes.py
+
+"""In-memory indexes that answer dashboard filters without rescanning columns."""
+
+from __future__ import annotations
+
+import threading
+from typing import Hashable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from src.filters import CATEGORY_FILTER_COLUMNS, RANGE_FILTER_COLUMNS, FilterSpec
+
+WORD_BITS = 64
+
+
+def n_words(n_rows: int) -> int:
+    """Number of 64-bit words needed to hold ``n_rows`` bits."""
+    return -(-n_rows // WORD_BITS)
+
+
+def pack_bits(mask: np.ndarray) -> np.ndarray:
+    """
+    Pack a boolean row mask into little-endian 64-bit words.
+
+    Parameters
+    ----------
+    mask : numpy.ndarray
+        Boolean array, one entry per row.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``uint64`` array where bit ``i % 64`` of word ``i // 64`` is
+        ``mask[i]``. Padding bits past the last row are zero.
+    """
+    packed = np.packbits(mask, bitorder="little")
+    padded = np.zeros(n_words(len(mask)) * 8, dtype=np.uint8)
+    padded[: len(packed)] = packed
+    return padded.view(np.uint64)
+
+
+def unpack_bits(words: np.ndarray, n_rows: int) -> np.ndarray:
+    """
+    Expand packed words back into a boolean row mask.
+
+    Parameters
+    ----------
+    words : numpy.ndarray
+        ``uint64`` words as returned by :func:`pack_bits`.
+    n_rows : int
+        Number of rows the words describe.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array of length ``n_rows``.
+    """
+    return np.unpackbits(words.view(np.uint8), count=n_rows, bitorder="little").view(bool)
+
+
+def bits_at(words: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    Read individual bits of a packed bitmap.
+
+    Parameters
+    ----------
+    words : numpy.ndarray
+        ``uint64`` bitmap.
+    rows : numpy.ndarray
+        Integer row positions.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array, True where the bit for each row is set.
+    """
+    rows = rows.astype(np.uint64, copy=False)
+    shifted = words[rows >> np.uint64(6)] >> (rows & np.uint64(WORD_BITS - 1))
+    return (shifted & np.uint64(1)).astype(bool)
+
+
+def bitmap_rows(words: np.ndarray) -> np.ndarray:
+    """
+    Row positions of the set bits in a packed bitmap, in ascending order.
+
+    Parameters
+    ----------
+    words : numpy.ndarray
+        ``uint64`` bitmap.
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer positions. Only non-zero words are expanded, so sparse
+        bitmaps cost O(words + set bits).
+    """
+    nonzero = np.flatnonzero(words)
+    bits = np.unpackbits(words[nonzero].view(np.uint8), bitorder="little")
+    word_idx, bit_idx = np.nonzero(bits.reshape(len(nonzero), WORD_BITS))
+    return nonzero[word_idx] * WORD_BITS + bit_idx
+
+
+class BitmapIndex:
+    """
+    One packed bitmap per distinct value of a low-cardinality column.
+
+    Parameters
+    ----------
+    bitmaps : dict[str, numpy.ndarray]
+        Packed ``uint64`` bitmap per value label.
+    n_rows : int
+        Number of rows indexed.
+
+    Notes
+    -----
+    A selection of several values is the bitwise OR of their bitmaps and
+    selections on different columns combine with bitwise AND, so filtering
+    touches ``n_rows / 64`` words per value instead of comparing strings.
+    Missing values are in no bitmap and therefore never match.
+
+    Examples
+    --------
+    >>> index = BitmapIndex.from_series(pd.Series(["a", "b", "a"]))
+    >>> unpack_bits(index.select(["a"]), 3).tolist()
+    [True, False, True]
+    """
+
+    def __init__(self, bitmaps: dict[str, np.ndarray], n_rows: int) -> None:
+        self.bitmaps = bitmaps
+        self.n_rows = n_rows
+        self._empty = np.zeros(n_words(n_rows), dtype=np.uint64)
+        self.all_rows = pack_bits(np.ones(n_rows, dtype=bool))
+
+    @classmethod
+    def from_series(cls, values: pd.Series) -> BitmapIndex:
+        """
+        Build the index from a column.
+
+        Parameters
+        ----------
+        values : pandas.Series
+            Categorical or label column.
+
+        Returns
+        -------
+        BitmapIndex
+            Index keyed by the string form of each value.
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy()
+            labels: Iterable[Hashable] = values.cat.categories
+        else:
+            codes, labels = pd.factorize(values)
+
+        bitmaps = {
+            str(label): pack_bits(codes == code) for code, label in enumerate(labels)
+        }
+        return cls(bitmaps, len(values))
+
+    def select(self, values: Iterable[str]) -> np.ndarray:
+        """
+        Packed bitmap of rows whose value is any of ``values``.
+
+        Parameters
+        ----------
+        values : Iterable[str]
+            Labels to match. Unknown labels match nothing.
+
+        Returns
+        -------
+        numpy.ndarray
+            New ``uint64`` bitmap.
+        """
+        out = self._empty.copy()
+        for value in values:
+            bitmap = self.bitmaps.get(str(value))
+            if bitmap is not None:
+                out |= bitmap
+        return out
+
+
+class SortedRangeIndex:
+    """
+    Sorted permutation of a numeric column for inclusive range lookups.
+
+    Parameters
+    ----------
+    values : pandas.Series
+        Numeric column to index.
+
+    Attributes
+    ----------
+    order : numpy.ndarray
+        Row positions sorted by value; missing values sort last.
+    sorted_values : numpy.ndarray
+        Column values in ``order``, as float64.
+    rank : numpy.ndarray
+        Inverse of ``order``: the sorted position of each row.
+
+    Notes
+    -----
+    A range resolves by binary search to a contiguous slice of ``order``,
+    so looking it up costs O(log n) and listing its rows O(k). Bounds are
+    compared in float64, as in :func:`src.filters.range_mask` and DuckDB.
+
+    Examples
+    --------
+    >>> index = SortedRangeIndex(pd.Series([5, 1, 3]))
+    >>> index.rows_between(2, 5).tolist()
+    [2, 0]
+    """
+
+    def __init__(self, values: pd.Series) -> None:
+        as_float = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        dtype = np.int32 if len(as_float) < np.iinfo(np.int32).max else np.int64
+        self.order = np.argsort(as_float, kind="stable").astype(dtype)
+        self.sorted_values = as_float[self.order]
+        self.rank = np.empty_like(self.order)
+        self.rank[self.order] = np.arange(len(self.order), dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def positions(self, lo: float, hi: float) -> tuple[int, int]:
+        """
+        Sorted positions ``[start, stop)`` of values within ``[lo, hi]``.
+
+        Parameters
+        ----------
+        lo, hi : float
+            Inclusive bounds.
+
+        Returns
+        -------
+        tuple[int, int]
+            Slice bounds into :attr:`order`.
+        """
+        start = int(np.searchsorted(self.sorted_values, lo, side="left"))
+        stop = int(np.searchsorted(self.sorted_values, hi, side="right"))
+        return start, max(start, stop)
+
+    def rows_between(self, lo: float, hi: float) -> np.ndarray:
+        """Row positions with ``lo <= value <= hi``, in value order."""
+        start, stop = self.positions(lo, hi)
+        return self.order[start:stop]
+
+
+class WaveletMatrix:
+    """
+    Wavelet matrix over a sequence of integer symbols.
+
+    Parameters
+    ----------
+    symbols : numpy.ndarray
+        Non-negative integers, e.g. ranks of a column's values.
+
+    Notes
+    -----
+    Level ``l`` stores bit ``l`` (most significant first) of every symbol,
+    with the symbols stably partitioned by the higher bits, as packed
+    ``uint64`` words plus a running count of set bits before each word.
+    Counting set bits before any position is then one lookup and one
+    popcount, and :meth:`kth` descends one level per bit of the largest
+    symbol, so a query costs O(log n) whatever the range length. Storage
+    is about ``n * bits / 8`` bytes for the words and a tenth of that for
+    the counts.
+
+    Examples
+    --------
+    >>> matrix = WaveletMatrix(np.array([3, 0, 2, 1]))
+    >>> matrix.kth(1, 4, 0), matrix.kth(0, 4, 3)
+    (0, 3)
+    """
+
+    def __init__(self, symbols: np.ndarray) -> None:
+        symbols = np.asarray(symbols, dtype=np.int64)
+        self.n = len(symbols)
+        top = int(symbols.max()) if self.n else 0
+        self.n_levels = max(1, top.bit_length())
+        self.words: list[np.ndarray] = []
+        self.ones_before: list[np.ndarray] = []
+        self.zeros: list[int] = []
+
+        current = symbols
+        for level in range(self.n_levels):
+            bits = ((current >> (self.n_levels - 1 - level)) & 1).astype(bool)
+            words = pack_bits(bits)
+            counts = np.zeros(len(words) + 1, dtype=np.int64)
+            np.cumsum(np.bitwise_count(words), out=counts[1:])
+            self.words.append(words)
+            self.ones_before.append(counts)
+            self.zeros.append(self.n - int(counts[-1]))
+            current = np.concatenate([current[~bits], current[bits]])
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _ones(self, level: int, position: int) -> int:
+        """Set bits among the first ``position`` entries of ``level``."""
+        word, bit = divmod(position, WORD_BITS)
+        count = int(self.ones_before[level][word])
+        if bit:
+            count += (int(self.words[level][word]) & ((1 << bit) - 1)).bit_count()
+        return count
+
+    def kth(self, start: int, stop: int, k: int) -> int:
+        """
+        The ``k``-th smallest symbol among positions ``[start, stop)``.
+
+        Parameters
+        ----------
+        start, stop : int
+            Slice of the original sequence.
+        k : int
+            Zero-based order, ``0 <= k < stop - start``.
+
+        Returns
+        -------
+        int
+            Symbol value.
+        """
+        if not 0 <= k < stop - start:
+            raise IndexError("k is outside the range.")
+        # Plain ints keep the bit masks below from overflowing int64.
+        start, stop, k = int(start), int(stop), int(k)
+        symbol = 0
+        for level in range(self.n_levels):
+            ones_start = self._ones(level, start)
+            ones_stop = self._ones(level, stop)
+            zeros_in_range = (stop - start) - (ones_stop - ones_start)
+            symbol <<= 1
+            if k < zeros_in_range:
+                start -= ones_start
+                stop -= ones_stop
+            else:
+                k -= zeros_in_range
+                symbol |= 1
+                start = self.zeros[level] + ones_start
+                stop = self.zeros[level] + ones_stop
+        return symbol
+
+
+class RangeMedianIndex:
+    """
+    Exact medians of one column over inclusive ranges of another.
+
+    Parameters
+    ----------
+    keys : SortedRangeIndex
+        Index of the column the range applies to, e.g. a slider column.
+    values : pandas.Series
+        Column whose median is wanted, aligned with the indexed rows.
+
+    Notes
+    -----
+    The value ranks are laid out in ``keys.order`` and stored in a
+    :class:`WaveletMatrix`, so a range of keys is a contiguous slice and
+    any order statistic of the values in it takes O(log n) steps without
+    listing the rows. Missing values rank after every number and a prefix
+    count excludes them, matching :func:`src.kpis.safe_median`.
+
+    Examples
+    --------
+    >>> keys = SortedRangeIndex(pd.Series([1, 2, 3, 4]))
+    >>> index = RangeMedianIndex(keys, pd.Series([10.0, 40.0, 20.0, 30.0]))
+    >>> index.median(2, 4)
+    30.0
+    """
+
+    def __init__(self, keys: SortedRangeIndex, values: pd.Series) -> None:
+        if len(values) != len(keys):
+            raise ValueError("values must have one entry per indexed row.")
+        self.keys = keys
+        by_key = values.to_numpy(dtype=np.float64, na_value=np.nan)[keys.order]
+        value_order = np.argsort(by_key, kind="stable")
+        self.sorted_values = by_key[value_order]
+        ranks = np.empty(len(value_order), dtype=np.int64)
+        ranks[value_order] = np.arange(len(value_order))
+        self.matrix = WaveletMatrix(ranks)
+        self.missing_before = np.zeros(len(by_key) + 1, dtype=np.int64)
+        np.cumsum(np.isnan(by_key), out=self.missing_before[1:])
+
+    def count(self, lo: float, hi: float) -> int:
+        """Number of non-missing values whose key is within ``[lo, hi]``."""
+        start, stop = self.keys.positions(lo, hi)
+        return (stop - start) - int(self.missing_before[stop] - self.missing_before[start])
+
+    def median(self, lo: float, hi: float) -> float | None:
+        """
+        Median of the values whose key is within ``[lo, hi]``.
+
+        Parameters
+        ----------
+        lo, hi : float
+            Inclusive key bounds, compared as in :meth:`SortedRangeIndex.positions`.
+
+        Returns
+        -------
+        float | None
+            Exact median, averaging the middle pair for an even count like
+            pandas; None when no non-missing value is in range.
+        """
+        start, stop = self.keys.positions(lo, hi)
+        present = (stop - start) - int(self.missing_before[stop] - self.missing_before[start])
+        if present == 0:
+            return None
+        # Missing values carry the largest ranks, so the first ``present``
+        # order statistics of the slice are the numbers.
+        upper = self.sorted_values[self.matrix.kth(start, stop, present // 2)]
+        if present % 2:
+            return float(upper)
+        lower = self.sorted_values[self.matrix.kth(start, stop, present // 2 - 1)]
+        return float((lower + upper) / 2)
+
+
+class DashboardIndex:
+    """
+    Indexes over the dashboard filter columns, built once per dataset.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset to index. It is referenced, not copied.
+
+    Notes
+    -----
+    Multi-select filters in a :class:`~src.filters.FilterSpec` are answered
+    from :class:`BitmapIndex` objects and slider filters from
+    :class:`SortedRangeIndex` objects. A slider range that spans every
+    non-missing value is skipped. Otherwise the narrowest range lists its
+    candidate rows, and the other ranges and the category bitmap are
+    checked only for those rows.
+    """
+
+    # Above this fraction of matching rows a sequential scan of the column
+    # arrays beats random-access checks on the candidates.
+    DENSE_FRACTION = 0.125
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self.n_rows = len(df)
+        self.bitmaps = {
+            name: BitmapIndex.from_series(df[column])
+            for name, column in CATEGORY_FILTER_COLUMNS.items()
+        }
+        self.ranges = {
+            name: SortedRangeIndex(df[column])
+            for name, column in RANGE_FILTER_COLUMNS.items()
+        }
+        self._range_medians: dict[tuple[str, str], RangeMedianIndex] = {}
+        self._range_medians_lock = threading.Lock()
+
+    def range_median_index(self, field: str, column: str) -> RangeMedianIndex:
+        """
+        Range-median index of ``column`` keyed by a slider filter.
+
+        Parameters
+        ----------
+        field : str
+            Slider field of :class:`~src.filters.FilterSpec`, e.g. ``"experience"``.
+        column : str
+            Numeric column whose medians are wanted.
+
+        Returns
+        -------
+        RangeMedianIndex
+            Index built on first use and kept for later calls.
+        """
+        key = (field, column)
+        with self._range_medians_lock:
+            index = self._range_medians.get(key)
+            if index is None:
+                index = RangeMedianIndex(self.ranges[field], self.df[column])
+                self._range_medians[key] = index
+        return index
+
+    def category_bitmap(self, spec: FilterSpec) -> np.ndarray | None:
+        """
+        AND the bitmaps of every active multi-select filter.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Filters to evaluate.
+
+        Returns
+        -------
+        numpy.ndarray | None
+            Packed bitmap, or None when no multi-select filter is set.
+        """
+        words = None
+        for name, index in self.bitmaps.items():
+            selected = getattr(spec, name)
+            if selected is None:
+                continue
+            bitmap = index.select(selected)
+            words = bitmap if words is None else np.bitwise_and(words, bitmap, out=words)
+        return words
+
+    def range_positions(self, spec: FilterSpec) -> dict[str, tuple[int, int]]:
+        """
+        Resolve the active slider filters to sorted-position slices.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Filters to evaluate.
+
+        Returns
+        -------
+        dict[str, tuple[int, int]]
+            ``[start, stop)`` into each index's ``order``, keyed by field
+            name. Ranges that select every row are left out.
+        """
+        resolved = {}
+        for name, index in self.ranges.items():
+            bounds = getattr(spec, name)
+            if bounds is None:
+                continue
+            start, stop = index.positions(*bounds)
+            if stop - start < self.n_rows:
+                resolved[name] = (start, stop)
+        return resolved
+
+    def select(self, spec: FilterSpec) -> np.ndarray:
+        """
+        Row positions matching ``spec``, in ascending order.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Filters to evaluate.
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer positions equal to ``np.flatnonzero(spec.to_mask(df))``.
+        """
+        words = self.category_bitmap(spec)
+        ranges = self.range_positions(spec)
+
+        if not ranges:
+            if words is None:
+                return np.arange(self.n_rows)
+            return np.flatnonzero(unpack_bits(words, self.n_rows))
+
+        narrowest = min(ranges, key=lambda name: ranges[name][1] - ranges[name][0])
+        start, stop = ranges[narrowest]
+        if stop - start > self.DENSE_FRACTION * self.n_rows:
+            return np.flatnonzero(self._scan_mask(words, ranges))
+
+        rows = self.ranges[narrowest].order[start:stop]
+        keep = np.ones(len(rows), dtype=bool)
+        for name, (lo, hi) in ranges.items():
+            if name == narrowest:
+                continue
+            rank = self.ranges[name].rank[rows]
+            keep &= (rank >= lo) & (rank < hi)
+        if words is not None:
+            keep &= bits_at(words, rows)
+        return np.sort(rows[keep])
+
+    def _scan_mask(
+        self, words: np.ndarray | None, ranges: dict[str, tuple[int, int]]
+    ) -> np.ndarray:
+        """Evaluate resolved ranges sequentially over the rank arrays."""
+        if words is None:
+            mask = np.ones(self.n_rows, dtype=bool)
+        else:
+            mask = unpack_bits(words, self.n_rows)
+        for name, (lo, hi) in ranges.items():
+            rank = self.ranges[name].rank
+            mask &= rank >= lo
+            mask &= rank < hi
+        return mask
+
+    def mask(self, spec: FilterSpec) -> np.ndarray:
+        """
+        Evaluate ``spec`` into a boolean row mask using the indexes.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Filters to evaluate.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array equal to ``spec.to_mask(df)``.
+        """
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.select(spec)] = True
+        return mask
+
+
+def _slice_difference(a: tuple[int, int], b: tuple[int, int]) -> list[tuple[int, int]]:
+    """Parts of the half-open interval ``a`` not covered by ``b``."""
+    parts = [(a[0], min(a[1], b[0])), (max(a[0], b[1]), a[1])]
+    return [(start, stop) for start, stop in parts if start < stop]
+
+
+class IncrementalFilter:
+    """
+    Per-session filter evaluation that only revisits rows a change affects.
+
+    Parameters
+    ----------
+    index : DashboardIndex
+        Shared indexes over the dataset.
+
+    Notes
+    -----
+    The filter remembers the last spec, each predicate's matching set (a
+    slice of a :class:`SortedRangeIndex` permutation or a category bitmap),
+    the number of predicates each row fails, and the selected rows. When a
+    filter changes, only the rows that enter or leave its matching set
+    update their count:
+
+    * narrowing a range only removes rows, so the previous selection is
+      re-checked and nothing else is scanned;
+    * widening or shifting a range visits the rows between the old and new
+      slice bounds;
+    * changing a multi-select visits the rows whose bitmap bit flipped.
+
+    Cost therefore follows the size of the change rather than the dataset.
+    The first call, and any call on a fresh instance, evaluates everything.
+    """
+
+    def __init__(self, index: DashboardIndex) -> None:
+        self.index = index
+        self.spec: FilterSpec | None = None
+        self.rows = np.arange(0)
+        self._fails = np.zeros(index.n_rows, dtype=np.uint8)
+
+    def _range_slice(self, name: str, spec: FilterSpec) -> tuple[int, int]:
+        bounds = getattr(spec, name)
+        if bounds is None:
+            return (0, self.index.n_rows)
+        return self.index.ranges[name].positions(*bounds)
+
+    def _category_words(self, name: str, spec: FilterSpec) -> np.ndarray:
+        selected = getattr(spec, name)
+        bitmap = self.index.bitmaps[name]
+        return bitmap.all_rows if selected is None else bitmap.select(selected)
+
+    def _changes(self, name: str, old: FilterSpec, new: FilterSpec):
+        """Rows entering and leaving predicate ``name`` between two specs."""
+        if name in self.index.ranges:
+            order = self.index.ranges[name].order
+            before, after = self._range_slice(name, old), self._range_slice(name, new)
+            entering = [order[a:b] for a, b in _slice_difference(after, before)]
+            leaving = [order[a:b] for a, b in _slice_difference(before, after)]
+            return entering, leaving
+
+        before, after = self._category_words(name, old), self._category_words(name, new)
+        entering = [bitmap_rows(after & ~before)]
+        leaving = [bitmap_rows(before & ~after)]
+        return entering, leaving
+
+    def reset(self, spec: FilterSpec) -> np.ndarray:
+        """
+        Evaluate every predicate from scratch.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Filters to evaluate.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matching row positions in ascending order.
+        """
+        fails = np.zeros(self.index.n_rows, dtype=np.uint8)
+        for name in self.index.bitmaps:
+            if getattr(spec, name) is not None:
+                fails += ~unpack_bits(self._category_words(name, spec), self.index.n_rows)
+        for name, range_index in self.index.ranges.items():
+            if getattr(spec, name) is not None:
+                start, stop = self._range_slice(name, spec)
+                passes = (range_index.rank >= start) & (range_index.rank < stop)
+                fails += ~passes
+
+        self._fails = fails
+        self.spec = spec
+        self.rows = np.flatnonzero(fails == 0)
+        return self.rows
+
+    def update(self, spec: FilterSpec) -> np.ndarray:
+        """
+        Evaluate ``spec``, reusing the previous evaluation where possible.
+
+        Parameters
+        ----------
+        spec : FilterSpec
+            Filters to evaluate.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matching row positions in ascending order, equal to
+            ``index.select(spec)``.
+        """
+        previous = self.spec
+        if previous is None:
+            return self.reset(spec)
+        if spec == previous:
+            return self.rows
+
+        changed = [
+            name
+            for name in (*self.index.bitmaps, *self.index.ranges)
+            if getattr(spec, name) != getattr(previous, name)
+        ]
+
+        added = []
+        removed_any = False
+        for name in changed:
+            entering, leaving = self._changes(name, previous, spec)
+            for rows in leaving:
+                self._fails[rows] += 1
+                removed_any = removed_any or len(rows) > 0
+            for rows in entering:
+                self._fails[rows] -= 1
+                added.append(rows)
+
+        rows = self.rows
+        if removed_any:
+            rows = rows[self._fails[rows] == 0]
+        if added:
+            candidates = np.concatenate(added)
+            rows = np.union1d(rows, candidates[self._fails[candidates] == 0])
+
+        self.spec = spec
+        self.rows = rows
+        return rows
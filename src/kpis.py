@@ -4,9 +4,24 @@
 
 from __future__ import annotations
 
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
 import pandas as pd
 from shiny import ui
 
+if TYPE_CHECKING:
+    from src.indexes import RangeMedianIndex
+
+# KpiBundle field -> column whose median it holds.
+MEDIAN_KPI_COLUMNS: dict[str, str] = {
+    "median_productivity": "productivity_score",
+    "median_burnout": "burnout_risk_score",
+    "median_wlb": "work_life_balance_score",
+}
+
 
 def kpi_card(title: str, value: str, sub: str = "", sub_class: str = "", subtitle: str = ""):
     """
@@ -72,16 +87,119 @@ def safe_median(series: pd.Series) -> float | None:
     float | None
         Median value, or None if the series is empty or median is missing.
     """
-    clean = series.dropna()
+    # median() skips missing values; an empty or all-missing series gives NaN.
+    val = series.median()
 
-    if clean.empty:
+    if pd.isna(val):
         return None
 
-    val = clean.median()
-
     return float(val)
 
 
+def range_median(index: RangeMedianIndex, bounds: tuple[float, float]) -> float | None:
+    """
+    Exact median over a slider range, answered from a range-median index.
+
+    Parameters
+    ----------
+    index : src.indexes.RangeMedianIndex
+        Index of the metric column keyed by the slider column, e.g. from
+        ``DashboardIndex.range_median_index("experience", "burnout_risk_score")``.
+    bounds : tuple[float, float]
+        Inclusive slider bounds.
+
+    Returns
+    -------
+    float | None
+        Same value as ``safe_median`` of the rows within ``bounds``, found
+        in O(log n) without selecting them; None if there are none.
+    """
+    lo, hi = bounds
+    return index.median(lo, hi)
+
+
+@dataclass(frozen=True)
+class KpiBundle:
+    """
+    Every KPI value shown for one selection of employees.
+
+    Parameters
+    ----------
+    row_count : int
+        Number of employees.
+    median_productivity, median_burnout, median_wlb : float | None
+        Medians of ``MEDIAN_KPI_COLUMNS``; None when undefined.
+    high_burnout_count : int
+        Employees whose ``burnout_risk_level`` is ``"High"``.
+    high_burnout_share : float | None
+        ``high_burnout_count / row_count``; None when ``row_count`` is 0.
+    """
+
+    row_count: int
+    median_productivity: float | None
+    median_burnout: float | None
+    median_wlb: float | None
+    high_burnout_count: int
+    high_burnout_share: float | None
+
+
+def _high_burnout_count(levels: pd.Series) -> int:
+    """Count ``"High"`` burnout levels, by category code when categorical."""
+    if isinstance(levels.dtype, pd.CategoricalDtype):
+        categories = levels.cat.categories
+        if "High" not in categories:
+            return 0
+        codes = levels.cat.codes.to_numpy()
+        return int(np.count_nonzero(codes == categories.get_loc("High")))
+    return int((levels == "High").sum())
+
+
+def compute_kpi_bundle(df: pd.DataFrame) -> KpiBundle:
+    """
+    Compute every KPI value for ``df`` in one pass.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Selected employees, e.g. the filtered dashboard rows or an AI
+        Explorer query result.
+
+    Returns
+    -------
+    KpiBundle
+        Count, the three medians and the high-burnout count and share.
+
+    Notes
+    -----
+    The three metric columns are gathered into one float64 block and their
+    medians are selected column-wise in a single NaN-aware call, instead
+    of a drop-missing copy and a median per column.
+    """
+    row_count = len(df)
+    if row_count == 0:
+        return KpiBundle(0, None, None, None, 0, None)
+
+    # AI Explorer queries may select only some columns; absent metrics are
+    # reported as undefined rather than failing every card.
+    present = [col for col in MEDIAN_KPI_COLUMNS.values() if col in df.columns]
+    block = df[present].to_numpy(dtype=np.float64)
+    with warnings.catch_warnings():
+        # All-missing columns give NaN, reported below as None.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        found = dict(zip(present, np.nanmedian(block, axis=0)))
+    medians = {
+        field: None if np.isnan(found.get(col, np.nan)) else float(found[col])
+        for field, col in MEDIAN_KPI_COLUMNS.items()
+    }
+
+    if "burnout_risk_level" not in df.columns:
+        return KpiBundle(row_count, **medians, high_burnout_count=0, high_burnout_share=None)
+    high = _high_burnout_count(df["burnout_risk_level"])
+    return KpiBundle(
+        row_count, **medians, high_burnout_count=high, high_burnout_share=high / row_count
+    )
+
+
 def percent_diff(value: float, baseline: float) -> float:
     """
     Compute relative percent difference from a baseline.
@@ -179,7 +297,42 @@ def median_metric_card(
     shiny.ui.TagChild
         KPI card UI element.
     """
-    val = safe_median(df[column])
+    return median_value_card(
+        safe_median(df[column]),
+        title,
+        baseline,
+        higher_is_better=higher_is_better,
+        subtitle=subtitle,
+    )
+
+
+def median_value_card(
+    val: float | None,
+    title: str,
+    baseline: float,
+    *,
+    higher_is_better: bool,
+    subtitle: str = "",
+):
+    """
+    Build a KPI card for an already computed median.
+
+    Parameters
+    ----------
+    val : float | None
+        Median of the filtered employees, or None when undefined.
+    title : str
+        KPI title.
+    baseline : float
+        Baseline median used for comparison.
+    higher_is_better : bool
+        Whether larger values are considered favorable.
+
+    Returns
+    -------
+    shiny.ui.TagChild
+        KPI card UI element.
+    """
     if val is None:
         return kpi_card(title, "—", subtitle=subtitle)
 
@@ -220,10 +373,40 @@ def high_burnout_pct_card(
     shiny.ui.TagChild
         KPI card UI element.
     """
-    if df.empty:
+    pct = None if df.empty else _high_burnout_count(df["burnout_risk_level"]) / len(df)
+    return high_burnout_share_card(
+        pct, baseline_high_burnout, title=title, subtitle=subtitle
+    )
+
+
+def high_burnout_share_card(
+    pct: float | None,
+    baseline_high_burnout: float,
+    *,
+    title: str = "High Burnout %",
+    subtitle: str = "",
+):
+    """
+    Build a KPI card for an already computed high-burnout share.
+
+    Parameters
+    ----------
+    pct : float | None
+        Share of filtered employees with high burnout, or None when no
+        employees match.
+    baseline_high_burnout : float
+        Company-wide baseline proportion of high burnout.
+    title : str, default="High Burnout %"
+        KPI title text.
+
+    Returns
+    -------
+    shiny.ui.TagChild
+        KPI card UI element.
+    """
+    if pct is None:
         return kpi_card(title, "—", subtitle=subtitle)
 
-    pct = float((df["burnout_risk_level"] == "High").mean())
     diff = percent_diff(pct, baseline_high_burnout)
     arrow = trend_arrow(diff)
     sub_class = trend_class(diff, higher_is_better=False)
@@ -260,11 +443,37 @@ def count_card(
     shiny.ui.TagChild
         KPI card UI element.
     """
-    if df.empty:
+    return row_count_card(len(df), title=title, subtitle=subtitle)
+
+
+def row_count_card(
+    count: int,
+    *,
+    title: str = "Employees Found",
+    subtitle: str = "Rows returned by AI query",
+):
+    """
+    Build a KPI card for an already computed number of employees.
+
+    Parameters
+    ----------
+    count : int
+        Number of employees, e.g. ``KpiBundle.row_count``.
+    title : str, default="Employees Found"
+        KPI title text.
+    subtitle : str, default="Rows returned by AI query"
+        Subtitle text.
+
+    Returns
+    -------
+    shiny.ui.TagChild
+        KPI card UI element.
+    """
+    if count == 0:
         return kpi_card(title, "0")
 
     return kpi_card(
         title,
-        f"{len(df):,}",
+        f"{count:,}",
         subtitle=subtitle,
     )
\ No newline at end of file
@@ -0,0 +1,119 @@
+# src/live_charts.py
+
+"""Altair widgets that keep their spec and receive only new data."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import altair as alt
+from altair.utils import sanitize_pandas_dataframe
+
+from src.charts import ChartFrame
+
+# Private JupyterChart trait whose updates the widget's JavaScript applies
+# to the embedded Vega view as data changesets. Tested with the altair
+# version pinned in requirements.txt; widgets without it are re-rendered.
+DATA_UPDATES_TRAIT = "_py_to_js_updates"
+
+
+def dataset_name(spec: dict) -> str | None:
+    """
+    Name of the dataset behind a compiled chart's data-driven layer.
+
+    Parameters
+    ----------
+    spec : dict
+        Vega-Lite spec, e.g. ``JupyterChart.spec``.
+
+    Returns
+    -------
+    str | None
+        Name of the first layer's data, or of a single view's data; None if
+        the data is not a named dataset.
+    """
+    view = spec["layer"][0] if "layer" in spec else spec
+    return (view.get("data") or spec.get("data") or {}).get("name")
+
+
+class LiveChart:
+    """
+    One chart output whose spec is built once per layout.
+
+    Parameters
+    ----------
+    build : Callable[[ChartFrame], alt.TopLevelMixin]
+        Builds the chart for a frame, e.g. ``charts.burnout_by_role_spec``
+        with its options bound.
+
+    Notes
+    -----
+    :meth:`render` embeds a full chart. After that, frames with the same
+    layout are sent by :meth:`push` as a data changeset for the embedded
+    Vega view plus new param values, which the widget applies without
+    compiling or re-embedding the spec. A frame with a different layout
+    needs a new :meth:`render`.
+
+    Examples
+    --------
+    >>> live = LiveChart(burnout_by_role_spec)  # doctest: +SKIP
+    >>> widget = live.render(burnout_by_role_frame(summary))  # doctest: +SKIP
+    >>> live.push(burnout_by_role_frame(other_summary))  # doctest: +SKIP
+    True
+    """
+
+    def __init__(self, build: Callable[[ChartFrame], alt.TopLevelMixin]) -> None:
+        self.build = build
+        self.layout: tuple | None = None
+        self.widget: alt.JupyterChart | None = None
+        self._dataset: str | None = None
+
+    def render(self, frame: ChartFrame) -> alt.JupyterChart:
+        """
+        Build and embed the chart for ``frame``.
+
+        Parameters
+        ----------
+        frame : ChartFrame
+            What the chart shows.
+
+        Returns
+        -------
+        altair.JupyterChart
+            Widget showing the chart; later frames with the same layout are
+            pushed into it.
+        """
+        widget = alt.JupyterChart(self.build(frame))
+        self.layout = frame.layout
+        self.widget = widget
+        self._dataset = dataset_name(widget.spec)
+        return widget
+
+    def push(self, frame: ChartFrame) -> bool:
+        """
+        Send ``frame`` to the rendered widget as a data-only update.
+
+        Parameters
+        ----------
+        frame : ChartFrame
+            What the chart should show next.
+
+        Returns
+        -------
+        bool
+            True if the widget was updated in place; False if nothing is
+            rendered yet, the layout changed, or the widget cannot take data
+            updates, so :meth:`render` is needed.
+        """
+        if self.widget is None or frame.layout != self.layout:
+            return False
+
+        if frame.data is not None:
+            if self._dataset is None or not self.widget.has_trait(DATA_UPDATES_TRAIT):
+                return False
+            rows = sanitize_pandas_dataframe(frame.data).to_dict("records")
+            update = {"namespace": "data", "name": self._dataset, "scope": [], "value": rows}
+            setattr(self.widget, DATA_UPDATES_TRAIT, [update])
+        for name, value in frame.params.items():
+            setattr(self.widget.params, name, value)
+        return True
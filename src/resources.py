@@ -0,0 +1,220 @@
+# src/resources.py
+
+"""Process-wide dashboard resources built lazily on first use."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from src.cube import DataCube
+from src.data import (
+    summarize_dataset,
+    summarize_table,
+    summary_from_json,
+    with_source_precision,
+)
+from src.indexes import DashboardIndex
+from src.result_cache import ResultCache
+from src.shared_data import register_shared_table
+from src.snapshot import load_app_data, read_snapshot_metadata, snapshot_is_stale
+from src.utils.lazy import Lazy
+
+if TYPE_CHECKING:
+    from src.duckdb_store import StatementPool
+
+TABLE_NAME = "ai_productivity"
+
+# Byte budget of the process-wide filter result cache.
+RESULT_CACHE_BYTES = int(os.getenv("BURNOUT_RESULT_CACHE_MB", "64")) * 2**20
+
+# Where dashboard filters are evaluated: "memory" uses the in-process
+# indexes over the shared frame; "duckdb" runs the KPI and chart queries in
+# DuckDB. When the persistent database matches the snapshot, the "duckdb"
+# engine serves it without loading the rows into the app process.
+FILTER_ENGINE = os.getenv("BURNOUT_FILTER_ENGINE", "memory")
+
+# Answer KPI cards and the role/hours charts from the pre-aggregated cube
+# whenever the slider bounds fall on its bin edges.
+KPI_CUBE_ENABLED = os.getenv("BURNOUT_KPI_CUBE", "1") != "0"
+
+# "exact" (default) or "approximate": whether cube medians may come from
+# merged quantile sketches, which also lets the cube answer any slider
+# position by scanning only the rows of the bins a bound cuts.
+MEDIAN_MODE = os.getenv("BURNOUT_MEDIANS", "exact")
+
+# Cursors serving the "duckdb" engine's prepared filter queries; bounds how
+# many sessions query DuckDB at once.
+DUCKDB_POOL_SIZE = int(os.getenv("BURNOUT_DUCKDB_POOL", "4"))
+
+
+@dataclass(frozen=True)
+class DashboardResources:
+    """
+    Immutable data shared by every session of one app process.
+
+    ``df`` and ``index`` are None when the "duckdb" engine serves the
+    persistent database, which keeps the rows out of the process.
+    """
+
+    df: pd.DataFrame | None
+    index: DashboardIndex | None
+    results: ResultCache
+    table: Any
+    con: Any
+    statements: StatementPool | None
+    cube: DataCube | None
+    default_ai_preview_df: pd.DataFrame
+    filter_choices: dict[str, list[Any]]
+    slider_ranges: dict[str, tuple[int, int]]
+    baselines: dict[str, float]
+
+
+def load_dashboard_resources() -> DashboardResources:
+    """
+    Load the dataset and everything derived from it once per process.
+
+    Returns
+    -------
+    DashboardResources
+        Full dataframe, filter indexes over it, the shared filter result
+        cache, DuckDB-backed ibis table over the same buffers and its raw
+        DuckDB connection, the prepared filter query pool (None unless
+        ``FILTER_ENGINE`` is ``"duckdb"``), the KPI cube (None when
+        disabled), AI Explorer preview rows, sidebar choices, slider
+        ranges and company-wide baselines.
+
+    Notes
+    -----
+    With the "duckdb" engine, a persistent database built for the current
+    snapshot revision is served without loading the dataset; see
+    :func:`_database_resources`. Otherwise the engine queries the shared
+    in-memory data.
+    """
+    import ibis
+
+    if FILTER_ENGINE == "duckdb":
+        resources = _database_resources()
+        if resources is not None:
+            return resources
+
+    app_data = load_app_data()
+    df = app_data.frame
+
+    con = ibis.duckdb.connect()
+    table = register_shared_table(
+        con,
+        TABLE_NAME,
+        app_data.arrow if app_data.arrow is not None else df,
+    )
+
+    statements = None
+    if FILTER_ENGINE == "duckdb":
+        statements = _filter_statement_pool(app_data, con.con)
+
+    summary = _dataset_summary(app_data)
+    slider_ranges = summary["slider_ranges"]
+    cube = None
+    if KPI_CUBE_ENABLED:
+        if app_data.from_snapshot:
+            cube = DataCube.load((read_snapshot_metadata() or {}).get("revision"))
+            if cube is not None:
+                cube.attach(df)
+        if cube is None:
+            cube = DataCube.build(df, slider_ranges)
+
+    return DashboardResources(
+        df=df,
+        index=DashboardIndex(df),
+        results=ResultCache(RESULT_CACHE_BYTES),
+        table=table,
+        con=con.con,
+        statements=statements,
+        cube=cube,
+        default_ai_preview_df=with_source_precision(df.head(100).copy()),
+        filter_choices=summary["filter_choices"],
+        slider_ranges=slider_ranges,
+        baselines=summary["baselines"],
+    )
+
+
+def _database_resources() -> DashboardResources | None:
+    """
+    Serve the persistent DuckDB database without loading the dataset.
+
+    Only the AI Explorer preview rows are read into the process. The ibis
+    table, the filter queries and QueryChat run against the file, the
+    sidebar summary comes from the snapshot sidecar (or one aggregate query
+    when the sidecar predates it), and there is no frame, index or cube.
+    Returns None when the snapshot is stale or the database is missing or
+    was built for another revision.
+    """
+    import ibis
+
+    from src.duckdb_store import StatementPool, filter_statements, open_duckdb_database
+
+    if snapshot_is_stale():
+        return None
+    meta = read_snapshot_metadata() or {}
+    db = open_duckdb_database(meta.get("revision"))
+    if db is None:
+        return None
+
+    con = ibis.duckdb.from_connection(db)
+    stored = meta.get("summary")
+    summary = summary_from_json(stored) if stored is not None else summarize_table(db, TABLE_NAME)
+    preview = db.execute(f"SELECT * FROM {TABLE_NAME} LIMIT 100").df()
+
+    return DashboardResources(
+        df=None,
+        index=None,
+        results=ResultCache(RESULT_CACHE_BYTES),
+        table=con.table(TABLE_NAME),
+        con=db,
+        statements=StatementPool(db, filter_statements(TABLE_NAME), DUCKDB_POOL_SIZE),
+        cube=None,
+        default_ai_preview_df=with_source_precision(preview),
+        filter_choices=summary["filter_choices"],
+        slider_ranges=summary["slider_ranges"],
+        baselines=summary["baselines"],
+    )
+
+
+def _dataset_summary(app_data) -> dict[str, Any]:
+    """
+    Sidebar choices, slider ranges and baselines, from the sidecar when stored.
+
+    A snapshot built before the summary was added to its sidecar, or the
+    CSV fallback, computes them from the frame instead.
+    """
+    if app_data.from_snapshot:
+        stored = (read_snapshot_metadata() or {}).get("summary")
+        if stored is not None:
+            return summary_from_json(stored)
+    return summarize_dataset(app_data.frame)
+
+
+def _filter_statement_pool(app_data, con) -> StatementPool:
+    """
+    Serve the filter queries from the in-memory connection.
+
+    Used when the persistent database is missing or outdated; the shared
+    data is registered on each pooled cursor.
+    """
+    from src.duckdb_store import StatementPool, filter_statements
+
+    data = app_data.arrow if app_data.arrow is not None else app_data.frame
+    return StatementPool(
+        con,
+        filter_statements(TABLE_NAME),
+        DUCKDB_POOL_SIZE,
+        tables={TABLE_NAME: data},
+    )
+
+
+dashboard_resources: Lazy[DashboardResources] = Lazy(
+    load_dashboard_resources, name="dashboard resources"
+)
@@ -0,0 +1,339 @@
+# src/result_cache.py
+
+"""Process-wide LRU cache of filter results shared by all sessions."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+from src.aggregates import (
+    BINNED_GRIDS,
+    ROW_LEVEL_COLUMNS,
+    SCATTER_DENSITY_ROWS,
+    SCATTER_POINT_BUDGET,
+    SUMMARY_COLUMNS,
+    bins_from_counts,
+    grid_edges,
+    summarize_dashboard,
+    summarize_row_level,
+    summary_from_row,
+)
+from src.filters import FilteredView, FilterSpec
+
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+def _nbytes(value: Any) -> int:
+    """Approximate in-memory size of a cached value."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    return 64
+
+
+@dataclass(frozen=True)
+class FilterResult:
+    """
+    Immutable result of one filter state.
+
+    Parameters
+    ----------
+    aggregates : dict[str, Any]
+        KPI values and chart aggregates as returned by
+        :func:`src.aggregates.summarize_dashboard`, plus the row-level chart
+        inputs of :func:`src.aggregates.summarize_row_level`. Shared by
+        every session that hits the cache, so it must be treated as
+        read-only.
+    nbytes : int
+        Approximate memory held by the result.
+
+    Notes
+    -----
+    No engine keeps the matching rows: the heatmap bins and the scatter's
+    points or density bins are bounded by the bin grids and the point
+    budget, so an entry stays small whatever the selection size.
+    """
+
+    aggregates: dict[str, Any]
+    nbytes: int
+
+    @classmethod
+    def _of(cls, aggregates: dict[str, Any]) -> FilterResult:
+        """Wrap ``aggregates`` with their measured size."""
+        return cls(aggregates, _nbytes(aggregates))
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        aggregates: dict[str, Any] | None = None,
+        max_points: int = SCATTER_POINT_BUDGET,
+        density_above: int = SCATTER_DENSITY_ROWS,
+    ) -> FilterResult:
+        """Summarise ``frame`` unless ``aggregates`` are given; add its row-level chart inputs."""
+        if aggregates is None:
+            aggregates = summarize_dashboard(frame)
+        return cls._of(aggregates | summarize_row_level(frame, max_points, density_above))
+
+    @classmethod
+    def from_view(
+        cls,
+        view: FilteredView,
+        aggregates: dict[str, Any] | None = None,
+        max_points: int = SCATTER_POINT_BUDGET,
+        density_above: int = SCATTER_DENSITY_ROWS,
+    ) -> FilterResult:
+        """
+        Build the result of an in-memory row selection.
+
+        Parameters
+        ----------
+        view : FilteredView
+            Selected rows of the full dataframe.
+        aggregates : dict[str, Any] | None, default=None
+            Precomputed KPI values and chart aggregates, e.g. from the cube.
+            When None they are computed from the ``SUMMARY_COLUMNS`` of the
+            selection.
+        max_points, density_above : int
+            Scatter limits; see :func:`src.aggregates.summarize_scatter`.
+
+        Returns
+        -------
+        FilterResult
+            Same contents as :meth:`from_statements`. The selected
+            ``ROW_LEVEL_COLUMNS`` are gathered only to be summarised.
+        """
+        if aggregates is None:
+            aggregates = summarize_dashboard(view.to_frame(columns=SUMMARY_COLUMNS))
+        rows = view.to_frame(columns=ROW_LEVEL_COLUMNS)
+        return cls._of(aggregates | summarize_row_level(rows, max_points, density_above))
+
+    @classmethod
+    def from_sql(
+        cls,
+        con,
+        spec: FilterSpec,
+        table_name: str = "ai_productivity",
+        max_points: int = SCATTER_POINT_BUDGET,
+        density_above: int = SCATTER_DENSITY_ROWS,
+    ) -> FilterResult:
+        """
+        Build the result with every aggregate pushed down to DuckDB.
+
+        Parameters
+        ----------
+        con : duckdb.DuckDBPyConnection
+            Connection on which ``table_name`` is registered.
+        spec : FilterSpec
+            Filters to apply.
+        table_name : str, default="ai_productivity"
+            Table or view holding the dataset.
+        max_points, density_above : int
+            Scatter limits; see :func:`src.aggregates.summarize_scatter`.
+
+        Returns
+        -------
+        FilterResult
+            Same contents as :meth:`from_statements`, running the queries
+            directly on ``con``.
+        """
+        from src.duckdb_store import ConnectionStatements, filter_statements
+
+        statements = ConnectionStatements(con, filter_statements(table_name))
+        return cls.from_statements(statements, spec, max_points, density_above)
+
+    @classmethod
+    def from_statements(
+        cls,
+        pool,
+        spec: FilterSpec,
+        max_points: int = SCATTER_POINT_BUDGET,
+        density_above: int = SCATTER_DENSITY_ROWS,
+    ) -> FilterResult:
+        """
+        Build the result from the pooled, prepared filter queries.
+
+        Parameters
+        ----------
+        pool : src.duckdb_store.StatementPool
+            Pool holding the statements of
+            :func:`src.duckdb_store.filter_statements`.
+        spec : FilterSpec
+            Filters to apply.
+        max_points, density_above : int
+            Scatter limits; see :func:`src.aggregates.summarize_scatter`.
+
+        Returns
+        -------
+        FilterResult
+            Aggregates from one summary query, heatmap bins counted by a
+            ``GROUP BY`` over the grid, and the scatter's density bins or a
+            band-stratified sample drawn in DuckDB. Employee rows are only
+            fetched when the selection fits the point budget.
+        """
+        params = spec.sql_params()
+        row = pool.fetchone("summary", params)
+        aggregates = summary_from_row(row)
+        n = aggregates["row_count"]
+        if not n:
+            return cls._of(aggregates | summarize_row_level(pd.DataFrame()))
+
+        def bins(grid: str) -> pd.DataFrame:
+            edges = grid_edges(row, grid)
+            cells = pd.DataFrame(columns=["ix", "iy", "count"])
+            if edges is not None:
+                bound = params + [edges[0].tolist(), edges[1].tolist()]
+                cells = pool.fetch_df(f"{grid}_bins", bound)
+            return bins_from_counts(cells, *BINNED_GRIDS[grid], edges)
+
+        if n > density_above:
+            scatter = {"row_count": n, "points": None, "bins": bins("scatter")}
+        elif n > max_points:
+            points = pool.fetch_df("sample", params + [max_points])
+            scatter = {"row_count": n, "points": points, "bins": None}
+        else:
+            scatter = {"row_count": n, "points": pool.fetch_df("points", params), "bins": None}
+        return cls._of(aggregates | {"ai_usage_bins": bins("ai_usage"), "scatter": scatter})
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache bounded by the total size of its values.
+
+    Parameters
+    ----------
+    max_bytes : int, default=DEFAULT_MAX_BYTES
+        Byte budget. Least recently used entries are evicted until the
+        total fits; a single value larger than the budget is returned but
+        not stored.
+
+    Notes
+    -----
+    Keys are normalised filter states (:class:`~src.filters.FilterSpec`),
+    so equivalent sidebar selections from different sessions share one
+    entry. Values must expose an ``nbytes`` attribute.
+
+    Examples
+    --------
+    >>> cache = ResultCache(max_bytes=10_000)
+    >>> result = cache.get_or_compute(spec, lambda: FilterResult.from_frame(df))  # doctest: +SKIP
+    >>> cache.stats()["hits"]  # doctest: +SKIP
+    0
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Look up ``key`` and mark it most recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            Normalised filter state.
+
+        Returns
+        -------
+        Any | None
+            Cached value, or None on a miss. Hits and misses are counted.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store ``value`` under ``key``, evicting old entries to fit.
+
+        Parameters
+        ----------
+        key : Hashable
+            Normalised filter state.
+        value : Any
+            Result with an ``nbytes`` attribute.
+        """
+        size = value.nbytes
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old.nbytes
+            self._entries[key] = value
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, computing and storing it on a miss.
+
+        Parameters
+        ----------
+        key : Hashable
+            Normalised filter state.
+        compute : Callable[[], Any]
+            Builds the value; called outside the lock.
+
+        Returns
+        -------
+        Any
+            Cached or freshly computed value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Counters for monitoring.
+
+        Returns
+        -------
+        dict[str, int]
+            ``entries``, ``bytes``, ``max_bytes``, ``hits``, ``misses`` and
+            ``evictions``.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
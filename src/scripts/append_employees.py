@@ -0,0 +1,41 @@
+# src/scripts/append_employees.py
+# Appends a batch of new employees to the processed snapshot using the stored
+# band thresholds, or re-computes the thresholds over everyone.
+#
+# Usage (from the repo root):
+#     python src/scripts/append_employees.py new_features.csv new_targets.csv
+#     python src/scripts/append_employees.py --reband
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pandas as pd  # noqa: E402
+
+from src.snapshot import append_employees, reband_snapshot  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Append employees to the processed dataset.")
+parser.add_argument("features", nargs="?", type=Path, help="CSV of new employee features.")
+parser.add_argument("targets", nargs="?", type=Path, help="CSV of new employee targets.")
+parser.add_argument(
+    "--reband",
+    action="store_true",
+    help="Recompute band thresholds over all employees and fold appended batches into the snapshot.",
+)
+args = parser.parse_args()
+
+if args.features is None and not args.reband:
+    parser.error("provide FEATURES and TARGETS CSVs, --reband, or both")
+if (args.features is None) != (args.targets is None):
+    parser.error("FEATURES and TARGETS must be given together")
+
+if args.features is not None:
+    batch = append_employees(pd.read_csv(args.features), pd.read_csv(args.targets))
+    print(f"Appended {len(batch)} employees")
+
+if args.reband:
+    edges = reband_snapshot()
+    for col, cuts in edges.items():
+        print(f"{col}: {', '.join(f'{c:.2f}' for c in cuts)}")
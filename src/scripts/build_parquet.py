@@ -0,0 +1,81 @@
+# src/scripts/build_parquet.py
+# Build stage: preprocesses the raw CSVs into the Parquet snapshot and its
+# metadata sidecar that the app reads at startup.
+#
+# Usage (from the repo root):
+#     python src/scripts/build_parquet.py
+#     python src/scripts/build_parquet.py --stream   # large exports, in bounded chunks
+#     python src/scripts/build_parquet.py --duckdb   # also write the DuckDB database
+#     python src/scripts/build_parquet.py --cube     # also write the KPI cube
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.constants.paths import (  # noqa: E402
+    CUBE_PATH,
+    DUCKDB_PATH,
+    PARQUET_PATH,
+    PARTITIONED_DIR,
+    SNAPSHOT_META_PATH,
+)
+from src.cube import DataCube  # noqa: E402
+from src.duckdb_store import build_duckdb_database  # noqa: E402
+from src.snapshot import (  # noqa: E402
+    build_snapshot,
+    build_snapshot_from_partitions,
+    load_snapshot,
+)
+from src.streaming import DEFAULT_CHUNKSIZE, stream_build_dataset  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Build the processed dashboard dataset.")
+parser.add_argument(
+    "--stream",
+    action="store_true",
+    help=(
+        "Stream the CSVs in bounded chunks into partitioned Parquet under "
+        f"{PARTITIONED_DIR.name}/, then publish it as the snapshot."
+    ),
+)
+parser.add_argument(
+    "--chunksize",
+    type=int,
+    default=DEFAULT_CHUNKSIZE,
+    help="Rows read per CSV chunk in --stream mode.",
+)
+parser.add_argument(
+    "--duckdb",
+    action="store_true",
+    help=f"Also write {DUCKDB_PATH.name} for BURNOUT_FILTER_ENGINE=duckdb.",
+)
+parser.add_argument(
+    "--cube",
+    action="store_true",
+    help=f"Also write the pre-aggregated KPI cube to {CUBE_PATH.name}.",
+)
+args = parser.parse_args()
+
+if args.stream:
+    manifest = stream_build_dataset(PARTITIONED_DIR, chunksize=args.chunksize)
+    print(
+        f"Saved {manifest['row_count']} rows to {manifest['partitions']} "
+        f"partition(s) in {PARTITIONED_DIR.name}/"
+    )
+    meta = build_snapshot_from_partitions(PARTITIONED_DIR)
+else:
+    meta = build_snapshot()
+print(
+    f"Saved {meta['row_count']} rows to {PARQUET_PATH.name} "
+    f"(data version {meta['data_version']}, metadata in {SNAPSHOT_META_PATH.name})"
+)
+if args.duckdb or args.cube:
+    df = load_snapshot()
+if args.duckdb:
+    build_duckdb_database(df, meta["revision"])
+    print(f"Saved DuckDB database to {DUCKDB_PATH.name}")
+if args.cube:
+    cube = DataCube.build(df, meta["summary"]["slider_ranges"])
+    cube.save(meta["revision"])
+    print(f"Saved {len(cube)} cube cells to {CUBE_PATH.name}")
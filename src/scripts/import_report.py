@@ -0,0 +1,38 @@
+# src/scripts/import_report.py
+# Prints how long importing the app takes, broken down by top-level package,
+# and fails if a package that should load lazily is imported eagerly.
+#
+# Usage (from the repo root):
+#     python src/scripts/import_report.py
+#     python src/scripts/import_report.py --top 25
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.utils.import_budget import (  # noqa: E402
+    FRAMEWORK_MODULE,
+    eager_deferred_packages,
+    import_time_report,
+    run_import_probe,
+)
+
+parser = argparse.ArgumentParser(description="Report import time of the dashboard app.")
+parser.add_argument("--module", default="src.app", help="Module to import (default: src.app).")
+parser.add_argument("--top", type=int, default=15, help="Number of packages to list.")
+args = parser.parse_args()
+
+log, modules = run_import_probe(args.module)
+report = import_time_report(log, args.module)
+
+packages = report.iloc[:-1].head(args.top)
+print(packages.to_string(index=False))
+print(f"\nTotal import time of {args.module}: {report.iloc[-1]['self_ms']:.0f} ms")
+
+_, framework_modules = run_import_probe(FRAMEWORK_MODULE)
+eager = eager_deferred_packages(modules, baseline=framework_modules)
+if eager:
+    print(f"Deferred packages imported eagerly: {', '.join(eager)}")
+    sys.exit(1)
@@ -0,0 +1,129 @@
+# src/shared_data.py
+
+"""Memory-mapped Arrow IPC copy of the dataset shared by all app workers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from src.constants.paths import ARROW_PATH
+
+REVISION_KEY = b"burnout_checkup.revision"
+
+
+def publish_shared_dataset(
+    df: pd.DataFrame,
+    revision: str,
+    arrow_path: Path = ARROW_PATH,
+) -> None:
+    """
+    Write the dataset as an uncompressed Arrow IPC (Feather v2) file.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Preprocessed dashboard dataset in its compact schema.
+    revision : str
+        Snapshot revision from the metadata sidecar, stored in the file's
+        schema metadata so readers can detect an outdated copy.
+    arrow_path : pathlib.Path, default=ARROW_PATH
+        Destination file.
+
+    Notes
+    -----
+    Columns are written as single contiguous chunks without compression,
+    which is what allows readers to map them directly instead of decoding.
+    The file is written under a temporary name and moved into place, so
+    workers that already mapped the previous file keep a valid view.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+    metadata = {**(table.schema.metadata or {}), REVISION_KEY: revision.encode()}
+    table = table.replace_schema_metadata(metadata)
+
+    arrow_path = Path(arrow_path)
+    arrow_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = arrow_path.with_name(f"{arrow_path.name}.{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, arrow_path)
+
+
+def map_shared_dataset(
+    revision: str | None = None,
+    arrow_path: Path = ARROW_PATH,
+) -> pa.Table | None:
+    """
+    Memory-map the shared Arrow file read-only.
+
+    Parameters
+    ----------
+    revision : str | None, default=None
+        Expected snapshot revision. If given and the file was published for
+        a different revision, None is returned.
+    arrow_path : pathlib.Path, default=ARROW_PATH
+        Location of the shared file.
+
+    Returns
+    -------
+    pyarrow.Table | None
+        Table whose buffers point into the mapped file, or None if the file
+        is missing, unreadable, or outdated.
+    """
+    try:
+        source = pa.memory_map(str(arrow_path), "r")
+        table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+
+    stored = (table.schema.metadata or {}).get(REVISION_KEY, b"").decode()
+    if revision is not None and stored != revision:
+        return None
+    return table
+
+
+def shared_frame(table: pa.Table) -> pd.DataFrame:
+    """
+    Expose a mapped Arrow table as a pandas DataFrame without copying.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        Table returned by :func:`map_shared_dataset`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame whose numeric columns are read-only views on the mapped file.
+        Categorical codes are materialised (one byte per row) and employee
+        IDs stay Arrow-backed. Under pandas copy-on-write any modification
+        copies the affected column, so the shared pages are never written.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=False)
+
+
+def register_shared_table(con, name: str, data: pa.Table | pd.DataFrame):
+    """
+    Expose the dataset to an ibis DuckDB connection without copying it.
+
+    Parameters
+    ----------
+    con : ibis.backends.duckdb.Backend
+        Connection created with ``ibis.duckdb.connect()``.
+    name : str
+        Table name visible to queries.
+    data : pyarrow.Table | pandas.DataFrame
+        Mapped Arrow table, or the in-memory frame on the CSV fallback path.
+
+    Returns
+    -------
+    ibis.Table
+        Table expression over the registered data. DuckDB scans the Arrow or
+        NumPy buffers in place instead of importing them.
+    """
+    con.con.register(name, data)
+    return con.table(name)
@@ -0,0 +1,245 @@
+# src/sketch.py
+
+"""Mergeable KLL quantile sketch for approximate medians over large selections."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+DEFAULT_K = 200
+
+# Each level may hold this fraction of the items allowed one level up.
+_CAPACITY_RATIO = 2 / 3
+
+# Normalised rank error times k. The 99th percentile over 200 median
+# estimates of 10^5 to 10^6 normal values merged from 50 parts was about
+# 1.5; 2.0 leaves headroom.
+_RANK_ERROR_K = 2.0
+
+
+def rank_error_bound(k: int = DEFAULT_K) -> float:
+    """
+    Normalised rank error of a quantile estimate from a sketch of size ``k``.
+
+    Parameters
+    ----------
+    k : int, default=DEFAULT_K
+        Sketch size parameter.
+
+    Returns
+    -------
+    float
+        Fraction ``eps`` such that, with 99% confidence, the estimated
+        median has a rank between ``(0.5 - eps) * n`` and
+        ``(0.5 + eps) * n``. About 1% for the default ``k=200``.
+    """
+    return _RANK_ERROR_K / k
+
+
+class KLLSketch:
+    """
+    KLL sketch (Karnin, Lang and Liberty, 2016) of a stream of numbers.
+
+    Items live in levels; an item on level ``h`` stands for ``2**h``
+    original values. When a level is over capacity it is sorted and every
+    other item, starting at a random offset, is promoted to the next
+    level. Memory stays at roughly ``3 * k`` items however many values are
+    added, and two sketches merge by concatenating their levels.
+
+    Parameters
+    ----------
+    k : int, default=DEFAULT_K
+        Capacity of the top level; accuracy improves as ``1 / k``.
+    seed : int | None, default=None
+        Seed for the compaction offsets, for reproducible estimates.
+
+    Notes
+    -----
+    Until the first compaction the sketch holds every value and
+    :meth:`median` is exact; see :attr:`is_exact`. Missing values are
+    ignored.
+
+    Examples
+    --------
+    >>> sketch = KLLSketch(k=200, seed=0)
+    >>> sketch.update(np.arange(1_000_000))
+    >>> abs(sketch.median() - 500_000) < 10_000
+    True
+    """
+
+    def __init__(self, k: int = DEFAULT_K, seed: int | None = None) -> None:
+        if k < 2:
+            raise ValueError("k must be at least 2.")
+        self.k = k
+        self.n = 0
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_items(
+        cls,
+        values: np.ndarray,
+        levels: np.ndarray,
+        k: int = DEFAULT_K,
+        seed: int | None = None,
+    ) -> KLLSketch:
+        """
+        Rebuild a sketch, or a merge of several, from flattened items.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Retained items, e.g. concatenated :meth:`items` of many sketches.
+        levels : numpy.ndarray
+            Level of each item.
+        k : int, default=DEFAULT_K
+            Size parameter of the result.
+        seed : int | None, default=None
+            Seed for the compaction offsets.
+
+        Returns
+        -------
+        KLLSketch
+            Sketch holding the items, compacted to fit ``k``.
+        """
+        sketch = cls(k, seed)
+        values = np.asarray(values, dtype=np.float64)
+        levels = np.asarray(levels)
+        height = int(levels.max()) + 1 if len(levels) else 1
+        sketch.levels = [values[levels == h] for h in range(height)]
+        sketch.n = int(sum(len(items) << h for h, items in enumerate(sketch.levels)))
+        sketch._compress()
+        return sketch
+
+    @classmethod
+    def merged(
+        cls,
+        sketches: Iterable[KLLSketch],
+        k: int = DEFAULT_K,
+        seed: int | None = None,
+    ) -> KLLSketch:
+        """Merge several sketches into a new one, compacting once."""
+        values, levels = [], []
+        for sketch in sketches:
+            v, lv = sketch.items()
+            values.append(v)
+            levels.append(lv)
+        if not values:
+            return cls(k, seed)
+        return cls.from_items(np.concatenate(values), np.concatenate(levels), k, seed)
+
+    @property
+    def is_exact(self) -> bool:
+        """True while the sketch still holds every value it was given."""
+        return len(self.levels) == 1
+
+    def items(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Flatten the retained items.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            Item values (float64) and their levels (uint8).
+        """
+        values = np.concatenate(self.levels)
+        levels = np.repeat(
+            np.arange(len(self.levels), dtype=np.uint8),
+            [len(items) for items in self.levels],
+        )
+        return values, levels
+
+    def update(self, values) -> None:
+        """
+        Add values to the sketch.
+
+        Parameters
+        ----------
+        values : array-like
+            Numbers to add; NaNs are skipped.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.n += len(values)
+        self._compress()
+
+    def merge(self, other: KLLSketch) -> None:
+        """
+        Fold ``other`` into this sketch in place.
+
+        Parameters
+        ----------
+        other : KLLSketch
+            Sketch of another part of the data.
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self._compress()
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self.levels) - 1 - h
+        return max(2, int(np.ceil(self.k * _CAPACITY_RATIO**depth)))
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) <= self._capacity(h):
+                h += 1
+                continue
+            if h + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(items)
+            # An odd item stays behind so the total weight is preserved.
+            even = len(items) - len(items) % 2
+            offset = int(self._rng.integers(2))
+            self.levels[h] = items[even:]
+            self.levels[h + 1] = np.concatenate([self.levels[h + 1], items[offset:even:2]])
+            # Adding a level lowers every capacity below it; rescan.
+            h = 0
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate the ``q``-quantile.
+
+        Parameters
+        ----------
+        q : float
+            Quantile in ``[0, 1]``.
+
+        Returns
+        -------
+        float | None
+            Smallest retained item whose weighted rank reaches ``q * n``, or
+            None for an empty sketch.
+        """
+        if self.n == 0:
+            return None
+        values, levels = self.items()
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(np.left_shift(1, levels[order].astype(np.int64)))
+        idx = int(np.searchsorted(cumulative, q * self.n, side="left"))
+        return float(values[order[min(idx, len(order) - 1)]])
+
+    def median(self) -> float | None:
+        """
+        Estimate the median.
+
+        Returns
+        -------
+        float | None
+            Exact median (averaging the middle pair, like pandas) while
+            :attr:`is_exact`; otherwise the 0.5-quantile estimate. None for
+            an empty sketch.
+        """
+        if self.n == 0:
+            return None
+        if self.is_exact:
+            return float(np.median(self.levels[0]))
+        return self.quantile(0.5)
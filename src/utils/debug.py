@@ -14,7 +14,8 @@ def format_filter_debug(
     manual_hours,
     tasks_automated,
     deadline_pressure,
-    filtered_df: pd.DataFrame,
+    filtered_df: pd.DataFrame | None = None,
+    filtered_rows: int | None = None,
 ) -> str:
     """
     Format dashboard filter state for the debug panel.
@@ -35,14 +36,19 @@ def format_filter_debug(
         Current tasks automated slider value.
     deadline_pressure : Any
         Current deadline pressure input value.
-    filtered_df : pandas.DataFrame
+    filtered_df : pandas.DataFrame | None, default=None
         Current filtered dataframe.
+    filtered_rows : int | None, default=None
+        Number of filtered rows, for callers that do not hold them; takes
+        precedence over ``filtered_df``.
 
     Returns
     -------
     str
         Multi-line debug string.
     """
+    if filtered_rows is None:
+        filtered_rows = len(filtered_df)
     return (
         f"job_role={job_role}\n"
         f"ai_band={ai_band}\n"
@@ -51,5 +57,5 @@ def format_filter_debug(
         f"manual_hours={manual_hours}\n"
         f"tasks_automated={tasks_automated}\n"
         f"deadline_pressure={deadline_pressure}\n"
-        f"filtered_rows={len(filtered_df)}"
+        f"filtered_rows={filtered_rows}"
     )
@@ -0,0 +1,83 @@
+# src/utils/fingerprint.py
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 digest of a file without loading it into memory.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        File to hash.
+    chunk_size : int, default=1 MiB
+        Number of bytes read per iteration.
+
+    Returns
+    -------
+    str
+        Hex-encoded SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint_file(path: Path) -> dict[str, Any]:
+    """
+    Describe a source file by name, size, modification time, and content hash.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Source file to fingerprint.
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary with ``name``, ``size``, ``mtime_ns`` and ``sha256`` keys.
+    """
+    stat = os.stat(path)
+    return {
+        "name": Path(path).name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": file_sha256(path),
+    }
+
+
+def source_matches(path: Path, recorded: dict[str, Any]) -> bool:
+    """
+    Check whether a source file still matches its recorded fingerprint.
+
+    Size and modification time are compared first so the common case costs a
+    single ``stat`` call. The content hash is only computed when the size
+    matches but the modification time does not (for example after a fresh
+    ``git clone``).
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Source file on disk.
+    recorded : dict[str, Any]
+        Fingerprint previously produced by :func:`fingerprint_file`.
+
+    Returns
+    -------
+    bool
+        True if the file content is unchanged.
+    """
+    stat = os.stat(path)
+    if stat.st_size != recorded.get("size"):
+        return False
+    if stat.st_mtime_ns == recorded.get("mtime_ns"):
+        return True
+    return file_sha256(path) == recorded.get("sha256")
@@ -0,0 +1,195 @@
+# src/utils/import_budget.py
+
+"""Measure what importing the app costs, per top-level package."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Sequence
+
+import pandas as pd
+
+from src.constants.paths import PROJECT_ROOT
+
+# Packages the app must not import at module load. The plotting, SQL and AI
+# Explorer stacks are imported on first session, first use of the AI
+# Explorer tab or by the background warm-up; the notebook-only libraries
+# are never needed by the app.
+DEFERRED_PACKAGES: tuple[str, ...] = (
+    "altair",
+    "chatlas",
+    "duckdb",
+    "ibis",
+    "querychat",
+    "shinywidgets",
+    "matplotlib",
+    "plotly",
+    "seaborn",
+    "sklearn",
+)
+
+# Module whose own imports are outside the app's control. shiny >= 1.6
+# imports shinychat, which loads chatlas (and with it the anthropic and
+# openai SDKs) whenever chatlas is installed.
+FRAMEWORK_MODULE = "shiny"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+_PROBE = "import sys, json, {module}; print(json.dumps(sorted(sys.modules)))"
+
+
+def run_import_probe(module: str = "src.app") -> tuple[str, list[str]]:
+    """
+    Import ``module`` in a fresh interpreter with ``-X importtime``.
+
+    Parameters
+    ----------
+    module : str, default="src.app"
+        Dotted module name to import from the project root.
+
+    Returns
+    -------
+    tuple[str, list[str]]
+        Raw ``-X importtime`` log and the names in ``sys.modules`` right
+        after the import finished.
+
+    Notes
+    -----
+    The background warm-up is disabled in the child process so the module
+    list reflects the import alone.
+    """
+    env = {**os.environ, "BURNOUT_WARMUP": "0"}
+    env.setdefault("ANTHROPIC_API_KEY", "unused")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stderr, json.loads(result.stdout.splitlines()[-1])
+
+
+def parse_importtime(log: str) -> pd.DataFrame:
+    """
+    Parse ``python -X importtime`` output.
+
+    Parameters
+    ----------
+    log : str
+        Text written to stderr by the interpreter.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per imported module with ``module``, ``depth``, ``self_us``
+        and ``cumulative_us``, in the order the interpreter logged them.
+    """
+    rows = []
+    for line in log.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        rows.append(
+            {
+                "module": name,
+                "depth": (len(indent) - 1) // 2,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    return pd.DataFrame(rows, columns=["module", "depth", "self_us", "cumulative_us"])
+
+
+def import_time_report(log: str, module: str = "src.app") -> pd.DataFrame:
+    """
+    Break down the import time of ``module`` by top-level package.
+
+    Parameters
+    ----------
+    log : str
+        ``-X importtime`` output, e.g. from :func:`run_import_probe`.
+    module : str, default="src.app"
+        Module whose import is being measured.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per top-level package with ``modules`` (how many of its
+        modules were imported) and ``self_ms`` (time spent executing them),
+        sorted from slowest to fastest, followed by a ``TOTAL`` row whose
+        ``self_ms`` is the cumulative import time of ``module``.
+
+    Notes
+    -----
+    Only modules imported while ``module`` was loading are counted; the
+    interpreter's own start-up imports are logged first and skipped.
+    """
+    timings = parse_importtime(log)
+    root = timings.index[(timings["module"] == module) & (timings["depth"] == 0)]
+    if len(root) == 0:
+        raise ValueError(f"{module!r} does not appear in the import log.")
+    root_idx = root[-1]
+
+    # The interpreter logs a module after everything it imported, so the
+    # modules imported by ``module`` are the lines since the previous
+    # top-level entry.
+    earlier_roots = timings.index[(timings["depth"] == 0) & (timings.index < root_idx)]
+    start = earlier_roots[-1] + 1 if len(earlier_roots) else 0
+    timings = timings.loc[start:root_idx]
+
+    packages = timings["module"].str.split(".").str[0]
+    report = (
+        timings.assign(package=packages)
+        .groupby("package", sort=False)
+        .agg(modules=("module", "size"), self_us=("self_us", "sum"))
+        .reset_index()
+        .sort_values("self_us", ascending=False, ignore_index=True)
+    )
+
+    total = pd.DataFrame(
+        {
+            "package": ["TOTAL"],
+            "modules": [int(report["modules"].sum())],
+            "self_us": [int(timings.loc[root_idx, "cumulative_us"])],
+        }
+    )
+    report = pd.concat([report, total], ignore_index=True)
+    report["self_ms"] = report.pop("self_us") / 1000
+
+    return report
+
+
+def eager_deferred_packages(
+    modules: Sequence[str],
+    deferred: Sequence[str] = DEFERRED_PACKAGES,
+    baseline: Sequence[str] = (),
+) -> list[str]:
+    """
+    List deferred packages that were imported anyway.
+
+    Parameters
+    ----------
+    modules : Sequence[str]
+        Module names loaded by the import, e.g. from :func:`run_import_probe`.
+    deferred : Sequence[str], default=DEFERRED_PACKAGES
+        Top-level packages that must stay unloaded.
+    baseline : Sequence[str], default=()
+        Module names loaded by the framework import alone, e.g. from
+        ``run_import_probe(FRAMEWORK_MODULE)``. Packages found there are not
+        the app's doing and are not reported.
+
+    Returns
+    -------
+    list[str]
+        Offending package names; empty when the import stayed within budget.
+    """
+    loaded = {name.split(".")[0] for name in modules}
+    loaded -= {name.split(".")[0] for name in baseline}
+    return [pkg for pkg in deferred if pkg in loaded]
@@ -0,0 +1,91 @@
+# src/utils/lazy.py
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+
+class Lazy(Generic[T]):
+    """
+    Build a value on first use, exactly once, from any thread.
+
+    Parameters
+    ----------
+    factory : Callable[[], T]
+        Zero-argument function that builds the value.
+    name : str, default=""
+        Label used in log messages.
+
+    Notes
+    -----
+    Concurrent callers of :meth:`get` block on a lock while the first caller
+    runs ``factory``; later calls return the cached value without locking.
+    If ``factory`` raises, nothing is cached and the next call retries.
+
+    Examples
+    --------
+    >>> answer = Lazy(lambda: 42)
+    >>> answer.ready
+    False
+    >>> answer.get()
+    42
+    >>> answer.ready
+    True
+    """
+
+    def __init__(self, factory: Callable[[], T], name: str = "") -> None:
+        self._factory = factory
+        self._name = name or getattr(factory, "__name__", "lazy value")
+        self._lock = threading.Lock()
+        self._value: object = _UNSET
+
+    @property
+    def ready(self) -> bool:
+        """Whether the value has been built."""
+        return self._value is not _UNSET
+
+    def get(self) -> T:
+        """
+        Return the value, building it on the first call.
+
+        Returns
+        -------
+        T
+            The cached value.
+        """
+        value = self._value
+        if value is _UNSET:
+            with self._lock:
+                if self._value is _UNSET:
+                    self._value = self._factory()
+                value = self._value
+        return value  # type: ignore[return-value]
+
+    def warm_up(self) -> threading.Thread:
+        """
+        Start building the value on a background daemon thread.
+
+        Returns
+        -------
+        threading.Thread
+            The started thread. Failures are logged and left for the next
+            :meth:`get` call to retry.
+        """
+
+        def run() -> None:
+            try:
+                self.get()
+            except Exception:
+                logger.exception("Background warm-up of %s failed", self._name)
+
+        thread = threading.Thread(target=run, name=f"warm-up:{self._name}", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,221 @@
+# tests/test_aggregates.py
+
+from __future__ import annotations
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.aggregates import (
+    SCATTER_COLUMNS,
+    SUMMARY_COLUMNS,
+    nice_bin_edges,
+    stratified_sample,
+    summarize_binned_counts,
+    summarize_dashboard,
+    summarize_dashboard_sql,
+    summarize_row_level,
+)
+from src.duckdb_store import ConnectionStatements, filter_statements
+from src.filters import FilterSpec
+from src.result_cache import FilterResult
+
+
+@pytest.fixture
+def employees() -> pd.DataFrame:
+    """Compact-schema-like employee frame with every dashboard column."""
+    rng = np.random.default_rng(3)
+    n = 500
+    levels = pd.CategoricalDtype(["Low", "Medium", "High"], ordered=True)
+    return pd.DataFrame(
+        {
+            "job_role": pd.Categorical(rng.choice(["Analyst", "Manager", "Designer"], n)),
+            "ai_band": pd.Categorical(rng.choice(["Low", "Moderate", "High"], n)),
+            "deadline_pressure_level": pd.Series(rng.choice(levels.categories, n)).astype(levels),
+            "burnout_risk_level": pd.Series(rng.choice(levels.categories, n)).astype(levels),
+            "experience_years": rng.integers(0, 20, n).astype("int8"),
+            "ai_tool_usage_hours_per_week": rng.uniform(0, 30, n).round(2).astype("float32"),
+            "manual_work_hours_per_week": rng.uniform(5, 40, n).round(2).astype("float32"),
+            "tasks_automated_percent": rng.uniform(0, 100, n).round(2).astype("float32"),
+            "meeting_hours_per_week": rng.uniform(0, 15, n).round(2).astype("float32"),
+            "collaboration_hours_per_week": rng.uniform(0, 15, n).round(2).astype("float32"),
+            "focus_hours_per_day": rng.uniform(0, 8, n).round(2).astype("float32"),
+            "productivity_score": rng.uniform(30, 100, n).round(2).astype("float32"),
+            "burnout_risk_score": rng.uniform(0, 10, n).round(2).astype("float32"),
+            "work_life_balance_score": rng.uniform(0, 10, n).round(2).astype("float32"),
+        }
+    )
+
+
+@pytest.fixture
+def con(employees: pd.DataFrame):
+    """DuckDB connection with the employee frame registered."""
+    connection = duckdb.connect()
+    connection.register("ai_productivity", employees)
+    yield connection
+    connection.close()
+
+
+def _assert_same_summary(actual: dict, expected: dict) -> None:
+    assert actual.keys() == expected.keys()
+    assert actual["row_count"] == expected["row_count"]
+    for key in ("median_productivity", "median_burnout", "median_wlb", "high_burnout_share"):
+        assert actual[key] == pytest.approx(expected[key], rel=1e-5)
+    for key, value_col in (("burnout_by_role", "avg_burnout"), ("hours_breakdown", "hours")):
+        a = actual[key].reset_index(drop=True)
+        e = expected[key].reset_index(drop=True)
+        assert a.iloc[:, 0].astype(str).tolist() == e.iloc[:, 0].astype(str).tolist()
+        np.testing.assert_allclose(a[value_col], e[value_col], rtol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        FilterSpec(),
+        FilterSpec.from_inputs(job_role=["Analyst"], experience=(3, 12)),
+        FilterSpec.from_inputs(
+            ai_band=["High"], deadline_pressure=["Low", "High"], ai_usage=(5, 20)
+        ),
+    ],
+)
+def test_summary_query_matches_pandas_summary(
+    employees: pd.DataFrame, con, spec: FilterSpec
+) -> None:
+    """Return the same KPI values and chart aggregates as the pandas path."""
+    expected = summarize_dashboard(spec.apply(employees))
+    actual = summarize_dashboard_sql(con, spec)
+
+    _assert_same_summary(actual, expected)
+
+
+def test_summary_needs_only_summary_columns(employees: pd.DataFrame) -> None:
+    """Summarise the same from the declared columns as from the full frame."""
+    _assert_same_summary(
+        summarize_dashboard(employees[SUMMARY_COLUMNS]), summarize_dashboard(employees)
+    )
+
+
+def test_summary_query_for_empty_selection(con) -> None:
+    """Match the pandas summary of an empty selection."""
+    spec = FilterSpec.from_inputs(job_role=["Nobody"])
+
+    assert summarize_dashboard_sql(con, spec) == summarize_dashboard(pd.DataFrame())
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        FilterSpec(),
+        FilterSpec.from_inputs(job_role=["Manager"], ai_usage=(5, 20)),
+        FilterSpec.from_inputs(job_role=["Nobody"]),
+    ],
+)
+def test_row_level_queries_match_pandas(employees: pd.DataFrame, con, spec: FilterSpec) -> None:
+    """Bin and sample in DuckDB as the pandas path does, without fetching every row."""
+    d = spec.apply(employees)
+    expected = summarize_row_level(d, max_points=60)
+
+    actual = FilterResult.from_sql(con, spec, max_points=60).aggregates
+
+    if d.empty:
+        assert actual["ai_usage_bins"] is None and actual["scatter"] is None
+        return
+    pd.testing.assert_frame_equal(actual["ai_usage_bins"], expected["ai_usage_bins"])
+    points = actual["scatter"]["points"]
+    assert list(points.columns) == SCATTER_COLUMNS
+    assert actual["scatter"]["row_count"] == len(d)
+    # Band quotas match; which employees are drawn is random.
+    expected_bands = expected["scatter"]["points"]["ai_band"].astype(str).value_counts()
+    assert points["ai_band"].astype(str).value_counts().to_dict() == expected_bands.to_dict()
+
+
+def test_scatter_queries_fetch_rows_only_within_the_point_budget(
+    employees: pd.DataFrame, con
+) -> None:
+    spec = FilterSpec.from_inputs(job_role=["Manager"])
+    d = spec.apply(employees)
+
+    all_points = FilterResult.from_sql(con, spec, max_points=len(d)).aggregates["scatter"]
+    density = FilterResult.from_sql(con, spec, density_above=len(d) - 1).aggregates["scatter"]
+
+    assert len(all_points["points"]) == len(d) and all_points["bins"] is None
+    assert density["points"] is None
+    pd.testing.assert_frame_equal(
+        density["bins"], summarize_binned_counts(d, "productivity_score", "burnout_risk_score")
+    )
+
+
+def test_binned_counts_query_places_edge_values_like_numpy(employees: pd.DataFrame) -> None:
+    """Count values on bin edges, including the last one, in the same bin as np.histogram2d."""
+    # 0.3 / 0.1 < 3 in float64, so a plain floor would put 0.3 one bin low.
+    x = np.array([0.0, 0.1, 0.3, 0.6, 0.7, 1.2, 2.3, 3.0])
+    d = employees.iloc[: len(x)].assign(
+        ai_tool_usage_hours_per_week=x, burnout_risk_score=x[::-1].copy()
+    )
+    con = duckdb.connect()
+    con.register("ai_productivity", d)
+
+    bins = FilterResult.from_statements(
+        ConnectionStatements(con, filter_statements()), FilterSpec()
+    ).aggregates["ai_usage_bins"]
+
+    pd.testing.assert_frame_equal(
+        bins,
+        summarize_binned_counts(d, "ai_tool_usage_hours_per_week", "burnout_risk_score"),
+    )
+    con.close()
+
+
+@pytest.mark.parametrize(
+    ("lo", "hi", "expected_step"),
+    [(0.0, 30.0, 1.0), (1.2, 9.8, 0.5), (0.0, 100.0, 5.0), (6.0, 9.0, 0.1)],
+)
+def test_nice_bin_edges_use_round_steps(lo, hi, expected_step) -> None:
+    edges = nice_bin_edges(lo, hi, maxbins=30)
+
+    assert edges[0] <= lo and edges[-1] >= hi
+    assert len(edges) - 1 <= 30
+    np.testing.assert_allclose(np.diff(edges), expected_step)
+
+
+def test_binned_counts_match_row_level_binning(employees: pd.DataFrame) -> None:
+    d = employees.copy()
+    d.loc[::17, "burnout_risk_score"] = np.nan
+    x, y = "ai_tool_usage_hours_per_week", "burnout_risk_score"
+
+    bins = summarize_binned_counts(d, x, y)
+
+    valid = d.dropna(subset=[x, y])
+    assert bins["count"].sum() == len(valid)
+    assert (bins["count"] > 0).all()
+    assert not bins.duplicated([x, y]).any()
+    for _, cell in bins.sample(10, random_state=0).iterrows():
+        inside = (
+            (valid[x] >= cell[x])
+            & ((valid[x] < cell[f"{x}_end"]) | (cell[f"{x}_end"] == bins[f"{x}_end"].max()))
+            & (valid[y] >= cell[y])
+            & ((valid[y] < cell[f"{y}_end"]) | (cell[f"{y}_end"] == bins[f"{y}_end"].max()))
+        )
+        assert inside.sum() == cell["count"]
+
+
+def test_binned_counts_of_all_missing_values_are_empty(employees: pd.DataFrame) -> None:
+    d = employees.assign(burnout_risk_score=np.nan)
+
+    assert summarize_binned_counts(d, "ai_tool_usage_hours_per_week", "burnout_risk_score").empty
+
+
+def test_stratified_sample_keeps_band_shares(employees: pd.DataFrame) -> None:
+    d = employees.copy()
+    d.loc[::25, "ai_band"] = np.nan
+
+    sample = stratified_sample(d, "ai_band", 100)
+
+    assert len(sample) == 100
+    assert sample.index.is_monotonic_increasing
+    expected = d["ai_band"].value_counts(dropna=False) * 100 / len(d)
+    actual = sample["ai_band"].value_counts(dropna=False)
+    assert ((actual - expected).abs() < 1).all()
+    pd.testing.assert_frame_equal(stratified_sample(d, "ai_band", 100), sample)
+    assert stratified_sample(d, "ai_band", len(d)) is d
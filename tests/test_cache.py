@@ -0,0 +1,108 @@
+# tests/test_cache.py
+
+from __future__ import annotations
+
+import os
+
+import pandas as pd
+import pytest
+
+import src.cache
+from src.cache import cache_key, load_cached_dashboard_data
+
+
+@pytest.fixture
+def raw_sources(tmp_path):
+    """Write tiny raw CSVs."""
+    features = pd.DataFrame(
+        {
+            "Employee_ID": ["a", "b", "c"],
+            "job_role": ["Analyst", "Manager", "Analyst"],
+            "ai_tool_usage_hours_per_week": [2.0, 10.0, 20.0],
+            "manual_work_hours_per_week": [15.0, 30.0, 25.0],
+            "meeting_hours_per_week": [5.0, 8.0, 6.0],
+            "deadline_pressure_level": ["Low", "High", "Medium"],
+        }
+    )
+    targets = pd.DataFrame(
+        {
+            "Employee_ID": ["a", "b", "c"],
+            "productivity_score": [80.0, 60.0, 75.0],
+            "burnout_risk_level": ["Low", "High", "High"],
+        }
+    )
+    features_path = tmp_path / "features.csv"
+    targets_path = tmp_path / "targets.csv"
+    features.to_csv(features_path, index=False)
+    targets.to_csv(targets_path, index=False)
+
+    return (features_path, targets_path)
+
+
+@pytest.fixture
+def preprocess_calls(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count how often the full preprocessing pass runs."""
+    calls: list[int] = []
+    original = src.cache.load_dashboard_data
+
+    def counting_loader(*paths):
+        calls.append(1)
+        return original(*paths)
+
+    monkeypatch.setattr("src.cache.load_dashboard_data", counting_loader)
+    return calls
+
+
+def test_cache_hit_skips_preprocessing(tmp_path, raw_sources, preprocess_calls) -> None:
+    """A second load with unchanged sources is served from the cache."""
+    cache_dir = tmp_path / "cache"
+
+    first = load_cached_dashboard_data(cache_dir=cache_dir, sources=raw_sources)
+    second = load_cached_dashboard_data(cache_dir=cache_dir, sources=raw_sources)
+
+    assert len(preprocess_calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_cache_invalidated_when_source_changes(
+    tmp_path, raw_sources, preprocess_calls
+) -> None:
+    """Editing a raw CSV produces a new key and removes the old entry."""
+    cache_dir = tmp_path / "cache"
+    load_cached_dashboard_data(cache_dir=cache_dir, sources=raw_sources)
+
+    with open(raw_sources[0], "a") as fh:
+        fh.write("d,Writer,1.0,1.0,1.0,Low\n")
+    with open(raw_sources[1], "a") as fh:
+        fh.write("d,50.0,Low\n")
+
+    df = load_cached_dashboard_data(cache_dir=cache_dir, sources=raw_sources)
+
+    assert len(preprocess_calls) == 2
+    assert len(df) == 4
+    assert len(list(cache_dir.glob("dashboard-*.parquet"))) == 1
+
+
+def test_cache_key_stable_when_only_mtime_changes(tmp_path, raw_sources) -> None:
+    """Touching a source without editing it keeps the same key."""
+    cache_dir = tmp_path / "cache"
+    before = cache_key(raw_sources, cache_dir)
+
+    stat = os.stat(raw_sources[0])
+    os.utime(raw_sources[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert cache_key(raw_sources, cache_dir) == before
+
+
+def test_corrupt_cache_entry_is_rebuilt(tmp_path, raw_sources, preprocess_calls) -> None:
+    """An unreadable cache file is treated as a miss."""
+    cache_dir = tmp_path / "cache"
+    load_cached_dashboard_data(cache_dir=cache_dir, sources=raw_sources)
+
+    (entry,) = cache_dir.glob("dashboard-*.parquet")
+    entry.write_bytes(b"not parquet")
+
+    df = load_cached_dashboard_data(cache_dir=cache_dir, sources=raw_sources)
+
+    assert len(preprocess_calls) == 2
+    assert len(df) == 3
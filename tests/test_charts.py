@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import json
+
+import numpy as np
 import pandas as pd
 import pytest
 
+from src.aggregates import summarize_row_level, summarize_scatter
 from src.charts import (
+    CHART_COLUMNS,
+    SHOWN_LABEL_PARAM,
+    ai_vs_burnout_frame,
+    chart_payload,
+    burnout_by_role_chart,
     empty_chart,
+    hours_breakdown_chart,
+    hours_breakdown_frame,
     make_ai_vs_burnout_chart,
     make_burnout_by_role_chart,
     make_hours_breakdown_chart,
     make_productivity_vs_burnout_chart,
+    productivity_vs_burnout_frame,
 )
 
 
@@ -83,6 +95,23 @@ def test_make_ai_vs_burnout_chart_returns_layered_chart(sample_df: pd.DataFrame)
     assert rule_layer["encoding"]["y"]["field"] == "y"
 
 
+def test_make_ai_vs_burnout_chart_sends_bin_counts_not_rows(sample_df: pd.DataFrame):
+    large = pd.concat([sample_df] * 500, ignore_index=True)
+
+    small_spec = make_ai_vs_burnout_chart(sample_df, baseline_median_burnout=8.0).to_dict()
+    large_spec = make_ai_vs_burnout_chart(large, baseline_median_burnout=8.0).to_dict()
+
+    heat = large_spec["layer"][0]
+    assert heat["encoding"]["x"]["bin"] == {"binned": True, "step": 0.5}
+    assert "x2" not in heat["encoding"]
+    assert heat["encoding"]["color"]["field"] == "count"
+    # Same bins, only the counts grow with headcount.
+    small_bins = small_spec["datasets"][small_spec["layer"][0]["data"]["name"]]
+    large_bins = large_spec["datasets"][heat["data"]["name"]]
+    assert len(large_bins) == len(small_bins) == len(sample_df)
+    assert sum(row["count"] for row in large_bins) == len(large)
+
+
 def test_make_burnout_by_role_chart_returns_placeholder_for_empty_df():
     d = pd.DataFrame()
     chart = make_burnout_by_role_chart(d)
@@ -148,6 +177,22 @@ def test_make_hours_breakdown_chart_returns_arc_chart(sample_df: pd.DataFrame):
     assert chart_data["pct"].sum() == pytest.approx(1.0)
 
 
+def test_summary_chart_builders_accept_precomputed_aggregates():
+    """Build the role and hours charts from cached aggregates alone."""
+    role = pd.DataFrame({"job_role": ["Analyst"], "avg_burnout": [6.5]})
+    hours = pd.DataFrame(
+        {
+            "category": ["Meetings", "Collaboration", "Deep work", "Manual work"],
+            "hours": [5.0, 5.0, 20.0, 10.0],
+        }
+    )
+
+    assert burnout_by_role_chart(role).to_dict()["mark"]["type"] == "bar"
+    assert hours_breakdown_chart(hours).to_dict()["mark"]["type"] == "arc"
+    assert burnout_by_role_chart(None).to_dict()["mark"]["type"] == "text"
+    assert hours_breakdown_chart(None).to_dict()["mark"]["type"] == "text"
+
+
 def test_make_productivity_vs_burnout_chart_returns_placeholder_for_empty_df():
     d = pd.DataFrame()
     chart = make_productivity_vs_burnout_chart(
@@ -187,4 +232,140 @@ def test_make_productivity_vs_burnout_chart_returns_three_layer_chart(
     assert vline_layer["encoding"]["x"]["field"] == "x"
 
     assert hline_layer["mark"]["type"] == "rule"
-    assert hline_layer["encoding"]["y"]["field"] == "y"
\ No newline at end of file
+    assert hline_layer["encoding"]["y"]["field"] == "y"
+
+
+def _param_value(spec: dict, name: str):
+    return next(p["value"] for p in spec["params"] if p["name"] == name)
+
+
+def test_productivity_chart_samples_above_point_budget(sample_df: pd.DataFrame):
+    large = pd.concat([sample_df] * 250, ignore_index=True)
+
+    chart = make_productivity_vs_burnout_chart(
+        large,
+        baseline_median_productivity=65.0,
+        baseline_median_burnout=8.0,
+        max_points=100,
+    )
+    spec = chart.to_dict()
+
+    points = spec["datasets"][spec["layer"][0]["data"]["name"]]
+    assert spec["layer"][0]["mark"]["type"] == "circle"
+    assert len(points) == 100
+    # Half the employees are in the Low band, and so are half the points.
+    assert sum(p["ai_band"] == "Low" for p in points) == 50
+    assert spec["title"]["text"] == {"expr": SHOWN_LABEL_PARAM}
+    assert _param_value(spec, SHOWN_LABEL_PARAM) == "100 of 1,000 employees shown, sampled by AI usage band"
+
+
+def test_productivity_chart_switches_to_density_layer(sample_df: pd.DataFrame):
+    large = pd.concat([sample_df] * 250, ignore_index=True)
+
+    chart = make_productivity_vs_burnout_chart(
+        large,
+        baseline_median_productivity=65.0,
+        baseline_median_burnout=8.0,
+        density_above=500,
+    )
+    spec = chart.to_dict()
+
+    assert len(spec["layer"]) == 3
+    assert spec["layer"][0]["mark"]["type"] == "rect"
+    assert spec["layer"][0]["encoding"]["color"]["field"] == "count"
+    bins = spec["datasets"][spec["layer"][0]["data"]["name"]]
+    assert sum(b["count"] for b in bins) == len(large)
+    assert spec["title"]["text"] == {"expr": SHOWN_LABEL_PARAM}
+    assert _param_value(spec, SHOWN_LABEL_PARAM) == "Density of 1,000 employees"
+
+
+@pytest.fixture
+def employees_df() -> pd.DataFrame:
+    """Larger frame with every column the dashboard loads, IDs included."""
+    rng = np.random.default_rng(7)
+    n = 2000
+    return pd.DataFrame(
+        {
+            "Employee_ID": [f"{i:08x}-0000-4000-8000-000000000000" for i in range(n)],
+            "job_role": rng.choice(["Analyst", "Manager", "Designer", "Developer"], n),
+            "ai_band": rng.choice(["Low", "Moderate", "High"], n),
+            "deadline_pressure_level": rng.choice(["Low", "Medium", "High"], n),
+            "experience_years": rng.integers(1, 20, n),
+            "ai_tool_usage_hours_per_week": rng.uniform(0, 30, n).round(2).astype("float32"),
+            "manual_work_hours_per_week": rng.uniform(10, 43, n).round(2).astype("float32"),
+            "meeting_hours_per_week": rng.uniform(0, 15, n).round(2).astype("float32"),
+            "collaboration_hours_per_week": rng.uniform(0, 15, n).round(2).astype("float32"),
+            "focus_hours_per_day": rng.uniform(0, 8, n).round(2).astype("float32"),
+            "burnout_risk_score": rng.uniform(0, 10, n).round(2).astype("float32"),
+            "productivity_score": rng.uniform(30, 100, n).round(2).astype("float32"),
+            "work_life_balance_score": rng.uniform(0, 10, n).round(2).astype("float32"),
+        }
+    )
+
+
+def _payload_bytes(chart) -> int:
+    return len(json.dumps(chart.to_dict(), separators=(",", ":")))
+
+
+@pytest.mark.parametrize(
+    ("build", "max_bytes"),
+    [
+        # At most 30 x 30 bins, whatever the headcount.
+        (lambda d: make_ai_vs_burnout_chart(d, baseline_median_burnout=5.0), 50_000),
+        (make_burnout_by_role_chart, 1_500),
+        (make_hours_breakdown_chart, 2_000),
+        (
+            lambda d: make_productivity_vs_burnout_chart(
+                d, baseline_median_productivity=65.0, baseline_median_burnout=5.0
+            ),
+            # Under 100 bytes per employee drawn.
+            200_000,
+        ),
+    ],
+)
+def test_chart_payload_size_is_bounded(employees_df: pd.DataFrame, build, max_bytes):
+    assert _payload_bytes(build(employees_df)) < max_bytes
+
+
+def test_chart_payload_keeps_only_declared_columns(employees_df: pd.DataFrame):
+    chart = make_productivity_vs_burnout_chart(
+        employees_df, baseline_median_productivity=65.0, baseline_median_burnout=5.0
+    )
+    spec = chart.to_dict()
+    points = spec["datasets"][spec["layer"][0]["data"]["name"]]
+
+    assert set(points[0]) == set(CHART_COLUMNS["productivity_vs_burnout"])
+    assert "Employee_ID" not in json.dumps(spec)
+
+
+def test_chart_payload_rounds_floats_to_short_decimals():
+    d = pd.DataFrame({"a": np.array([64.8, 9.03], dtype="float32"), "b": [1, 2], "c": ["x", "y"]})
+
+    out = chart_payload(d, ["a", "b"])
+
+    assert list(out.columns) == ["a", "b"]
+    assert json.dumps(out["a"].tolist()) == "[64.8, 9.03]"
+    assert out["b"].tolist() == [1, 2]
+
+
+def test_frames_keep_layout_across_filter_changes(employees_df: pd.DataFrame):
+    subset = employees_df[employees_df["job_role"] == "Analyst"]
+
+    full = productivity_vs_burnout_frame(summarize_scatter(employees_df, max_points=500))
+    narrowed = productivity_vs_burnout_frame(summarize_scatter(subset, max_points=500))
+    assert full.layout == narrowed.layout == ("points",)
+    assert full.params[SHOWN_LABEL_PARAM] != narrowed.params[SHOWN_LABEL_PARAM]
+
+    full_bins = summarize_row_level(employees_df)["ai_usage_bins"]
+    narrowed_bins = summarize_row_level(subset)["ai_usage_bins"]
+    assert ai_vs_burnout_frame(full_bins).layout == ai_vs_burnout_frame(narrowed_bins).layout
+
+
+def test_frames_change_layout_when_the_spec_must_change(sample_df: pd.DataFrame):
+    assert hours_breakdown_frame(None).layout == ("empty", "No data for current filters.")
+    assert productivity_vs_burnout_frame(summarize_scatter(sample_df.iloc[:0])).data is None
+    assert ai_vs_burnout_frame(None).data is None
+    points = productivity_vs_burnout_frame(summarize_scatter(sample_df))
+    density = productivity_vs_burnout_frame(summarize_scatter(sample_df, density_above=2))
+    assert points.layout != density.layout
+    assert density.layout[0] == "binned"
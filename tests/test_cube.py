@@ -0,0 +1,208 @@
+# tests/test_cube.py
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.aggregates import summarize_dashboard
+from src.cube import DataCube, bin_codes, bin_edges
+from src.filters import FilterSpec
+from src.sketch import rank_error_bound
+
+SLIDER_RANGES = {
+    "experience": (0, 19),
+    "ai_usage": (0, 30),
+    "manual_hours": (5, 40),
+    "tasks_automated": (0, 100),
+}
+
+
+@pytest.fixture
+def employees() -> pd.DataFrame:
+    """Employee frame with values on and between the cube's bin edges."""
+    rng = np.random.default_rng(5)
+    n = 2000
+    levels = pd.CategoricalDtype(["Low", "Medium", "High"], ordered=True)
+    return pd.DataFrame(
+        {
+            "job_role": pd.Categorical(rng.choice(["Analyst", "Manager", "Designer"], n)),
+            "ai_band": pd.Categorical(rng.choice(["Low", "Moderate", "High"], n)),
+            "deadline_pressure_level": pd.Series(rng.choice(levels.categories, n)).astype(levels),
+            "burnout_risk_level": pd.Series(rng.choice(levels.categories, n)).astype(levels),
+            "experience_years": rng.integers(0, 20, n).astype("int8"),
+            "ai_tool_usage_hours_per_week": rng.uniform(0, 30, n).round(0).astype("float32"),
+            "manual_work_hours_per_week": rng.uniform(5, 40, n).round(1).astype("float32"),
+            "tasks_automated_percent": rng.uniform(0, 100, n).round(1).astype("float32"),
+            "meeting_hours_per_week": rng.uniform(0, 15, n).astype("float32"),
+            "collaboration_hours_per_week": rng.uniform(0, 15, n).astype("float32"),
+            "focus_hours_per_day": rng.uniform(0, 8, n).astype("float32"),
+            "productivity_score": rng.uniform(30, 100, n).astype("float32"),
+            "burnout_risk_score": rng.uniform(0, 10, n).astype("float32"),
+            "work_life_balance_score": rng.uniform(0, 10, n).astype("float32"),
+        }
+    )
+
+
+@pytest.fixture
+def cube(employees: pd.DataFrame) -> DataCube:
+    return DataCube.build(employees, SLIDER_RANGES)
+
+
+def test_bin_codes_give_edges_their_own_bins() -> None:
+    """Put edge values, values between edges and missing values apart."""
+    edges = bin_edges(0, 12, 5)
+    codes = bin_codes(np.array([-1.0, 0.0, 2.5, 5.0, 11.0, 12.0, 13.0, np.nan]), edges)
+
+    assert edges.tolist() == [0.0, 5.0, 10.0, 12.0]
+    assert codes.tolist() == [0, 1, 2, 3, 6, 7, 8, -1]
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        FilterSpec(),
+        FilterSpec.from_inputs(job_role=["Analyst"]),
+        FilterSpec.from_inputs(ai_band=["High", "Low"], deadline_pressure=["Medium"]),
+        FilterSpec.from_inputs(experience=(3, 12), ai_usage=(5, 20)),
+        FilterSpec.from_inputs(manual_hours=(10, 40), tasks_automated=(20, 60)),
+        FilterSpec.from_inputs(job_role=["Nobody"]),
+        # Beyond the last edge, but the cut bin is empty.
+        FilterSpec.from_inputs(experience=(0, 25)),
+    ],
+)
+def test_aligned_specs_match_row_level_summary(
+    employees: pd.DataFrame, cube: DataCube, spec: FilterSpec
+) -> None:
+    """Answer aligned filters exactly, including medians of small cells."""
+    expected = summarize_dashboard(spec.apply(employees))
+    actual = cube.summarize(spec)
+
+    assert actual["row_count"] == expected["row_count"]
+    if expected["row_count"] == 0:
+        assert actual == expected
+        return
+    for key in ("median_productivity", "median_burnout", "median_wlb", "high_burnout_share"):
+        assert actual[key] == pytest.approx(expected[key], rel=1e-6)
+    pd.testing.assert_frame_equal(
+        actual["burnout_by_role"].astype({"job_role": str}),
+        expected["burnout_by_role"].astype({"job_role": str}).reset_index(drop=True),
+        check_dtype=False,
+        rtol=1e-6,
+    )
+    pd.testing.assert_frame_equal(
+        actual["hours_breakdown"], expected["hours_breakdown"], rtol=1e-6
+    )
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        FilterSpec.from_inputs(ai_usage=(3, 20)),
+        FilterSpec.from_inputs(tasks_automated=(0, 55)),
+        FilterSpec.from_inputs(manual_hours=(12, 33)),
+    ],
+)
+def test_unaligned_bounds_fall_back(cube: DataCube, spec: FilterSpec) -> None:
+    """Decline slider bounds that do not fall on a bin edge."""
+    assert cube.summarize(spec) is None
+
+
+def test_large_cells_use_sketches_within_bound(employees: pd.DataFrame) -> None:
+    """Keep medians of cells larger than k within the sketch error bound."""
+    coarse = dict.fromkeys(SLIDER_RANGES, 100)
+    cube = DataCube.build(employees, SLIDER_RANGES, bin_steps=coarse, k=20)
+    spec = FilterSpec.from_inputs(job_role=["Manager"])
+    scores = spec.apply(employees)["burnout_risk_score"].to_numpy()
+
+    median = cube.summarize(spec, approximate=True, exact_below=0)["median_burnout"]
+
+    assert cube.sketches["burnout_risk_score"][1].any()
+    assert abs((scores < median).mean() - 0.5) <= rank_error_bound(20)
+
+
+def test_save_and_load_round_trip(cube: DataCube, tmp_path) -> None:
+    """Reload a saved cube only for the revision it was built from."""
+    path = tmp_path / "cube.npz"
+    cube.save("r1", path)
+
+    loaded = DataCube.load("r1", path)
+
+    assert len(loaded) == len(cube)
+    spec = FilterSpec.from_inputs(ai_band=["Moderate"])
+    assert loaded.summarize(spec)["median_wlb"] == cube.summarize(spec)["median_wlb"]
+    assert DataCube.load("r2", path) is None
+    assert DataCube.load("r1", tmp_path / "missing.npz") is None
+
+
+def _coarse_cube(employees: pd.DataFrame, step: float = 50, k: int = 20) -> DataCube:
+    """Few large cells, so many of them are compacted into sketches."""
+    steps = dict.fromkeys(SLIDER_RANGES, step)
+    return DataCube.build(employees, SLIDER_RANGES, bin_steps=steps, k=k)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        FilterSpec.from_inputs(ai_usage=(3, 20)),
+        FilterSpec.from_inputs(job_role=["Analyst"], manual_hours=(12, 33)),
+        FilterSpec.from_inputs(ai_band=["Low", "High"], tasks_automated=(10, 90)),
+    ],
+)
+def test_approximate_mode_answers_unaligned_bounds(
+    employees: pd.DataFrame, spec: FilterSpec
+) -> None:
+    """Keep counts and means exact and medians within the sketch bound."""
+    cube = _coarse_cube(employees)
+    assert cube.sketches["burnout_risk_score"][1].any()
+    rows = spec.apply(employees)
+    expected = summarize_dashboard(rows)
+
+    actual = cube.summarize(spec, approximate=True, exact_below=0)
+
+    assert actual["row_count"] == expected["row_count"]
+    assert actual["high_burnout_share"] == pytest.approx(expected["high_burnout_share"])
+    np.testing.assert_allclose(
+        actual["hours_breakdown"]["hours"], expected["hours_breakdown"]["hours"], rtol=1e-6
+    )
+    scores = rows["burnout_risk_score"].to_numpy()
+    assert abs((scores < actual["median_burnout"]).mean() - 0.5) <= rank_error_bound(20)
+
+
+def test_approximate_mode_is_exact_for_small_selections(employees: pd.DataFrame) -> None:
+    """Fall back to exact medians below the row threshold."""
+    cube = _coarse_cube(employees)
+    spec = FilterSpec.from_inputs(ai_usage=(3, 20))
+    expected = summarize_dashboard(spec.apply(employees))
+
+    actual = cube.summarize(spec, approximate=True, exact_below=len(employees))
+
+    assert actual["median_productivity"] == pytest.approx(expected["median_productivity"])
+    assert actual["median_wlb"] == pytest.approx(expected["median_wlb"])
+
+
+def test_exact_mode_reads_rows_of_compacted_cells(
+    employees: pd.DataFrame, tmp_path
+) -> None:
+    """Give exact medians for compacted cells only when rows are attached."""
+    cube = _coarse_cube(employees, step=100)
+    spec = FilterSpec.from_inputs(job_role=["Manager"])
+    expected = summarize_dashboard(spec.apply(employees))["median_burnout"]
+    assert cube.summarize(spec)["median_burnout"] == pytest.approx(expected)
+
+    cube.save("r1", tmp_path / "cube.npz")
+    loaded = DataCube.load("r1", tmp_path / "cube.npz")
+    assert not loaded.attached
+    assert loaded.summarize(spec) is None
+
+    loaded.attach(employees)
+    assert loaded.summarize(spec)["median_burnout"] == pytest.approx(expected)
+
+
+def test_attach_rejects_other_rows(employees: pd.DataFrame) -> None:
+    """Refuse a frame with rows outside the cube's cells."""
+    cube = DataCube.build(employees.iloc[:100], SLIDER_RANGES)
+
+    with pytest.raises(ValueError, match="does not match"):
+        cube.attach(employees)
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import json
+
 import pandas as pd
 import pytest
 
 from src.data import (
     DEADLINE_PRESSURE_MAP,
+    EMPLOYEE_ID_DTYPE,
+    apply_compact_schema,
+    decode_employee_ids,
+    encode_employee_ids,
     get_baselines,
     get_filter_choices,
     get_slider_ranges,
     load_dashboard_data,
+    memory_report,
+    summarize_dataset,
+    summary_from_json,
+    with_source_precision,
 )
 
 
@@ -130,4 +140,84 @@ def test_get_baselines_returns_expected_summary_values(
     assert baselines["median_burnout"] == 7.0
     assert baselines["median_productivity"] == 75.0
     assert baselines["median_wlb"] == 5.0
-    assert baselines["high_burnout_rate"] == pytest.approx(2 / 3)
\ No newline at end of file
+    assert baselines["high_burnout_rate"] == pytest.approx(2 / 3)
+
+
+def test_summarize_dataset_matches_separate_helpers(
+    sample_dashboard_df: pd.DataFrame,
+) -> None:
+    """The one-query summary equals the choices, ranges and baselines helpers."""
+    for df in (sample_dashboard_df, apply_compact_schema(sample_dashboard_df)):
+        summary = summarize_dataset(df)
+
+        assert summary["filter_choices"] == get_filter_choices(df)
+        assert summary["slider_ranges"] == get_slider_ranges(df)
+        assert summary["baselines"] == get_baselines(df)
+        assert summary_from_json(json.loads(json.dumps(summary))) == summary
+
+
+def test_apply_compact_schema_uses_compact_dtypes(
+    sample_dashboard_df: pd.DataFrame,
+) -> None:
+    """Test that low-cardinality, integer and float columns are downcast."""
+    df = apply_compact_schema(sample_dashboard_df)
+
+    assert isinstance(df["job_role"].dtype, pd.CategoricalDtype)
+    assert list(df["deadline_pressure_level"].cat.categories) == ["Low", "Medium", "High"]
+    assert df["experience_years"].dtype == "int8"
+    assert df["burnout_risk_score"].dtype == "float32"
+    assert df["workload_score"].tolist() == [21.0, 41.0, 33.0]
+
+
+def test_with_source_precision_removes_float32_noise() -> None:
+    """Test that float32 columns read back as the source's decimals."""
+    df = pd.DataFrame(
+        {
+            "job_role": pd.Categorical(["Analyst", "Manager"]),
+            "error_rate_percent": pd.Series([0.1, 30.4], dtype="float32"),
+        }
+    )
+    assert df["error_rate_percent"].tolist() != [0.1, 30.4]
+
+    out = with_source_precision(df)
+
+    assert out["error_rate_percent"].dtype == "float64"
+    assert out["error_rate_percent"].tolist() == [0.1, 30.4]
+    assert str(out["error_rate_percent"].max()) == "30.4"
+    assert out["job_role"].dtype == df["job_role"].dtype
+    assert df["error_rate_percent"].dtype == "float32"
+
+
+def test_employee_ids_round_trip_through_binary_encoding() -> None:
+    """Test that UUID strings encode to 16-byte values and decode back."""
+    ids = pd.Series(
+        [
+            "3c6ca882-3fa3-446b-8208-c92f3f306f06",
+            "02f168cc-7747-4dbd-a868-ea2cfb41e22a",
+        ]
+    )
+
+    encoded = encode_employee_ids(ids)
+
+    assert encoded.dtype == EMPLOYEE_ID_DTYPE
+    assert all(len(v) == 16 for v in encoded)
+    assert decode_employee_ids(encoded).tolist() == ids.tolist()
+
+
+def test_encode_employee_ids_leaves_non_uuid_values_unchanged() -> None:
+    """Test that IDs that are not UUIDs are not encoded."""
+    ids = pd.Series([1, 2, 3])
+
+    pd.testing.assert_series_equal(encode_employee_ids(ids), ids)
+
+
+def test_memory_report_lists_every_column_and_total(
+    sample_dashboard_df: pd.DataFrame,
+) -> None:
+    """Test that the memory report has a row per column plus a total."""
+    report = memory_report(sample_dashboard_df)
+
+    assert set(report["column"]) == set(sample_dashboard_df.columns) | {"TOTAL"}
+    total = report.loc[report["column"] == "TOTAL", "bytes"].iloc[0]
+    assert total == report.loc[report["column"] != "TOTAL", "bytes"].sum()
+    assert report["bytes_per_row"].iloc[-1] == pytest.approx(total / 3)
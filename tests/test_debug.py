@@ -51,4 +51,19 @@ def test_format_filter_debug_reports_zero_filtered_rows():
         filtered_df=filtered_df,
     )
 
-    assert "filtered_rows=0" in result
\ No newline at end of file
+    assert "filtered_rows=0" in result
+
+def test_format_filter_debug_accepts_a_row_count():
+    """Test that a row count can be given instead of the filtered rows."""
+    result = format_filter_debug(
+        job_role="All",
+        ai_band=["All"],
+        experience=(0, 10),
+        ai_usage=(0, 20),
+        manual_hours=(0, 40),
+        tasks_automated=(0, 100),
+        deadline_pressure=["Low", "Medium", "High"],
+        filtered_rows=2_250_000,
+    )
+
+    assert result.endswith("filtered_rows=2250000")
@@ -0,0 +1,165 @@
+# tests/test_duckdb_store.py
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.aggregates import summarize_dashboard_sql
+from src.duckdb_store import (
+    StatementPool,
+    build_duckdb_database,
+    create_source_precision_view,
+    filter_statements,
+    open_duckdb_database,
+)
+from src.filters import FilterSpec
+from src.result_cache import FilterResult
+
+SPECS = [
+    FilterSpec(),
+    FilterSpec.from_inputs(job_role=["Analyst"]),
+    FilterSpec.from_inputs(ai_band=["High"], experience=(2, 9)),
+    FilterSpec.from_inputs(job_role=["Nobody"]),
+]
+
+
+@pytest.fixture
+def employees() -> pd.DataFrame:
+    """Small employee frame with every column the filter queries read."""
+    rng = np.random.default_rng(11)
+    n = 300
+    levels = pd.CategoricalDtype(["Low", "Medium", "High"], ordered=True)
+    return pd.DataFrame(
+        {
+            "job_role": pd.Categorical(rng.choice(["Analyst", "Manager"], n)),
+            "ai_band": pd.Categorical(rng.choice(["Low", "Moderate", "High"], n)),
+            "deadline_pressure_level": pd.Series(rng.choice(levels.categories, n)).astype(levels),
+            "burnout_risk_level": pd.Series(rng.choice(levels.categories, n)).astype(levels),
+            "experience_years": rng.integers(0, 15, n).astype("int8"),
+            "ai_tool_usage_hours_per_week": rng.uniform(0, 30, n).astype("float32"),
+            "manual_work_hours_per_week": rng.uniform(5, 40, n).astype("float32"),
+            "tasks_automated_percent": rng.uniform(0, 100, n).astype("float32"),
+            "meeting_hours_per_week": rng.uniform(0, 15, n).astype("float32"),
+            "collaboration_hours_per_week": rng.uniform(0, 15, n).astype("float32"),
+            "focus_hours_per_day": rng.uniform(0, 8, n).astype("float32"),
+            "productivity_score": rng.uniform(30, 100, n).astype("float32"),
+            "burnout_risk_score": rng.uniform(0, 10, n).astype("float32"),
+            "work_life_balance_score": rng.uniform(0, 10, n).astype("float32"),
+        }
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path, employees: pd.DataFrame):
+    """Persistent database built for revision ``"r1"``."""
+    path = tmp_path / "employees.duckdb"
+    build_duckdb_database(employees, "r1", path)
+    return path
+
+
+def test_open_checks_revision(db_path, tmp_path) -> None:
+    """Open the file only when it matches the expected snapshot revision."""
+    con = open_duckdb_database("r1", db_path)
+    assert con is not None
+    assert con.execute("SELECT count(*) FROM ai_productivity").fetchone()[0] == 300
+    con.close()
+
+    assert open_duckdb_database("r2", db_path) is None
+    assert open_duckdb_database("r1", tmp_path / "missing.duckdb") is None
+
+
+def test_database_keeps_compact_types(db_path) -> None:
+    """Store the compact integer and float widths instead of widening them."""
+    con = open_duckdb_database("r1", db_path)
+    types = dict(
+        con.execute(
+            "SELECT column_name, data_type FROM duckdb_columns() "
+            "WHERE table_name = 'ai_productivity'"
+        ).fetchall()
+    )
+    con.close()
+
+    assert types["experience_years"] == "TINYINT"
+    assert types["burnout_risk_score"] == "FLOAT"
+
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_pooled_statements_match_adhoc_sql(db_path, employees, spec: FilterSpec) -> None:
+    """Return the same aggregates and chart inputs as the ad-hoc queries."""
+    pool = StatementPool(open_duckdb_database("r1", db_path), filter_statements(), size=2)
+    adhoc = duckdb.connect()
+    adhoc.register("ai_productivity", employees)
+
+    result = FilterResult.from_statements(pool, spec)
+    expected = FilterResult.from_sql(adhoc, spec)
+
+    assert result.aggregates["row_count"] == expected.aggregates["row_count"]
+    assert result.aggregates["median_burnout"] == pytest.approx(
+        expected.aggregates["median_burnout"]
+    )
+    if expected.aggregates["row_count"]:
+        pd.testing.assert_frame_equal(
+            result.aggregates["ai_usage_bins"], expected.aggregates["ai_usage_bins"]
+        )
+        assert len(result.aggregates["scatter"]["points"]) == expected.aggregates["row_count"]
+    else:
+        assert result.aggregates["scatter"] is None
+    pool.close()
+
+
+def test_pool_registers_in_memory_tables(employees) -> None:
+    """Make registered data visible to every cursor of an in-memory pool."""
+    pool = StatementPool(
+        duckdb.connect(),
+        filter_statements(),
+        size=3,
+        tables={"ai_productivity": employees},
+    )
+    params = FilterSpec().sql_params()
+
+    counts = {pool.fetchone("summary", params)["row_count"] for _ in range(6)}
+
+    assert counts == {300}
+
+
+def test_pool_serves_concurrent_sessions(db_path, employees) -> None:
+    """Answer queries from many threads without sharing a cursor."""
+    pool = StatementPool(open_duckdb_database("r1", db_path), filter_statements(), size=2)
+    adhoc = duckdb.connect()
+    adhoc.register("ai_productivity", employees)
+    expected = [summarize_dashboard_sql(adhoc, spec)["row_count"] for spec in SPECS]
+
+    def run(i: int) -> int:
+        spec = SPECS[i % len(SPECS)]
+        return pool.fetchone("summary", spec.sql_params())["row_count"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        counts = list(executor.map(run, range(40)))
+
+    assert counts == [expected[i % len(SPECS)] for i in range(40)]
+
+
+def test_pool_rejects_empty_size() -> None:
+    """Require at least one cursor."""
+    with pytest.raises(ValueError, match="at least 1"):
+        StatementPool(duckdb.connect(), {}, size=0)
+
+
+def test_source_precision_view_rounds_floats(db_path, employees) -> None:
+    """Read FLOAT columns as DOUBLE rounded to the source's decimals."""
+    con = open_duckdb_database("r1", db_path)
+    create_source_precision_view(con, "rounded")
+
+    view = con.execute("SELECT * FROM rounded").df()
+    con.close()
+
+    assert view["burnout_risk_score"].dtype == "float64"
+    assert view["burnout_risk_score"].tolist() == (
+        employees["burnout_risk_score"].astype("float64").round(2).tolist()
+    )
+    assert view["experience_years"].tolist() == employees["experience_years"].tolist()
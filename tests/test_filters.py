@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.filters import apply_dashboard_filters, normalize_querychat_result
+from src.filters import (
+    FilteredView,
+    FilterSpec,
+    apply_dashboard_filters,
+    dashboard_filter_mask,
+    normalize_querychat_result,
+    select_dashboard_rows,
+)
 
 
 @pytest.fixture
@@ -219,6 +227,64 @@ def test_apply_dashboard_filters_does_not_mutate_input_dataframe(
     pd.testing.assert_frame_equal(sample_df, original)
 
 
+FILTER_ARGS = dict(
+    job_role=["Analyst", "Manager"],
+    ai_band=["Medium", "High"],
+    experience=(2, 9),
+    ai_usage=(1, 15),
+    manual_hours=(10, 35),
+    tasks_automated=(10, 90),
+    deadline_pressure=["Medium", "High"],
+)
+
+
+def test_dashboard_filter_mask_matches_categorical_columns(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Give the same mask whether label columns are strings or categoricals."""
+    categorical = sample_df.astype(
+        {
+            "job_role": "category",
+            "ai_band": pd.CategoricalDtype(["Low", "Medium", "High"], ordered=True),
+            "deadline_pressure_level": "category",
+        }
+    )
+
+    expected = dashboard_filter_mask(sample_df, **FILTER_ARGS)
+    result = dashboard_filter_mask(categorical, **FILTER_ARGS)
+
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(expected, [False, True, True, False, False])
+
+
+def test_dashboard_filter_mask_excludes_missing_categories(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Never match rows whose categorical value is missing."""
+    df = sample_df.astype({"job_role": "category"})
+    df.loc[1, "job_role"] = np.nan
+
+    mask = dashboard_filter_mask(df, **FILTER_ARGS)
+
+    assert not mask[1]
+
+
+def test_select_dashboard_rows_defers_materialisation(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Return a view that references the source frame until asked for data."""
+    view = select_dashboard_rows(sample_df, **FILTER_ARGS)
+
+    assert isinstance(view, FilteredView)
+    assert view.df is sample_df
+    assert len(view) == 2
+    assert view.column("experience_years").tolist() == [8, 5]
+
+    subset = view.to_frame(["job_role", "ai_band"])
+    assert list(subset.columns) == ["job_role", "ai_band"]
+    assert subset.index.tolist() == [1, 2]
+
+
 class DummyQueryChatFrame:
     """Simple stand-in for a QueryChat-like object with to_native()."""
 
@@ -255,4 +321,110 @@ def test_normalize_querychat_result_returns_dataframe_as_is() -> None:
 
     result = normalize_querychat_result(df, fallback_df=pd.DataFrame())
 
-    pd.testing.assert_frame_equal(result, df)
\ No newline at end of file
+    pd.testing.assert_frame_equal(result, df)
+
+
+# ---------------------------------------------------------------------------
+# FilterSpec: one spec, three engines
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def engine_df() -> pd.DataFrame:
+    """Mixed-dtype frame with missing values, shaped like the compact schema."""
+    rng = np.random.default_rng(0)
+    n = 400
+    levels = pd.CategoricalDtype(["Low", "Medium", "High"], ordered=True)
+    df = pd.DataFrame(
+        {
+            "row_id": np.arange(n),
+            "job_role": pd.Categorical(
+                rng.choice(["Analyst", "Manager", "Designer", "Developer"], n)
+            ),
+            "ai_band": pd.Categorical(
+                rng.choice(["Low", "Moderate", "High"], n),
+                categories=["Low", "Moderate", "High"],
+                ordered=True,
+            ),
+            "deadline_pressure_level": pd.Series(
+                rng.choice(["Low", "Medium", "High"], n)
+            ).astype(levels),
+            "experience_years": rng.integers(0, 20, n).astype("int8"),
+            "ai_tool_usage_hours_per_week": rng.uniform(0, 30, n).round(2).astype("float32"),
+            "manual_work_hours_per_week": rng.uniform(5, 40, n).round(2).astype("float32"),
+            "tasks_automated_percent": rng.uniform(0, 100, n).round(2).astype("float32"),
+        }
+    )
+    df.loc[::37, "job_role"] = np.nan
+    df.loc[::41, "ai_tool_usage_hours_per_week"] = np.nan
+    return df
+
+
+SPEC_CASES = [
+    FilterSpec(),
+    FilterSpec.from_inputs(job_role=["Analyst"], deadline_pressure=["High"]),
+    FilterSpec.from_inputs(
+        job_role=["All", "Manager"],
+        ai_band=["Moderate", "High"],
+        experience=(3, 12),
+        ai_usage=(2.5, 17.25),
+        manual_hours=(10, 30),
+        tasks_automated=(25, 75),
+        deadline_pressure=["Low", "Medium"],
+    ),
+    FilterSpec.from_inputs(ai_band=[], deadline_pressure=[], experience=(19, 19)),
+    FilterSpec.from_inputs(job_role=["Nobody"]),
+]
+
+
+@pytest.mark.parametrize("spec", SPEC_CASES)
+def test_filter_spec_engines_select_the_same_rows(
+    engine_df: pd.DataFrame, spec: FilterSpec
+) -> None:
+    """Compile one spec to pandas, ibis and SQL and get identical row sets."""
+    import ibis
+
+    con = ibis.duckdb.connect()
+    con.con.register("ai_productivity", engine_df)
+    table = con.table("ai_productivity")
+
+    pandas_rows = engine_df.loc[spec.to_mask(engine_df), "row_id"].tolist()
+    ibis_rows = sorted(spec.to_ibis(table).execute()["row_id"].tolist())
+    sql, params = spec.to_sql(select="row_id")
+    sql_rows = sorted(row[0] for row in con.con.execute(sql, params).fetchall())
+
+    assert pandas_rows == ibis_rows == sql_rows
+
+
+def test_filter_spec_from_inputs_treats_all_and_empty_as_unfiltered() -> None:
+    """Match the deployed semantics for sentinel and empty selections."""
+    spec = FilterSpec.from_inputs(
+        job_role=["All", "Analyst"],
+        ai_band=[],
+        deadline_pressure=["High", "Low"],
+        experience=(1, 5),
+    )
+
+    assert spec.job_role is None
+    assert spec.ai_band is None
+    assert spec.deadline_pressure == ("High", "Low")
+    assert spec.experience == (1.0, 5.0)
+    assert set(spec.active()) == {"deadline_pressure", "experience"}
+
+
+def test_filter_spec_is_hashable_and_order_insensitive() -> None:
+    """Equal selections entered in different orders give equal specs."""
+    a = FilterSpec.from_inputs(job_role=["Manager", "Analyst"], experience=(2, 8))
+    b = FilterSpec.from_inputs(job_role=("Analyst", "Manager"), experience=[2.0, 8.0])
+
+    assert a == b
+    assert hash(a) == hash(b)
+
+
+def test_filter_spec_sql_text_does_not_depend_on_values() -> None:
+    """Keep one SQL text for every spec so it can be prepared once."""
+    sql_a, params_a = FilterSpec().to_sql()
+    sql_b, params_b = SPEC_CASES[2].to_sql()
+
+    assert sql_a == sql_b
+    assert len(params_a) == len(params_b) == 11
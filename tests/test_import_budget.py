@@ -0,0 +1,95 @@
+# tests/test_import_budget.py
+
+from __future__ import annotations
+
+import pytest
+
+from src.utils.import_budget import (
+    DEFERRED_PACKAGES,
+    FRAMEWORK_MODULE,
+    eager_deferred_packages,
+    import_time_report,
+    parse_importtime,
+    run_import_probe,
+)
+
+SAMPLE_LOG = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | encodings
+import time:        50 |         50 | json
+import time:        30 |         30 |     pandas._libs
+import time:       400 |        430 |   pandas
+import time:        20 |         20 |   src.constants.paths
+import time:        10 |         30 |   src.constants
+import time:         5 |         5 |   src.data
+import time:        40 |        505 | src.app
+"""
+
+
+@pytest.fixture(scope="module")
+def app_import():
+    """Import ``src.app`` once in a fresh interpreter."""
+    return run_import_probe("src.app")
+
+
+@pytest.fixture(scope="module")
+def framework_modules():
+    """Modules the web framework loads by itself."""
+    _, modules = run_import_probe(FRAMEWORK_MODULE)
+    return modules
+
+
+def test_parse_importtime_reads_depth_and_timings():
+    timings = parse_importtime(SAMPLE_LOG)
+
+    assert timings["module"].tolist()[:2] == ["encodings", "json"]
+    assert timings.loc[timings["module"] == "pandas._libs", "depth"].item() == 2
+    assert timings.loc[timings["module"] == "src.app", "cumulative_us"].item() == 505
+
+
+def test_import_time_report_groups_by_top_level_package():
+    report = import_time_report(SAMPLE_LOG, "src.app")
+
+    assert report["package"].tolist() == ["pandas", "src", "TOTAL"]
+    assert report.loc[0, "modules"] == 2
+    assert report.loc[0, "self_ms"] == pytest.approx(0.43)
+    # src counts its own submodules plus src.app itself
+    assert report.loc[1, "self_ms"] == pytest.approx(0.075)
+    assert report.loc[2, "self_ms"] == pytest.approx(0.505)
+
+
+def test_import_time_report_rejects_missing_module():
+    with pytest.raises(ValueError):
+        import_time_report(SAMPLE_LOG, "src.missing")
+
+
+def test_eager_deferred_packages_flags_loaded_names():
+    modules = ["pandas", "altair.vegalite", "src.app"]
+
+    assert eager_deferred_packages(modules) == ["altair"]
+
+
+def test_eager_deferred_packages_ignores_framework_imports():
+    modules = ["shiny", "chatlas._chat", "duckdb", "src.app"]
+
+    assert eager_deferred_packages(modules, baseline=["shiny", "chatlas"]) == ["duckdb"]
+
+
+def test_app_import_does_not_load_deferred_packages(app_import, framework_modules):
+    _, modules = app_import
+
+    assert eager_deferred_packages(modules, DEFERRED_PACKAGES, framework_modules) == []
+
+
+def test_app_import_report_totals_match(app_import, framework_modules):
+    log, _ = app_import
+    report = import_time_report(log, "src.app")
+
+    total = report.loc[report["package"] == "TOTAL", "self_ms"].item()
+    assert report.iloc[-1]["package"] == "TOTAL"
+    # Per-package self times add up to the measured total, up to timer noise.
+    assert report.loc[report["package"] != "TOTAL", "self_ms"].sum() == pytest.approx(
+        total, rel=0.05
+    )
+    framework = {name.split(".")[0] for name in framework_modules}
+    assert not set(report["package"]) & (set(DEFERRED_PACKAGES) - framework)
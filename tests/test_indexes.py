@@ -0,0 +1,263 @@
+# tests/test_indexes.py
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.filters import FilterSpec
+from src.indexes import (
+    BitmapIndex,
+    DashboardIndex,
+    IncrementalFilter,
+    RangeMedianIndex,
+    SortedRangeIndex,
+    WaveletMatrix,
+    bitmap_rows,
+    bits_at,
+    pack_bits,
+    unpack_bits,
+)
+
+
+@pytest.fixture
+def dashboard_df() -> pd.DataFrame:
+    """Compact-schema-like frame with missing labels and values."""
+    rng = np.random.default_rng(1)
+    n = 1000
+    df = pd.DataFrame(
+        {
+            "job_role": pd.Categorical(
+                rng.choice(["Analyst", "Manager", "Designer", "Developer"], n)
+            ),
+            "ai_band": pd.Categorical(
+                rng.choice(["Low", "Moderate", "High"], n),
+                categories=["Low", "Moderate", "High"],
+            ),
+            "deadline_pressure_level": pd.Categorical(
+                rng.choice(["Low", "Medium", "High"], n),
+                categories=["Low", "Medium", "High"],
+            ),
+            "experience_years": rng.integers(0, 20, n).astype("int8"),
+            "ai_tool_usage_hours_per_week": rng.uniform(0, 30, n).astype("float32"),
+            "manual_work_hours_per_week": rng.uniform(5, 40, n).astype("float32"),
+            "tasks_automated_percent": rng.uniform(0, 100, n).astype("float32"),
+        }
+    )
+    df.loc[::29, "job_role"] = np.nan
+    df.loc[::31, "manual_work_hours_per_week"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("n", [1, 63, 64, 65, 1000])
+def test_pack_bits_round_trips(n: int) -> None:
+    """Pack a mask into words and expand it back unchanged."""
+    mask = np.random.default_rng(n).random(n) < 0.4
+
+    words = pack_bits(mask)
+
+    assert words.dtype == np.uint64
+    assert len(words) == -(-n // 64)
+    np.testing.assert_array_equal(unpack_bits(words, n), mask)
+    np.testing.assert_array_equal(bits_at(words, np.arange(n)), mask)
+
+
+def test_bitmap_index_select_matches_isin() -> None:
+    """OR the bitmaps of selected values, ignoring unknown labels."""
+    values = pd.Series(["a", "b", None, "c", "a", "b"])
+    index = BitmapIndex.from_series(values)
+
+    selected = unpack_bits(index.select(["a", "c", "zzz"]), len(values))
+
+    np.testing.assert_array_equal(selected, values.isin(["a", "c"]).to_numpy())
+    assert not unpack_bits(index.select([]), len(values)).any()
+
+
+SPECS = [
+    FilterSpec(),
+    FilterSpec.from_inputs(job_role=["Analyst", "Developer"]),
+    FilterSpec.from_inputs(
+        job_role=["Manager"],
+        ai_band=["High", "Low"],
+        deadline_pressure=["Medium"],
+        experience=(4, 15),
+        manual_hours=(10.5, 30),
+    ),
+    FilterSpec.from_inputs(ai_band=["Moderate"], tasks_automated=(99.9, 100)),
+    FilterSpec.from_inputs(
+        experience=(0, 19),
+        ai_usage=(0, 30),
+        manual_hours=(5, 40),
+        tasks_automated=(0, 100),
+    ),
+    FilterSpec.from_inputs(
+        job_role=["Designer"],
+        experience=(3, 3),
+        ai_usage=(10, 20),
+        tasks_automated=(20, 80),
+    ),
+]
+
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_dashboard_index_mask_matches_column_scan(
+    dashboard_df: pd.DataFrame, spec: FilterSpec
+) -> None:
+    """Give exactly the rows a full column scan selects."""
+    index = DashboardIndex(dashboard_df)
+
+    np.testing.assert_array_equal(index.mask(spec), spec.to_mask(dashboard_df))
+    pd.testing.assert_frame_equal(
+        spec.apply(dashboard_df, index=index), spec.apply(dashboard_df)
+    )
+
+
+def test_sorted_range_index_resolves_inclusive_bounds() -> None:
+    """Binary-search inclusive bounds and keep missing values out."""
+    values = pd.Series([5.0, 1.0, np.nan, 3.0, 3.0, 9.0], dtype="float32")
+    index = SortedRangeIndex(values)
+
+    assert sorted(index.rows_between(3, 5).tolist()) == [0, 3, 4]
+    assert index.rows_between(6, 8).size == 0
+    assert sorted(index.rows_between(-np.inf, np.inf).tolist()) == [0, 1, 3, 4, 5]
+    np.testing.assert_array_equal(index.order[index.rank], np.arange(len(values)))
+
+
+def test_dashboard_index_random_specs_match_column_scan(
+    dashboard_df: pd.DataFrame,
+) -> None:
+    """Agree with the scan on narrow (sparse path) and wide (dense path) ranges."""
+    index = DashboardIndex(dashboard_df)
+    rng = np.random.default_rng(7)
+
+    for _ in range(50):
+        lo, hi = sorted(rng.uniform(0, 40, 2))
+        spec = FilterSpec.from_inputs(
+            job_role=list(rng.choice(["Analyst", "Manager", "Designer"], 2)),
+            experience=sorted(rng.integers(0, 20, 2)),
+            manual_hours=(lo, hi),
+            tasks_automated=(rng.uniform(0, 50), rng.uniform(50, 100)),
+        )
+        np.testing.assert_array_equal(
+            index.select(spec), np.flatnonzero(spec.to_mask(dashboard_df))
+        )
+
+
+def test_dashboard_index_skips_ranges_covering_every_row(
+    dashboard_df: pd.DataFrame,
+) -> None:
+    """Treat slider ranges at their full extent as no filter."""
+    index = DashboardIndex(dashboard_df)
+    spec = FilterSpec.from_inputs(experience=(0, 19), manual_hours=(5, 40))
+
+    # manual_hours has missing values, so only its range stays active
+    assert list(index.range_positions(spec)) == ["manual_hours"]
+
+
+def test_bitmap_rows_lists_set_bits() -> None:
+    """Expand only the set bits of a sparse bitmap."""
+    mask = np.zeros(300, dtype=bool)
+    mask[[0, 63, 64, 200, 299]] = True
+
+    np.testing.assert_array_equal(bitmap_rows(pack_bits(mask)), [0, 63, 64, 200, 299])
+    assert bitmap_rows(pack_bits(np.zeros(10, dtype=bool))).size == 0
+
+
+def test_incremental_filter_follows_a_random_walk_of_inputs(
+    dashboard_df: pd.DataFrame,
+) -> None:
+    """Match a from-scratch evaluation after every single-input change."""
+    index = DashboardIndex(dashboard_df)
+    incremental = IncrementalFilter(index)
+    rng = np.random.default_rng(11)
+
+    inputs = dict(
+        job_role=["All"],
+        ai_band=["All"],
+        experience=[0, 19],
+        ai_usage=[0, 30],
+        manual_hours=[5, 40],
+        tasks_automated=[0, 100],
+        deadline_pressure=["Low", "Medium", "High"],
+    )
+    choices = {
+        "job_role": ["All", "Analyst", "Manager", "Designer", "Developer"],
+        "ai_band": ["All", "Low", "Moderate", "High"],
+        "deadline_pressure": ["Low", "Medium", "High"],
+    }
+    extents = {
+        "experience": (0, 19),
+        "ai_usage": (0, 30),
+        "manual_hours": (5, 40),
+        "tasks_automated": (0, 100),
+    }
+
+    for _ in range(200):
+        key = rng.choice(list(inputs))
+        if key in choices:
+            size = rng.integers(0, len(choices[key]) + 1)
+            inputs[key] = list(rng.choice(choices[key], size, replace=False))
+        else:
+            lo, hi = extents[key]
+            inputs[key] = sorted(rng.uniform(lo, hi, 2).round(1))
+
+        spec = FilterSpec.from_inputs(**inputs)
+        np.testing.assert_array_equal(incremental.update(spec), index.select(spec))
+
+
+def test_incremental_filter_narrowing_rechecks_previous_rows_only(
+    dashboard_df: pd.DataFrame,
+) -> None:
+    """Narrowing a slider yields a subset of the previous selection."""
+    index = DashboardIndex(dashboard_df)
+    incremental = IncrementalFilter(index)
+
+    wide = incremental.update(FilterSpec.from_inputs(job_role=["Analyst"], ai_usage=(2, 25)))
+    narrow = incremental.update(FilterSpec.from_inputs(job_role=["Analyst"], ai_usage=(5, 20)))
+
+    assert set(narrow) <= set(wide)
+    np.testing.assert_array_equal(
+        narrow, index.select(FilterSpec.from_inputs(job_role=["Analyst"], ai_usage=(5, 20)))
+    )
+
+
+def test_wavelet_matrix_kth_matches_sorted_slices() -> None:
+    rng = np.random.default_rng(5)
+    symbols = rng.integers(0, 300, 500)
+    matrix = WaveletMatrix(symbols)
+    for _ in range(200):
+        start, stop = np.sort(rng.integers(0, len(symbols) + 1, 2))
+        if start == stop:
+            continue
+        k = int(rng.integers(stop - start))
+        assert matrix.kth(start, stop, k) == np.sort(symbols[start:stop])[k]
+
+
+def test_range_median_index_matches_pandas_medians(dashboard_df: pd.DataFrame) -> None:
+    rng = np.random.default_rng(6)
+    keys = dashboard_df["manual_work_hours_per_week"]
+    values = dashboard_df["ai_tool_usage_hours_per_week"].copy()
+    values.iloc[::7] = np.nan
+    index = RangeMedianIndex(SortedRangeIndex(keys), values)
+
+    for _ in range(200):
+        lo, hi = np.sort(rng.uniform(0, 45, 2))
+        selected = values[(keys >= lo) & (keys <= hi)]
+        assert index.count(lo, hi) == selected.count()
+        expected = selected.median()
+        if pd.isna(expected):
+            assert index.median(lo, hi) is None
+        else:
+            assert index.median(lo, hi) == pytest.approx(float(expected), rel=1e-6)
+
+
+def test_dashboard_index_caches_range_median_indexes(dashboard_df: pd.DataFrame) -> None:
+    index = DashboardIndex(dashboard_df)
+    built = index.range_median_index("experience", "tasks_automated_percent")
+
+    assert index.range_median_index("experience", "tasks_automated_percent") is built
+    expected = dashboard_df.loc[
+        dashboard_df["experience_years"].between(3, 8), "tasks_automated_percent"
+    ].median()
+    assert built.median(3, 8) == pytest.approx(float(expected), rel=1e-6)
@@ -7,12 +7,19 @@ from __future__ import annotations
 import pandas as pd
 import pytest
 
+from src.indexes import RangeMedianIndex, SortedRangeIndex
 from src.kpis import (
+    KpiBundle,
+    compute_kpi_bundle,
     count_card,
     high_burnout_pct_card,
+    high_burnout_share_card,
     kpi_card,
     median_metric_card,
+    median_value_card,
     percent_diff,
+    range_median,
+    row_count_card,
     safe_mean,
     safe_median,
     trend_arrow,
@@ -62,6 +69,17 @@ def test_safe_median_returns_float_for_valid_series():
     assert isinstance(safe_median(series), float)
 
 
+def test_range_median_matches_safe_median_of_the_range():
+    """range_median should equal safe_median of the rows within the bounds."""
+    keys = pd.Series([1, 2, 2, 3, 5, 8])
+    values = pd.Series([4.0, 9.0, 1.0, float("nan"), 7.0, 2.0])
+    index = RangeMedianIndex(SortedRangeIndex(keys), values)
+
+    assert range_median(index, (2, 5)) == safe_median(values[keys.between(2, 5)])
+    assert range_median(index, (3, 3)) is None
+    assert range_median(index, (9, 10)) is None
+
+
 @pytest.mark.parametrize(
     ("value", "baseline", "expected"),
     [
@@ -217,6 +235,32 @@ def test_high_burnout_pct_card_renders_percent_and_comparison():
     assert "kpi-sub up" in rendered
 
 
+def test_median_value_card_formats_precomputed_median():
+    """median_value_card should format a median computed elsewhere."""
+    card = median_value_card(
+        4.5, "Median Burnout Risk Score", baseline=5.0, higher_is_better=False
+    )
+    rendered = _rendered_tag_text(card)
+
+    assert "4.5" in rendered
+    assert "▼ 10% vs baseline" in rendered
+    assert "kpi-sub down" in rendered
+
+    empty = _rendered_tag_text(
+        median_value_card(None, "Median", baseline=5.0, higher_is_better=True)
+    )
+    assert "—" in empty
+
+
+def test_high_burnout_share_card_formats_precomputed_share():
+    """high_burnout_share_card should format a share computed elsewhere."""
+    rendered = _rendered_tag_text(high_burnout_share_card(0.5, 0.25))
+
+    assert "50.0%" in rendered
+    assert "▲ 100% vs baseline" in rendered
+    assert "—" in _rendered_tag_text(high_burnout_share_card(None, 0.25))
+
+
 def test_count_card_returns_zero_for_empty_dataframe():
     """count_card should show zero when the dataframe is empty."""
     df = pd.DataFrame()
@@ -237,4 +281,51 @@ def test_count_card_renders_row_count_and_subtitle():
 
     assert "Employees Found" in rendered
     assert "1,234" in rendered
-    assert "Rows returned by AI query" in rendered
\ No newline at end of file
+    assert "Rows returned by AI query" in rendered
+
+def test_compute_kpi_bundle_matches_per_column_helpers():
+    """compute_kpi_bundle should agree with safe_median and the share card."""
+    df = pd.DataFrame(
+        {
+            "productivity_score": [70.0, 80.0, None, 90.0],
+            "burnout_risk_score": [3.0, 6.0, 9.0, 4.0],
+            "work_life_balance_score": [5.0, 7.0, 6.0, 8.0],
+            "burnout_risk_level": pd.Categorical(["Low", "High", "High", "Medium"]),
+        }
+    )
+
+    bundle = compute_kpi_bundle(df)
+
+    assert bundle == KpiBundle(
+        row_count=4,
+        median_productivity=safe_median(df["productivity_score"]),
+        median_burnout=safe_median(df["burnout_risk_score"]),
+        median_wlb=safe_median(df["work_life_balance_score"]),
+        high_burnout_count=2,
+        high_burnout_share=0.5,
+    )
+    plain = compute_kpi_bundle(df.astype({"burnout_risk_level": str}))
+    assert plain.high_burnout_count == 2
+
+
+def test_compute_kpi_bundle_handles_empty_and_partial_frames():
+    """compute_kpi_bundle should report undefined values instead of failing."""
+    assert compute_kpi_bundle(pd.DataFrame()) == KpiBundle(0, None, None, None, 0, None)
+
+    partial = compute_kpi_bundle(
+        pd.DataFrame({"burnout_risk_score": [2.0, 4.0], "job_role": ["A", "B"]})
+    )
+
+    assert partial.row_count == 2
+    assert partial.median_burnout == pytest.approx(3.0)
+    assert partial.median_productivity is None
+    assert partial.high_burnout_share is None
+
+
+def test_row_count_card_formats_precomputed_count():
+    """row_count_card should format a count computed elsewhere."""
+    rendered = _rendered_tag_text(row_count_card(1234, subtitle="Rows shown"))
+
+    assert "1,234" in rendered
+    assert "Rows shown" in rendered
+    assert ">0<" in _rendered_tag_text(row_count_card(0))
@@ -0,0 +1,90 @@
+# tests/test_lazy.py
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.utils.lazy import Lazy
+
+
+def test_lazy_builds_value_on_first_get():
+    calls = []
+    lazy = Lazy(lambda: calls.append(1) or "value")
+
+    assert not lazy.ready
+    assert calls == []
+
+    assert lazy.get() == "value"
+    assert lazy.get() == "value"
+    assert lazy.ready
+    assert calls == [1]
+
+
+def test_lazy_runs_factory_once_under_concurrency():
+    calls = []
+    start = threading.Event()
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    lazy = Lazy(factory)
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(lazy.get())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({id(result) for result in results}) == 1
+
+
+def test_lazy_retries_after_factory_error():
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("data not ready")
+        return 42
+
+    lazy = Lazy(factory)
+
+    with pytest.raises(RuntimeError):
+        lazy.get()
+    assert not lazy.ready
+
+    assert lazy.get() == 42
+    assert len(attempts) == 2
+
+
+def test_lazy_warm_up_builds_value_in_background():
+    lazy = Lazy(lambda: "warm")
+
+    lazy.warm_up().join(timeout=5)
+
+    assert lazy.ready
+    assert lazy.get() == "warm"
+
+
+def test_lazy_warm_up_logs_failure_and_leaves_value_unset(caplog):
+    def factory():
+        raise RuntimeError("boom")
+
+    lazy = Lazy(factory, name="broken")
+
+    lazy.warm_up().join(timeout=5)
+
+    assert not lazy.ready
+    assert "Background warm-up of broken failed" in caplog.text
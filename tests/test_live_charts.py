@@ -0,0 +1,105 @@
+# tests/test_live_charts.py
+
+from __future__ import annotations
+
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from src.aggregates import summarize_scatter
+from src.charts import (
+    SHOWN_LABEL_PARAM,
+    burnout_by_role_frame,
+    burnout_by_role_spec,
+    productivity_vs_burnout_frame,
+    productivity_vs_burnout_spec,
+)
+from src.live_charts import DATA_UPDATES_TRAIT, LiveChart, dataset_name
+
+
+def scatter_frame(d: pd.DataFrame, **limits):
+    """Scatter frame of the rows ``d``."""
+    return productivity_vs_burnout_frame(summarize_scatter(d, **limits))
+
+
+@pytest.fixture
+def scatter_df() -> pd.DataFrame:
+    """Employees for the productivity vs burnout scatter."""
+    return pd.DataFrame(
+        {
+            "job_role": ["Analyst", "Analyst", "Manager", "Designer"],
+            "ai_band": ["Low", "Moderate", "High", "Low"],
+            "productivity_score": [70.0, 65.0, 80.0, 60.0],
+            "burnout_risk_score": [6.0, 8.0, 9.0, 5.5],
+        }
+    )
+
+
+@pytest.fixture
+def scatter_chart() -> LiveChart:
+    return LiveChart(
+        partial(
+            productivity_vs_burnout_spec,
+            baseline_median_productivity=70.0,
+            baseline_median_burnout=6.0,
+        )
+    )
+
+
+def test_dataset_name_reads_first_layer_or_single_view():
+    assert dataset_name({"layer": [{"data": {"name": "data-a"}}], "data": {"name": "x"}}) == "data-a"
+    assert dataset_name({"layer": [{"mark": "rect"}], "data": {"name": "data-b"}}) == "data-b"
+    assert dataset_name({"data": {"name": "data-c"}}) == "data-c"
+    assert dataset_name({"data": {"values": []}}) is None
+
+
+def test_push_before_render_asks_for_a_render(scatter_chart, scatter_df):
+    assert scatter_chart.push(scatter_frame(scatter_df)) is False
+
+
+def test_push_sends_rows_into_the_rendered_dataset(scatter_chart, scatter_df):
+    widget = scatter_chart.render(scatter_frame(scatter_df))
+    spec = widget.spec
+
+    narrowed = scatter_frame(scatter_df[scatter_df["job_role"] == "Analyst"])
+    assert scatter_chart.push(narrowed) is True
+
+    # The spec is untouched; only the rows and the title param change.
+    assert widget.spec is spec
+    (update,) = getattr(widget, DATA_UPDATES_TRAIT)
+    assert update["namespace"] == "data"
+    assert update["name"] == spec["layer"][0]["data"]["name"]
+    assert [row["job_role"] for row in update["value"]] == ["Analyst", "Analyst"]
+    assert getattr(widget.params, SHOWN_LABEL_PARAM) == "All 2 employees shown"
+
+
+def test_push_refuses_a_different_layout(scatter_chart, scatter_df):
+    scatter_chart.render(scatter_frame(scatter_df))
+
+    assert scatter_chart.push(scatter_frame(scatter_df, density_above=2)) is False
+    assert scatter_chart.push(scatter_frame(scatter_df.iloc[:0])) is False
+
+
+def test_placeholder_frames_push_without_data():
+    live = LiveChart(burnout_by_role_spec)
+    widget = live.render(burnout_by_role_frame(None))
+
+    assert live.push(burnout_by_role_frame(None)) is True
+    assert getattr(widget, DATA_UPDATES_TRAIT) is None
+
+
+def test_push_asks_for_a_render_when_data_cannot_be_sent(
+    scatter_chart, scatter_df, monkeypatch: pytest.MonkeyPatch
+):
+    frame = scatter_frame(scatter_df)
+    scatter_chart.render(frame)
+
+    # A widget without the update trait, e.g. from another altair release
+    monkeypatch.setattr("src.live_charts.DATA_UPDATES_TRAIT", "_no_such_trait")
+    assert scatter_chart.push(frame) is False
+    monkeypatch.undo()
+
+    # A spec whose data is not a named dataset
+    scatter_chart._dataset = None
+    assert scatter_chart.push(frame) is False
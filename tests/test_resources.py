@@ -0,0 +1,126 @@
+# tests/test_resources.py
+
+from __future__ import annotations
+
+import json
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.duckdb_store
+from src.data import summarize_dataset
+from src.duckdb_store import build_duckdb_database
+from src.filters import FilterSpec
+from src.resources import load_dashboard_resources
+from src.result_cache import FilterResult
+from src.snapshot import AppData
+
+
+@pytest.fixture
+def employees() -> pd.DataFrame:
+    """Small employee frame with every column the dashboard reads."""
+    rng = np.random.default_rng(5)
+    n = 300
+    levels = pd.CategoricalDtype(["Low", "Medium", "High"], ordered=True)
+    return pd.DataFrame(
+        {
+            "job_role": pd.Categorical(rng.choice(["Analyst", "Manager"], n)),
+            "ai_band": pd.Categorical(rng.choice(["Low", "Moderate", "High"], n)),
+            "deadline_pressure_level": pd.Series(rng.choice(levels.categories, n)).astype(levels),
+            "burnout_risk_level": pd.Series(rng.choice(levels.categories, n)).astype(levels),
+            "experience_years": rng.integers(0, 15, n).astype("int8"),
+            "ai_tool_usage_hours_per_week": rng.uniform(0, 30, n).astype("float32"),
+            "manual_work_hours_per_week": rng.uniform(5, 40, n).astype("float32"),
+            "tasks_automated_percent": rng.uniform(0, 100, n).astype("float32"),
+            "meeting_hours_per_week": rng.uniform(0, 15, n).astype("float32"),
+            "collaboration_hours_per_week": rng.uniform(0, 15, n).astype("float32"),
+            "focus_hours_per_day": rng.uniform(0, 8, n).astype("float32"),
+            "productivity_score": rng.uniform(30, 100, n).astype("float32"),
+            "burnout_risk_score": rng.uniform(0, 10, n).astype("float32"),
+            "work_life_balance_score": rng.uniform(0, 10, n).astype("float32"),
+        }
+    )
+
+
+@pytest.fixture
+def duckdb_engine(tmp_path, employees, monkeypatch: pytest.MonkeyPatch):
+    """
+    Run the "duckdb" engine against a database built for revision ``"r1"``.
+
+    Returns the sidecar dict the resources read, so tests can edit it.
+    """
+    db_path = tmp_path / "employees.duckdb"
+    build_duckdb_database(employees, "r1", db_path)
+    meta = {"revision": "r1"}
+
+    monkeypatch.setattr("src.resources.FILTER_ENGINE", "duckdb")
+    monkeypatch.setattr("src.resources.KPI_CUBE_ENABLED", False)
+    monkeypatch.setattr("src.resources.snapshot_is_stale", lambda: False)
+    monkeypatch.setattr("src.resources.read_snapshot_metadata", lambda: meta)
+    monkeypatch.setattr(
+        src.duckdb_store,
+        "open_duckdb_database",
+        partial(src.duckdb_store.open_duckdb_database, db_path=db_path),
+    )
+    return meta
+
+
+def test_duckdb_engine_serves_the_database_without_loading_rows(
+    duckdb_engine, employees, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Answer filters, choices and the preview from the file alone."""
+
+    def load_app_data():
+        raise AssertionError("the dataset was loaded into the process")
+
+    monkeypatch.setattr("src.resources.load_app_data", load_app_data)
+
+    res = load_dashboard_resources()
+
+    assert res.df is None and res.index is None and res.cube is None
+    assert len(res.default_ai_preview_df) == 100
+    assert res.default_ai_preview_df["productivity_score"].dtype == "float64"
+    # No summary in the sidecar: one query over the table instead
+    expected = summarize_dataset(employees)
+    assert res.filter_choices == expected["filter_choices"]
+    assert res.slider_ranges == expected["slider_ranges"]
+    assert res.baselines == pytest.approx(expected["baselines"])
+    result = FilterResult.from_statements(res.statements, FilterSpec())
+    assert result.aggregates["row_count"] == 300
+    res.statements.close()
+
+
+def test_duckdb_engine_reads_the_summary_from_the_sidecar(duckdb_engine) -> None:
+    """Take sidebar choices and baselines from the stored summary."""
+    summary = {
+        "filter_choices": {"job_role_choices": ["All", "Stored"]},
+        "slider_ranges": {"experience": [1, 2]},
+        "baselines": {"median_burnout": 1.5},
+    }
+    duckdb_engine["summary"] = json.loads(json.dumps(summary))
+
+    res = load_dashboard_resources()
+
+    assert res.filter_choices == summary["filter_choices"]
+    assert res.slider_ranges == {"experience": (1, 2)}
+    assert res.baselines == summary["baselines"]
+    res.statements.close()
+
+
+def test_duckdb_engine_falls_back_to_the_shared_data(
+    duckdb_engine, employees, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Query the in-memory data when the database is for another revision."""
+    duckdb_engine["revision"] = "r2"
+    monkeypatch.setattr(
+        "src.resources.load_app_data", lambda: AppData(employees, None, False)
+    )
+
+    res = load_dashboard_resources()
+
+    assert res.df is employees
+    result = FilterResult.from_statements(res.statements, FilterSpec())
+    assert result.aggregates["row_count"] == 300
+    res.statements.close()
@@ -0,0 +1,151 @@
+# tests/test_result_cache.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.aggregates import ROW_LEVEL_COLUMNS, summarize_dashboard
+from src.filters import FilteredView, FilterSpec
+from src.result_cache import FilterResult, ResultCache
+
+
+@dataclass(frozen=True)
+class Sized:
+    """Cache value with an explicit size."""
+
+    name: str
+    nbytes: int
+
+
+@pytest.fixture
+def result_df() -> pd.DataFrame:
+    """Filtered selection with every column the aggregates read."""
+    return pd.DataFrame(
+        {
+            "job_role": ["Analyst", "Analyst", "Manager"],
+            "productivity_score": [70.0, 80.0, 60.0],
+            "burnout_risk_score": [5.0, 7.0, 9.0],
+            "ai_band": ["Low", "High", "Low"],
+            "ai_tool_usage_hours_per_week": [2.0, 9.0, 4.0],
+            "work_life_balance_score": [6.0, 4.0, 3.0],
+            "burnout_risk_level": ["Low", "High", "High"],
+            "meeting_hours_per_week": [5.0, 7.0, 9.0],
+            "collaboration_hours_per_week": [4.0, 4.0, 4.0],
+            "focus_hours_per_day": [3.0, 4.0, 5.0],
+            "manual_work_hours_per_week": [20.0, 10.0, 0.0],
+        }
+    )
+
+
+def test_result_cache_counts_hits_and_misses() -> None:
+    """Count a miss for an unknown key and a hit once it is stored."""
+    cache = ResultCache(max_bytes=1_000)
+    key = FilterSpec.from_inputs(job_role=["Analyst"])
+
+    assert cache.get(key) is None
+    cache.put(key, Sized("a", 100))
+
+    # An equivalent selection from another session hits the same entry
+    assert cache.get(FilterSpec.from_inputs(job_role=["Analyst", "All"])) is None
+    assert cache.get(FilterSpec.from_inputs(job_role=("Analyst",))).name == "a"
+    assert cache.stats() | {"bytes": 0} == {
+        "entries": 1,
+        "bytes": 0,
+        "max_bytes": 1_000,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+    }
+
+
+def test_result_cache_evicts_least_recently_used_within_budget() -> None:
+    """Evict the oldest untouched entries once the byte budget is exceeded."""
+    cache = ResultCache(max_bytes=300)
+    cache.put("a", Sized("a", 100))
+    cache.put("b", Sized("b", 100))
+    cache.put("c", Sized("c", 100))
+    cache.get("a")
+
+    cache.put("d", Sized("d", 150))
+
+    assert "a" in cache and "d" in cache
+    assert "b" not in cache and "c" not in cache
+    assert cache.current_bytes == 250
+    assert cache.evictions == 2
+
+
+def test_result_cache_skips_values_larger_than_budget() -> None:
+    """Return oversized values without storing them."""
+    cache = ResultCache(max_bytes=100)
+
+    value = cache.get_or_compute("big", lambda: Sized("big", 500))
+
+    assert value.name == "big"
+    assert len(cache) == 0
+
+
+def test_result_cache_get_or_compute_computes_once() -> None:
+    """Call the factory on the first request only."""
+    cache = ResultCache(max_bytes=1_000)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return Sized("x", 10)
+
+    first = cache.get_or_compute("k", compute)
+    second = cache.get_or_compute("k", compute)
+
+    assert first is second
+    assert calls == [1]
+
+
+def test_filter_result_holds_aggregates_and_chart_inputs(result_df: pd.DataFrame) -> None:
+    """Precompute KPI values, chart aggregates and row-level chart inputs."""
+    result = FilterResult.from_frame(result_df)
+
+    assert result.aggregates["row_count"] == 3
+    assert result.aggregates["median_burnout"] == pytest.approx(7.0)
+    assert result.aggregates["high_burnout_share"] == pytest.approx(2 / 3)
+    role = result.aggregates["burnout_by_role"].set_index("job_role")["avg_burnout"]
+    assert role.to_dict() == {"Manager": 9.0, "Analyst": 6.0}
+    assert result.aggregates["ai_usage_bins"]["count"].sum() == 3
+    assert len(result.aggregates["scatter"]["points"]) == 3
+    assert result.nbytes > 0
+
+
+def test_filter_result_from_view_keeps_no_rows(result_df: pd.DataFrame) -> None:
+    """Cache bounded chart inputs, whatever the size of the selection."""
+    rng = np.random.default_rng(0)
+    wide = result_df.sample(30_000, replace=True, random_state=0).assign(
+        ai_band=rng.choice(["Low", "Moderate", "High"], 30_000),
+        ai_tool_usage_hours_per_week=rng.uniform(0, 30, 30_000),
+        Employee_ID=[bytes(16)] * 30_000,
+    )
+    rows = np.arange(0, 30_000, 2)
+
+    result = FilterResult.from_view(FilteredView(wide, rows), max_points=500)
+
+    scatter = result.aggregates["scatter"]
+    assert scatter["row_count"] == len(rows)
+    assert len(scatter["points"]) == 500
+    assert result.aggregates["median_burnout"] == summarize_dashboard(wide.iloc[rows])[
+        "median_burnout"
+    ]
+    # Far smaller than the selected rows' chart columns alone.
+    assert result.nbytes < wide.iloc[rows][ROW_LEVEL_COLUMNS].memory_usage(deep=True).sum() / 4
+
+
+def test_filter_result_for_empty_selection() -> None:
+    """Leave undefined aggregates as None for an empty selection."""
+    result = FilterResult.from_frame(pd.DataFrame())
+
+    assert result.aggregates["row_count"] == 0
+    assert result.aggregates["median_productivity"] is None
+    assert result.aggregates["burnout_by_role"] is None
+    assert result.aggregates["ai_usage_bins"] is None
+    assert result.aggregates["scatter"] is None
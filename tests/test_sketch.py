@@ -0,0 +1,91 @@
+# tests/test_sketch.py
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.sketch import KLLSketch, rank_error_bound
+
+
+def _rank(values: np.ndarray, estimate: float) -> float:
+    return float((values < estimate).mean())
+
+
+def test_small_sketch_is_exact() -> None:
+    """Return the pandas-style median while nothing has been compacted."""
+    values = np.array([5.0, 1.0, 4.0, 2.0, np.nan, 3.0, 6.0])
+    sketch = KLLSketch(k=50)
+    sketch.update(values)
+
+    assert sketch.is_exact
+    assert sketch.n == 6
+    assert sketch.median() == pytest.approx(3.5)
+
+
+def test_empty_sketch_has_no_median() -> None:
+    """Report no median for an empty sketch."""
+    assert KLLSketch().median() is None
+    assert KLLSketch.merged([]).median() is None
+
+
+def test_large_stream_stays_small_and_within_bound() -> None:
+    """Keep memory bounded and the median rank within the documented error."""
+    values = np.random.default_rng(0).standard_normal(500_000)
+    sketch = KLLSketch(k=200, seed=1)
+    sketch.update(values)
+
+    retained = sum(len(level) for level in sketch.levels)
+    assert not sketch.is_exact
+    assert sketch.n == len(values)
+    assert retained < 3 * sketch.k
+    assert abs(_rank(values, sketch.median()) - 0.5) <= rank_error_bound(200)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_merged_parts_stay_within_bound(seed: int) -> None:
+    """Merge per-segment sketches into one estimate of the whole."""
+    rng = np.random.default_rng(seed)
+    values = rng.gamma(2.0, 3.0, 200_000)
+    parts = np.array_split(values, 40)
+    sketches = []
+    for i, part in enumerate(parts):
+        sketch = KLLSketch(k=200, seed=seed * 100 + i)
+        sketch.update(part)
+        sketches.append(sketch)
+
+    merged = KLLSketch.merged(sketches, k=200, seed=seed)
+
+    assert merged.n == len(values)
+    assert abs(_rank(values, merged.median()) - 0.5) <= rank_error_bound(200)
+
+
+def test_in_place_merge_matches_counts() -> None:
+    """Preserve the total weight when merging in place."""
+    a, b = KLLSketch(k=20, seed=0), KLLSketch(k=20, seed=1)
+    a.update(np.arange(1000))
+    b.update(np.arange(1000, 1500))
+
+    a.merge(b)
+
+    values, levels = a.items()
+    assert a.n == 1500
+    assert int(np.sum(np.left_shift(1, levels.astype(np.int64)))) == 1500
+    assert abs(_rank(np.arange(1500), a.median()) - 0.5) <= 0.1
+
+
+def test_items_round_trip() -> None:
+    """Rebuild an identical sketch from its flattened items."""
+    sketch = KLLSketch(k=30, seed=2)
+    sketch.update(np.random.default_rng(2).uniform(size=5000))
+
+    rebuilt = KLLSketch.from_items(*sketch.items(), k=30)
+
+    assert rebuilt.n == sketch.n
+    assert rebuilt.median() == sketch.median()
+
+
+def test_rejects_tiny_k() -> None:
+    """Require room for at least two items per level."""
+    with pytest.raises(ValueError, match="at least 2"):
+        KLLSketch(k=1)
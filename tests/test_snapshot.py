@@ -0,0 +1,307 @@
+# tests/test_snapshot.py
+
+from __future__ import annotations
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.bands import load_band_edges
+from src.data import load_dashboard_data
+from src.shared_data import map_shared_dataset, shared_frame
+from src.snapshot import (
+    SNAPSHOT_VERSION,
+    append_employees,
+    build_snapshot,
+    load_snapshot,
+    read_snapshot_metadata,
+    reband_snapshot,
+    snapshot_is_stale,
+)
+
+
+@pytest.fixture
+def raw_paths(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Write tiny raw CSVs and point the loader at them."""
+    features = pd.DataFrame(
+        {
+            "Employee_ID": ["a", "b", "c"],
+            "job_role": ["Analyst", "Manager", "Analyst"],
+            "experience_years": [2, 10, 5],
+            "ai_tool_usage_hours_per_week": [2.0, 10.0, 20.0],
+            "manual_work_hours_per_week": [15.0, 30.0, 25.0],
+            "meeting_hours_per_week": [5.0, 8.0, 6.0],
+            "deadline_pressure_level": ["Low", "High", "Medium"],
+            "burnout_risk_score": [4.0, 9.0, 7.0],
+        }
+    )
+    targets = pd.DataFrame(
+        {
+            "Employee_ID": ["a", "b", "c"],
+            "productivity_score": [80.0, 60.0, 75.0],
+            "burnout_risk_level": ["Low", "High", "High"],
+        }
+    )
+    features_path = tmp_path / "features.csv"
+    targets_path = tmp_path / "targets.csv"
+    features.to_csv(features_path, index=False)
+    targets.to_csv(targets_path, index=False)
+
+    monkeypatch.setattr("src.data.FEATURES_PATH", features_path)
+    monkeypatch.setattr("src.data.TARGETS_PATH", targets_path)
+
+    return {
+        "sources": (features_path, targets_path),
+        "parquet_path": tmp_path / "processed" / "snapshot.parquet",
+        "meta_path": tmp_path / "processed" / "snapshot.meta.json",
+        "bands_path": tmp_path / "processed" / "bands.json",
+        "appends_dir": tmp_path / "processed" / "appends",
+        "arrow_path": tmp_path / "processed" / "snapshot.arrow",
+    }
+
+
+def _is_stale(paths: dict) -> bool:
+    return snapshot_is_stale(paths["parquet_path"], paths["meta_path"], paths["sources"])
+
+
+def _load(paths: dict) -> pd.DataFrame:
+    return load_snapshot(paths["parquet_path"], paths["meta_path"], paths["appends_dir"])
+
+
+@pytest.fixture
+def snapshot_paths(raw_paths) -> dict:
+    """Paths accepted by the append helper."""
+    return {k: v for k, v in raw_paths.items() if k not in ("sources", "arrow_path")}
+
+
+@pytest.fixture
+def new_batch() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Two new employees, one beyond the stored AI usage range."""
+    features = pd.DataFrame(
+        {
+            "Employee_ID": ["d", "e"],
+            "job_role": ["Writer", "Analyst"],
+            "experience_years": [1, 3],
+            "ai_tool_usage_hours_per_week": [1.0, 40.0],
+            "manual_work_hours_per_week": [10.0, 20.0],
+            "meeting_hours_per_week": [2.0, 4.0],
+            "deadline_pressure_level": ["Low", "High"],
+            "burnout_risk_score": [3.0, 8.0],
+        }
+    )
+    targets = pd.DataFrame(
+        {
+            "Employee_ID": ["d", "e"],
+            "productivity_score": [70.0, 65.0],
+            "burnout_risk_level": ["Low", "High"],
+        }
+    )
+    return features, targets
+
+
+def test_build_snapshot_writes_parquet_and_sidecar(raw_paths) -> None:
+    """The build stage writes the derived columns and a versioned sidecar."""
+    meta = build_snapshot(**raw_paths)
+
+    assert meta["snapshot_version"] == SNAPSHOT_VERSION
+    assert meta["row_count"] == 3
+    assert [fp["name"] for fp in meta["sources"]] == ["features.csv", "targets.csv"]
+    assert read_snapshot_metadata(raw_paths["meta_path"]) == meta
+
+    df = _load(raw_paths)
+    assert {"workload_score", "workload_band", "ai_band"} <= set(df.columns)
+    assert isinstance(df["ai_band"].dtype, pd.CategoricalDtype)
+
+
+def test_build_snapshot_reads_the_given_sources(raw_paths, tmp_path) -> None:
+    """The snapshot holds the rows of the sources it is fingerprinted from."""
+    other = tmp_path / "other"
+    other.mkdir()
+    sources = []
+    for path in raw_paths["sources"]:
+        rows = pd.read_csv(path).iloc[:2]
+        sources.append(other / path.name)
+        rows.to_csv(sources[-1], index=False)
+
+    meta = build_snapshot(**{**raw_paths, "sources": tuple(sources)})
+
+    assert meta["row_count"] == 2
+    assert len(_load(raw_paths)) == 2
+    assert not snapshot_is_stale(raw_paths["parquet_path"], raw_paths["meta_path"], sources)
+
+
+def test_snapshot_is_fresh_after_build(raw_paths) -> None:
+    """A freshly built snapshot is not stale."""
+    build_snapshot(**raw_paths)
+
+    assert not _is_stale(raw_paths)
+
+
+def test_snapshot_is_stale_when_missing(raw_paths) -> None:
+    """A missing snapshot or sidecar is stale."""
+    assert _is_stale(raw_paths)
+
+    build_snapshot(**raw_paths)
+    raw_paths["meta_path"].unlink()
+
+    assert _is_stale(raw_paths)
+
+
+def test_snapshot_is_stale_when_source_changes(raw_paths) -> None:
+    """Editing a raw CSV invalidates the snapshot."""
+    build_snapshot(**raw_paths)
+
+    features_path = raw_paths["sources"][0]
+    with open(features_path, "a") as fh:
+        fh.write("d,Writer,1,1.0,1.0,1.0,Low,1.0\n")
+
+    assert _is_stale(raw_paths)
+
+
+def test_snapshot_is_fresh_when_only_mtime_changes(raw_paths) -> None:
+    """Touching a source without changing its content keeps the snapshot."""
+    build_snapshot(**raw_paths)
+
+    features_path = raw_paths["sources"][0]
+    stat = os.stat(features_path)
+    os.utime(features_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert not _is_stale(raw_paths)
+
+
+def test_snapshot_is_stale_on_version_mismatch(raw_paths) -> None:
+    """Snapshots written by another SNAPSHOT_VERSION are rebuilt."""
+    meta = build_snapshot(**raw_paths)
+    meta["snapshot_version"] = SNAPSHOT_VERSION + 1
+    raw_paths["meta_path"].write_text(json.dumps(meta))
+
+    assert _is_stale(raw_paths)
+
+
+def test_snapshot_without_raw_sources_is_not_stale(raw_paths) -> None:
+    """Deployments that ship only the snapshot keep using it."""
+    build_snapshot(**raw_paths)
+    for path in raw_paths["sources"]:
+        path.unlink()
+
+    assert not _is_stale(raw_paths)
+
+
+def test_build_snapshot_writes_band_edges(raw_paths) -> None:
+    """The bands artifact stores the qcut edges of the built snapshot."""
+    build_snapshot(**raw_paths)
+
+    edges = load_band_edges(raw_paths["bands_path"])
+
+    assert edges["ai_tool_usage_hours_per_week"][0] == 2.0
+    assert edges["ai_tool_usage_hours_per_week"][-1] == 20.0
+    assert len(edges["workload_score"]) == 4
+
+
+def test_append_employees_uses_stored_band_edges(
+    raw_paths, snapshot_paths, new_batch
+) -> None:
+    """New employees are banded with stored edges, existing rows are untouched."""
+    build_snapshot(**raw_paths)
+    before = _load(raw_paths)
+
+    batch = append_employees(*new_batch, **snapshot_paths)
+
+    assert batch["ai_band"].astype(str).tolist() == ["Low", "High"]
+
+    after = _load(raw_paths)
+    assert len(after) == 5
+    pd.testing.assert_frame_equal(after.head(3), before, check_categorical=False)
+    assert read_snapshot_metadata(raw_paths["meta_path"])["row_count"] == 5
+
+
+def test_sidecar_summary_tracks_appended_employees(
+    raw_paths, snapshot_paths, new_batch
+) -> None:
+    """Choices, ranges and baselines are stored, dropped on append, refreshed on re-band."""
+    build_snapshot(**raw_paths)
+    stored = read_snapshot_metadata(raw_paths["meta_path"])["summary"]
+    assert stored["slider_ranges"]["experience"] == [2, 10]
+    assert stored["baselines"]["median_burnout"] == 7.0
+
+    append_employees(*new_batch, **snapshot_paths)
+    assert "summary" not in read_snapshot_metadata(raw_paths["meta_path"])
+
+    reband_snapshot(**snapshot_paths, arrow_path=raw_paths["arrow_path"])
+
+    stored = read_snapshot_metadata(raw_paths["meta_path"])["summary"]
+    assert stored["slider_ranges"]["experience"] == [1, 10]
+    assert stored["filter_choices"]["job_role_choices"] == ["All", "Analyst", "Manager", "Writer"]
+    assert stored["baselines"]["high_burnout_rate"] == pytest.approx(3 / 5)
+
+
+def test_append_employees_rejects_existing_ids(
+    raw_paths, snapshot_paths, new_batch
+) -> None:
+    """Appending the same employees twice is refused."""
+    build_snapshot(**raw_paths)
+    append_employees(*new_batch, **snapshot_paths)
+
+    with pytest.raises(ValueError, match="already in the snapshot"):
+        append_employees(*new_batch, **snapshot_paths)
+
+
+def test_reband_snapshot_recomputes_thresholds_over_all_rows(
+    raw_paths, snapshot_paths, new_batch, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Re-banding folds batches in and matches a full rebuild with qcut."""
+    build_snapshot(**raw_paths)
+    append_employees(*new_batch, **snapshot_paths)
+
+    reband_snapshot(**snapshot_paths, arrow_path=raw_paths["arrow_path"])
+
+    assert read_snapshot_metadata(raw_paths["meta_path"])["appended_batches"] == []
+    assert not list(raw_paths["appends_dir"].glob("*.parquet"))
+
+    features = pd.concat([pd.read_csv(raw_paths["sources"][0]), new_batch[0]])
+    targets = pd.concat([pd.read_csv(raw_paths["sources"][1]), new_batch[1]])
+    monkeypatch.setattr(
+        "src.data.pd.read_csv",
+        lambda path: features if "features" in str(path) else targets,
+    )
+    expected = load_dashboard_data()
+
+    rebanded = _load(raw_paths)
+    assert rebanded["ai_band"].astype(str).tolist() == expected["ai_band"].astype(str).tolist()
+    assert rebanded["workload_band"].astype(str).tolist() == expected["workload_band"].astype(str).tolist()
+
+
+def test_build_snapshot_discards_appended_batches(
+    raw_paths, snapshot_paths, new_batch
+) -> None:
+    """A full rebuild from the raw export supersedes appended batches."""
+    build_snapshot(**raw_paths)
+    append_employees(*new_batch, **snapshot_paths)
+
+    build_snapshot(**raw_paths)
+
+    assert not list(raw_paths["appends_dir"].glob("*.parquet"))
+    assert len(_load(raw_paths)) == 3
+
+
+def test_build_snapshot_publishes_shared_arrow_copy(raw_paths) -> None:
+    """The build writes a mappable Arrow copy tagged with the sidecar revision."""
+    meta = build_snapshot(**raw_paths)
+
+    table = map_shared_dataset(meta["revision"], raw_paths["arrow_path"])
+    assert table is not None
+    pd.testing.assert_frame_equal(shared_frame(table), _load(raw_paths))
+
+    assert map_shared_dataset("other-revision", raw_paths["arrow_path"]) is None
+
+
+def test_shared_frame_numeric_columns_are_read_only_views(raw_paths) -> None:
+    """Numeric columns point into the mapped file rather than private copies."""
+    meta = build_snapshot(**raw_paths)
+    df = shared_frame(map_shared_dataset(meta["revision"], raw_paths["arrow_path"]))
+
+    values = df["burnout_risk_score"].to_numpy()
+    assert not values.flags.writeable
+    assert not values.flags.owndata
@@ -0,0 +1,136 @@
+# tests/test_streaming.py
+
+from __future__ import annotations
+
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.bands import load_band_edges
+from src.data import load_dashboard_data, summarize_dataset
+from src.snapshot import build_snapshot_from_partitions, load_app_data
+from src.streaming import (
+    load_partitioned_dataset,
+    merge_value_counts,
+    quantiles_from_counts,
+    stream_build_dataset,
+)
+
+
+@pytest.fixture
+def raw_csvs(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Write a few hundred synthetic employees split across two CSVs."""
+    rng = np.random.default_rng(0)
+    n = 300
+    ids = [str(uuid.UUID(int=int(i) + 1)) for i in rng.permutation(n)]
+
+    features = pd.DataFrame(
+        {
+            "Employee_ID": ids,
+            "job_role": rng.choice(["Analyst", "Manager", "Writer"], n),
+            "experience_years": rng.integers(0, 20, n),
+            "ai_tool_usage_hours_per_week": rng.integers(0, 300, n) / 10,
+            "manual_work_hours_per_week": rng.integers(50, 400, n) / 10,
+            "meeting_hours_per_week": rng.integers(0, 200, n) / 10,
+            "deadline_pressure_level": rng.choice(["Low", "Medium", "High"], n),
+            "burnout_risk_score": rng.integers(0, 100, n) / 10,
+        }
+    )
+    # Targets arrive in a different order and include one unmatched employee.
+    targets = pd.DataFrame(
+        {
+            "Employee_ID": ids[::-1] + [str(uuid.uuid4())],
+            "productivity_score": rng.integers(300, 1000, n + 1) / 10,
+            "burnout_risk_level": rng.choice(["Low", "Medium", "High"], n + 1),
+        }
+    )
+
+    features_path = tmp_path / "features.csv"
+    targets_path = tmp_path / "targets.csv"
+    features.to_csv(features_path, index=False)
+    targets.to_csv(targets_path, index=False)
+
+    monkeypatch.setattr("src.data.FEATURES_PATH", features_path)
+    monkeypatch.setattr("src.data.TARGETS_PATH", targets_path)
+
+    return features_path, targets_path
+
+
+def _sorted_by_id(df: pd.DataFrame) -> pd.DataFrame:
+    key = df["Employee_ID"].map(bytes)
+    return df.iloc[np.argsort(key.to_numpy())].reset_index(drop=True)
+
+
+def test_quantiles_from_counts_match_pandas_quantile() -> None:
+    """Exact quantiles from merged histograms equal Series.quantile."""
+    rng = np.random.default_rng(1)
+    values = pd.Series(rng.integers(0, 500, 1_001) / 10)
+
+    counts = None
+    for start in range(0, len(values), 150):
+        chunk = values.iloc[start : start + 150]
+        counts = merge_value_counts(counts, chunk)
+
+    qs = [0.0, 1 / 3, 0.5, 2 / 3, 1.0]
+    np.testing.assert_allclose(
+        quantiles_from_counts(counts, qs),
+        values.quantile(qs).to_numpy(),
+    )
+
+
+def test_stream_build_matches_in_memory_loader(tmp_path, raw_csvs) -> None:
+    """Chunked, partitioned ingest reproduces load_dashboard_data exactly."""
+    out_dir = tmp_path / "parts"
+
+    manifest = stream_build_dataset(
+        out_dir, *raw_csvs, chunksize=40, partitions=4
+    )
+    streamed = load_partitioned_dataset(out_dir)
+    expected = load_dashboard_data()
+
+    assert manifest["row_count"] == len(expected) == 300
+    assert manifest["partitions"] == 4
+    assert len(list(out_dir.glob("part-*.parquet"))) == 4
+
+    pd.testing.assert_frame_equal(
+        _sorted_by_id(streamed[expected.columns]),
+        _sorted_by_id(expected),
+        check_categorical=False,
+    )
+
+
+def test_stream_build_leaves_no_spill_files(tmp_path, raw_csvs) -> None:
+    """Intermediate spill partitions are removed after the build."""
+    stream_build_dataset(tmp_path / "parts", *raw_csvs, chunksize=100, partitions=2)
+
+    assert not list(tmp_path.glob(".ingest-*"))
+
+
+def test_app_starts_from_the_streamed_snapshot(tmp_path, raw_csvs) -> None:
+    """The streamed partitions become the snapshot the app loader reads."""
+    out_dir = tmp_path / "parts"
+    manifest = stream_build_dataset(out_dir, *raw_csvs, chunksize=40, partitions=4)
+    paths = {
+        "parquet_path": tmp_path / "snapshot.parquet",
+        "meta_path": tmp_path / "snapshot.meta.json",
+        "appends_dir": tmp_path / "appends",
+    }
+
+    meta = build_snapshot_from_partitions(
+        out_dir, **paths, sources=raw_csvs, bands_path=tmp_path / "bands.json"
+    )
+    app_data = load_app_data(tmp_path / "snapshot.arrow", **paths, sources=raw_csvs)
+    expected = load_dashboard_data()
+
+    assert app_data.from_snapshot
+    assert app_data.arrow is not None
+    pd.testing.assert_frame_equal(
+        _sorted_by_id(app_data.frame[expected.columns]),
+        _sorted_by_id(expected),
+    )
+    assert load_band_edges(tmp_path / "bands.json") == manifest["band_edges"]
+    summary = summarize_dataset(expected)
+    assert meta["summary"]["filter_choices"] == summary["filter_choices"]
+    assert meta["summary"]["baselines"] == pytest.approx(summary["baselines"])